@@ -0,0 +1,143 @@
+"""Checks and sends the actions of our units against a snapshot of the turn
+instead of asking the game before every action. The snapshot holds which of
+our units can move or attack and which locations are occupied. It is taken
+once at the start of the turn and kept up to date with our own moves, so two
+of our units never try to move into the same location.
+
+Actions are sent to the game right away, so the trees see their result in
+the same tick, like a unit attacking from where it just moved to. Units that
+are not in the snapshot, like the ones built this turn, are checked by the
+game as before.
+"""
+
+import battlecode as bc
+
+# A unit can move or attack while its heat is below this.
+MAX_READY_HEAT = 10
+# Occupancy of a location taken this turn by a unit we have no id for yet.
+OCCUPIED = -2
+
+OFFSETS = {direction: (direction.dx(), direction.dy()) for direction in bc.Direction}
+
+
+class Actions:
+    __instance = None
+
+    def setTerrain(self, passable):
+        """Takes the passable terrain of the planet, indexed [x][y]."""
+        self.passable = passable
+        self.width = len(passable)
+        self.height = len(passable[0])
+
+    def update(self, gc, units, visible_units):
+        """Takes the snapshot of the turn from the unit records of our units
+        and the units visible to them.
+        """
+        self.gc = gc
+        self.occupancy = gc.occupancy_grid(visible_units)
+        self.positions = {}
+        self.move_ready = set()
+        self.attack_ready = set()
+        for unit in units:
+            if unit.location_kind != bc.LOCATION_ON_MAP:
+                continue
+            self.positions[unit.id] = (unit.x, unit.y)
+            if unit.movement_heat < MAX_READY_HEAT:
+                self.move_ready.add(unit.id)
+            if unit.attack_heat < MAX_READY_HEAT:
+                self.attack_ready.add(unit.id)
+
+    def position(self, unit_id):
+        """Gets the (x, y) of one of our units, if it is in the snapshot."""
+        return self.positions.get(unit_id)
+
+    def adjacent(self, unit_id, direction):
+        """Gets the (x, y) of the location next to a unit in the snapshot, or
+        None if it is off the map.
+        """
+        x, y = self.positions[unit_id]
+        dx, dy = OFFSETS[direction]
+        x += dx
+        y += dy
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return x, y
+        return None
+
+    def isOccupiable(self, unit_id, direction):
+        """Determines if the location next to a unit is passable and empty.
+        Units that are not in the snapshot are left for the game to check.
+        """
+        if unit_id not in self.positions:
+            return True
+        location = self.adjacent(unit_id, direction)
+        if location is None:
+            return False
+        x, y = location
+        return self.passable[x][y] and self.occupancy[x][y] == -1
+
+    def isMoveReady(self, unit_id):
+        if unit_id not in self.positions:
+            return self.gc.is_move_ready(unit_id)
+        return unit_id in self.move_ready
+
+    def canMove(self, unit_id, direction):
+        if unit_id not in self.positions:
+            return self.gc.can_move(unit_id, direction)
+        return self.isOccupiable(unit_id, direction)
+
+    def move(self, unit_id, direction):
+        """Moves a unit and updates the snapshot with the move."""
+        self.gc.move_robot(unit_id, direction)
+        if unit_id not in self.positions:
+            return
+        x, y = self.positions[unit_id]
+        self.occupancy[x][y] = -1
+        x, y = self.adjacent(unit_id, direction)
+        self.occupancy[x][y] = unit_id
+        self.positions[unit_id] = (x, y)
+        self.move_ready.discard(unit_id)
+
+    def isAttackReady(self, unit_id):
+        if unit_id not in self.positions:
+            return self.gc.is_attack_ready(unit_id)
+        return unit_id in self.attack_ready
+
+    def attack(self, unit_id, target_id):
+        """Attacks right away, as the trees look for the target afterwards to
+        see if it died.
+        """
+        self.gc.attack(unit_id, target_id)
+        self.attack_ready.discard(unit_id)
+
+    def occupy(self, unit_id, direction):
+        """Marks the location next to a unit as taken by a unit it placed
+        there, like a blueprint or a replicated or unloaded unit.
+        """
+        if unit_id not in self.positions:
+            return
+        location = self.adjacent(unit_id, direction)
+        if location is not None:
+            x, y = location
+            self.occupancy[x][y] = OCCUPIED
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if Actions.__instance == None:
+            Actions()
+        return Actions.__instance
+
+    def __init__(self):
+        """ Virtually private constructor. """
+        if Actions.__instance != None:
+            raise Exception("This class is a Singleton!")
+        else:
+            Actions.__instance = self
+            self.gc = None
+            self.passable = []
+            self.width = 0
+            self.height = 0
+            self.occupancy = []
+            self.positions = {}
+            self.move_ready = set()
+            self.attack_ready = set()
@@ -3,7 +3,9 @@ import sys
 import math
 
 
-directions = [dir for dir in bc.Direction if dir is not bc.Direction.Center]
+# Positions are plain (x, y) tuples while searching, and only the final path
+# is converted into MapLocations.
+offsets = [(dir.dx(), dir.dy()) for dir in bc.Direction if dir is not bc.Direction.Center]
 
 
 class Node():
@@ -18,21 +20,28 @@ class Node():
         self.f = 0
 
     def __eq__(self, other):
-        return ((self.position.x == other.position.x) and (self.position.y == other.position.y))
+        return self.position == other.position
 
 
-def astar(maze,friendly_units, start, end, max_path_length=math.inf):
+def astar(maze,friendly_units, start, end, max_path_length=math.inf, components=None):
     """Returns a list of tuples as a path from the given start to the given end in the given maze"""
+    # Different terrain components are never connected, no need to search
+    if components and components[start.x][start.y] != components[end.x][end.y]:
+        return []
+
+    planet = start.planet
+
     # Create start and end node
-    start_node = Node(None, start)
+    start_node = Node(None, (start.x, start.y))
     start_node.g = start_node.h = start_node.f = 0
-    end_node = Node(None, end)
+    end_node = Node(None, (end.x, end.y))
     end_node.g = end_node.h = end_node.f = 0
+    end_x, end_y = end_node.position
 
 
     # Initialize both open and closed list
     open_list = []
-    closed_list = []
+    closed_list = set()
 
     # Add the start node
     open_list.append(start_node)
@@ -51,39 +60,41 @@ def astar(maze,friendly_units, start, end, max_path_length=math.inf):
 
         # Pop current off open list, add to closed list
         open_list.pop(current_index)
-        closed_list.append(current_node)
+        closed_list.add(current_node.position)
 
         # Found the goal
         if current_node == end_node or current_node.g > max_path_length :
             path = []
             current = current_node
             while current is not None:
-                path.append(current.position)
+                x, y = current.position
+                path.append(bc.MapLocation(planet, x, y))
                 current = current.parent
             return path[::-1] # Return reversed path
 
         # Generate children
-        for dir in directions: # Adjacent squares
+        current_x, current_y = current_node.position
+        for dx, dy in offsets: # Adjacent squares
 
             # Get node position
-            node_position = current_node.position.add(dir)
+            x = current_x + dx
+            y = current_y + dy
 
             # Make sure within range
-            if node_position.x > (len(maze) - 1) or node_position.x < 0 or node_position.y > (len(maze[len(maze)-1]) -1) or node_position.y < 0:
+            if x > (len(maze) - 1) or x < 0 or y > (len(maze[len(maze)-1]) -1) or y < 0:
                 continue
 
             # Make sure walkable terrain
-            if not maze[node_position.x][node_position.y] or friendly_units[node_position.x][node_position.y]:
+            if not maze[x][y] or friendly_units[x][y]:
                 continue
 
             # Create new node
-            new_node = Node(current_node, node_position)
-
-            if new_node in closed_list:
+            if (x, y) in closed_list:
                 continue
+            new_node = Node(current_node, (x, y))
 
             new_node.g = current_node.g + 1
-            new_node.h = ((new_node.position.x - end_node.position.x) ** 2) + ((new_node.position.y - end_node.position.y) ** 2)
+            new_node.h = ((x - end_x) ** 2) + ((y - end_y) ** 2)
             new_node.f = new_node.g + new_node.h
 
             found_node = False
@@ -0,0 +1,85 @@
+"""Precomputes the map analysis cache for every map in a directory, so that
+games on those maps skip the analysis at startup.
+
+Run from the player directory with the battlecode library on the path:
+    PYTHONPATH=../battlecode/python python3 build_map_cache.py [map_directory]
+"""
+
+import argparse
+import os
+import time
+import battlecode as bc
+import map_analysis
+import mars_analysis
+
+map_extension = ".bc18map"
+map_extension_text = ".bc18t"
+
+
+def load_game_map(path):
+    with open(path) as f:
+        contents = f.read()
+    if path.endswith(map_extension):
+        return bc.GameMap.from_json(contents)
+    return bc.GameMap.parse_text_map(contents)
+
+
+def analyse_game_map(game_map):
+    """Analyses the Earth map of a game for both teams and stores the result."""
+    earth_map = game_map.earth_map
+    karbonite_map, terrain_map = map_analysis.read_grids(earth_map)
+    initial_units = map_analysis.initial_unit_positions(earth_map)
+    key = map_analysis.map_key(terrain_map, karbonite_map, initial_units)
+
+    analyses = {}
+    for team in (bc.Team.Red, bc.Team.Blue):
+        my_locations = []
+        enemy_locations = []
+        for unit_team, x, y in initial_units:
+            location = bc.MapLocation(bc.Planet.Earth, x, y)
+            if unit_team == team:
+                my_locations.append(location)
+            else:
+                enemy_locations.append(location)
+        analyses[team] = map_analysis.analyse(terrain_map, my_locations, enemy_locations)
+
+    map_analysis.save(key, analyses)
+    return key
+
+
+def analyse_mars_map(game_map):
+    """Analyses the Mars map and asteroid pattern of a game and stores the result."""
+    karbonite_map, terrain_map = map_analysis.read_grids(game_map.mars_map)
+    pattern = mars_analysis.read_pattern(game_map.asteroids)
+    key = mars_analysis.mars_key(terrain_map, karbonite_map, pattern)
+    strikes = mars_analysis.read_strikes(pattern)
+    mars_analysis.save(key, mars_analysis.analyse(terrain_map, karbonite_map, strikes))
+    return key
+
+
+def main():
+    file_dir = os.path.dirname(os.path.realpath(__file__))
+    parser = argparse.ArgumentParser(description='Precompute the map analysis cache')
+    parser.add_argument('map_directory', nargs='?', default=os.path.join(file_dir, '..', 'battlecode-maps'),
+                        help="Directory containing the maps (default: %(default)s)")
+    args = parser.parse_args()
+
+    maps = sorted(o for o in os.listdir(args.map_directory) if o.endswith(map_extension) or o.endswith(map_extension_text))
+    games = [(name, lambda name=name: load_game_map(os.path.join(args.map_directory, name))) for name in maps]
+    # The manager falls back to this map when it cannot find the requested one.
+    games.append(('testmap', bc.GameMap.test_map))
+
+    for name, load in games:
+        start = time.time()
+        try:
+            game_map = load()
+            key = analyse_game_map(game_map)
+            mars_key = analyse_mars_map(game_map)
+        except Exception as e:
+            print('Failed to analyse {}: {}'.format(name, e))
+            continue
+        print('{} -> {}, mars {} ({:.1f}s)'.format(name, key, mars_key, time.time() - start))
+
+
+if __name__ == '__main__':
+    main()
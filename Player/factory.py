@@ -3,6 +3,7 @@ import behaviour_tree as bt
 import random
 import strategy
 import units
+import rocket_planner
 from worker import Worker
 from knight import Knight
 from healer import Healer
@@ -12,6 +13,8 @@ from mage import Mage
 
 class Factory(units.Unit):
     """The container for the factory unit."""
+    unit_type = bc.UnitType.Factory
+
     def __init__(self, unit, gc, maps, my_units):
         super().__init__(unit, gc)
         self._maps = maps
@@ -76,6 +79,7 @@ class Factory(units.Unit):
                 direction = random.choice(list(bc.Direction))
                 if self.__outer._gc.can_unload(factory.id, direction):
                     self.__outer._gc.unload(factory.id, direction)
+                    self.__outer._actions.occupy(factory.id, direction)
 
                     location = factory.location.map_location().add(direction)
                     unit = self.__outer._gc.sense_unit_at_location(location)
@@ -136,7 +140,8 @@ class Factory(units.Unit):
             self.__outer = outer
 
         def condition(self):
-            return self.__outer._gc.karbonite() >= bc.UnitType.Worker.factory_cost()
+            reserved = rocket_planner.RocketPlanner.getInstance().reservedKarbonite()
+            return self.__outer._gc.karbonite() - reserved >= bc.UnitType.Worker.factory_cost()
 
     class BuildWorker(bt.Action):
         """Builds a worker."""
@@ -164,7 +169,8 @@ class Factory(units.Unit):
             self.__outer = outer
 
         def condition(self):
-            return self.__outer._gc.karbonite() >= bc.UnitType.Knight.factory_cost()
+            reserved = rocket_planner.RocketPlanner.getInstance().reservedKarbonite()
+            return self.__outer._gc.karbonite() - reserved >= bc.UnitType.Knight.factory_cost()
 
     class DamagedUnits(bt.Condition):
         """Check if damaged units are nearby."""
@@ -4,9 +4,12 @@ import random
 import units
 import math
 import astar
+import map_analysis
 
 class Healer(units.Unit):
     """The container for the healer unit."""
+    unit_type = bc.UnitType.Healer
+
     def __init__(self, unit, gc, maps):
         super().__init__(unit, gc)
         self._maps = maps
@@ -38,6 +41,13 @@ class Healer(units.Unit):
         # Random movement
         move_randomly = self.MoveRandomly(self)
         tree.add_child(exist_injured_friend_sequence)
+
+        # Board the rocket assigned by the planner
+        board = bt.Sequence()
+        board.add_child(self.AssignedToRocket(self))
+        board.add_child(self.MoveToRocket(self))
+        tree.add_child(board)
+
         tree.add_child(move_randomly)
 
         return tree
@@ -68,7 +78,7 @@ class Healer(units.Unit):
         def condition(self):
             healer = self.__outer.unit()
             location = healer.location.map_location()
-            nearby = self.__outer._gc.sense_nearby_units_by_team(location, healer.attack_range(), self.__outer._gc.team())
+            nearby = self.__outer._gc.sense_nearby_units_by_team(location, self.__outer.properties().attack_range, self.__outer._gc.team())
             for unit in nearby:
                 if unit.unit_type != bc.UnitType.Factory and unit.id != healer.id and unit.health < unit.max_health:
                     return True
@@ -84,7 +94,7 @@ class Healer(units.Unit):
         def action(self):
             healer = self.__outer.unit()
             location = healer.location.map_location()
-            nearby = self.__outer._gc.sense_nearby_units_by_team(location, healer.attack_range(), self.__outer._gc.team())
+            nearby = self.__outer._gc.sense_nearby_units_by_team(location, self.__outer.properties().attack_range, self.__outer._gc.team())
             lowest_health_percentage = 1
             highest_prio_unit = None
             for unit in nearby:
@@ -137,6 +147,7 @@ class Healer(units.Unit):
             healer = self.__outer.unit()
             healer_location = healer.location.map_location()
             my_units_map = self.__outer._maps['my_units_map']
+            component_map = self.__outer._maps['component_map']
             width = len(my_units_map)
             height = len(my_units_map[0])
 
@@ -145,6 +156,9 @@ class Healer(units.Unit):
             for unit in units:
                 if not unit.location.is_on_map():
                     continue
+                # No path leads to a friend on another component
+                if not map_analysis.is_reachable(component_map, healer_location, unit.location.map_location()):
+                    continue
                 if unit.unit_type != bc.UnitType.Factory and unit.id != healer.id and unit.health < unit.max_health:
                     current_distance = healer_location.distance_squared_to(unit.location.map_location())
                     if current_distance < min_distance:
@@ -154,7 +168,7 @@ class Healer(units.Unit):
             if min_unit_id:
                 unit_to_follow = self.__outer.get_friendly_unit(min_unit_id)
                 unit_to_follow_location = unit_to_follow.location.map_location()
-                unit_range = math.floor(math.sqrt(healer.attack_range() / 2))
+                unit_range = math.floor(math.sqrt(self.__outer.properties().attack_range / 2))
                 position_found = False
                 while not position_found:
                     for x in range(-unit_range , unit_range  + 1):
@@ -185,7 +199,8 @@ class Healer(units.Unit):
             healer = self.__outer.unit()
             terrain_map = self.__outer._maps['terrain_map']
             my_units_map = self.__outer._maps['my_units_map']
-            path = astar.astar(terrain_map, my_units_map, healer.location.map_location(), location, max_path_length=10)
+            component_map = self.__outer._maps['component_map']
+            path = astar.astar(terrain_map, my_units_map, healer.location.map_location(), location, max_path_length=10, components=component_map)
             if len(path) > 0:
                 path.pop(0) # Remove the point the unit is already on.
                 self.__outer._path_to_follow = path
@@ -206,10 +221,10 @@ class Healer(units.Unit):
             healer = self.__outer.unit()
             unit_map_location = healer.location.map_location()
             move_direction = unit_map_location.direction_to(next_point)
-            if self.__outer._gc.can_move(healer.id, move_direction):
+            if self.__outer._actions.canMove(healer.id, move_direction):
                 self._status = bt.Status.RUNNING
-                if self.__outer._gc.is_move_ready(healer.id):
-                    self.__outer._gc.move_robot(healer.id, move_direction)
+                if self.__outer._actions.isMoveReady(healer.id):
+                    self.__outer._actions.move(healer.id, move_direction)
                     self.__outer._path_to_follow.pop(0)
                     if len(self.__outer._path_to_follow) == 1:
                         self.__outer._path_to_follow = None
@@ -231,8 +246,8 @@ class Healer(units.Unit):
         def action(self):
             random_dir = random.choice(list(bc.Direction))
             healer = self.__outer.unit()
-            if self.__outer._gc.is_move_ready(healer.id) and self.__outer._gc.can_move(healer.id, random_dir):
-                self.__outer._gc.move_robot(healer.id, random_dir)
+            if self.__outer._actions.isMoveReady(healer.id) and self.__outer._actions.canMove(healer.id, random_dir):
+                self.__outer._actions.move(healer.id, random_dir)
                 self._status = bt.Status.SUCCESS
             else:
                 self._status = bt.Status.FAIL
@@ -4,11 +4,14 @@ import random
 import units
 import math
 import astar
+import map_analysis
 import strategy
 
 
 class Knight(units.Unit):
     """The container for the knight unit."""
+    unit_type = bc.UnitType.Knight
+
     def __init__(self, unit, gc, maps):
         super().__init__(unit, gc)
         self._targeted_enemy = None
@@ -46,6 +49,12 @@ class Knight(units.Unit):
         enemy_handling.add_child(enemy_fallback)
         tree.add_child(enemy_handling)
 
+        # Board the rocket assigned by the planner
+        board = bt.Sequence()
+        board.add_child(self.AssignedToRocket(self))
+        board.add_child(self.MoveToRocket(self))
+        tree.add_child(board)
+
         move_fallback = bt.FallBack()
         move_sequence = bt.Sequence()
         move_sequence.add_child(self.OffensiveStrategy(self))
@@ -70,7 +79,7 @@ class Knight(units.Unit):
 
         def condition(self):
             knight = self.__outer.unit()
-            range = knight.vision_range
+            range = self.__outer.properties().vision_range
             location = knight.location.map_location()
             team = knight.team
             enemy_team = bc.Team.Red if team == bc.Team.Blue else bc.Team.Blue
@@ -121,8 +130,8 @@ class Knight(units.Unit):
             if not enemy:
                 self._status = bt.Status.FAIL
             else:
-                if self.__outer._gc.is_attack_ready(knight.id) and self.__outer._gc.can_attack(knight.id, enemy.id):
-                    self.__outer._gc.attack(knight.id, enemy.id)
+                if self.__outer._actions.isAttackReady(knight.id) and self.__outer._gc.can_attack(knight.id, enemy.id):
+                    self.__outer._actions.attack(knight.id, enemy.id)
                     self._status = bt.Status.SUCCESS
 
                      # Remove enemy from enemy_units_map if it died
@@ -157,7 +166,7 @@ class Knight(units.Unit):
                 return False
 
             distance = knight.location.map_location().distance_squared_to(enemy.location.map_location())
-            return distance <= knight.ability_range()
+            return distance <= self.__outer.properties().ability_range
 
 
     class Javelin(bt.Action):
@@ -182,7 +191,7 @@ class Knight(units.Unit):
                     location = knight.location.map_location()
                     enemy_team = bc.Team.Red if knight.team == bc.Team.Blue else bc.Team.Blue
                     killed_enemy = True
-                    nearby_units = self.__outer._gc.sense_nearby_units_by_team(location, knight.ability_range(), enemy_team)
+                    nearby_units = self.__outer._gc.sense_nearby_units_by_team(location, self.__outer.properties().ability_range, enemy_team)
                     for nearby_unit in nearby_units:
                         if nearby_unit.id == enemy.id:
                             killed_enemy = False
@@ -208,8 +217,8 @@ class Knight(units.Unit):
                 self._status = bt.Status.FAIL
             else:
                 enemy_direction = knight.location.map_location().direction_to(enemy.location.map_location())
-                if self.__outer._gc.is_move_ready(knight.id) and self.__outer._gc.can_move(knight.id, enemy_direction):
-                    self.__outer._gc.move_robot(knight.id, enemy_direction)
+                if self.__outer._actions.isMoveReady(knight.id) and self.__outer._actions.canMove(knight.id, enemy_direction):
+                    self.__outer._actions.move(knight.id, enemy_direction)
                     self._status = bt.Status.SUCCESS
                 else:
                     self._status = bt.Status.FAIL
@@ -233,6 +242,7 @@ class Knight(units.Unit):
             knight = self.__outer.unit()
             knight_location = knight.location.map_location()
             enemies_map = self.__outer._maps['enemy_units_map']
+            component_map = self.__outer._maps['component_map']
 
             min_distance = math.inf
             closest_unit_location = None
@@ -240,10 +250,13 @@ class Knight(units.Unit):
                 for y in range(len(enemies_map[0])):
                     enemy = enemies_map[x][y]
                     if enemy:
+                        # No path leads to an enemy on another component
+                        if not map_analysis.is_reachable(component_map, knight_location, enemy.location.map_location()):
+                            continue
                         current_distance = knight_location.distance_squared_to(enemy.location.map_location())
 
                         # check just in case enemy desingregated its unit or we failed to attack for any reason
-                        if current_distance < knight.vision_range:
+                        if current_distance < self.__outer.properties().vision_range:
                             continue
                         if current_distance < min_distance:
                             min_distance = current_distance
@@ -267,7 +280,8 @@ class Knight(units.Unit):
             knight = self.__outer.unit()
             terrain_map = self.__outer._maps['terrain_map']
             my_units_map = self.__outer._maps['my_units_map']
-            path = astar.astar(terrain_map, my_units_map, knight.location.map_location(), location, max_path_length=5)
+            component_map = self.__outer._maps['component_map']
+            path = astar.astar(terrain_map, my_units_map, knight.location.map_location(), location, max_path_length=5, components=component_map)
 
             if len(path) > 0:
                 path.pop(0) # Remove the point the unit is already on.
@@ -288,10 +302,10 @@ class Knight(units.Unit):
             knight = self.__outer.unit()
             unit_map_location = knight.location.map_location()
             move_direction = unit_map_location.direction_to(next_point)
-            if self.__outer._gc.can_move(knight.id, move_direction):
+            if self.__outer._actions.canMove(knight.id, move_direction):
                 self._status = bt.Status.RUNNING
-                if self.__outer._gc.is_move_ready(knight.id):
-                    self.__outer._gc.move_robot(knight.id, move_direction)
+                if self.__outer._actions.isMoveReady(knight.id):
+                    self.__outer._actions.move(knight.id, move_direction)
                     self.__outer._path_to_follow.pop(0)
                     if len(self.__outer._path_to_follow) == 1:
                         self.__outer._path_to_follow = None
@@ -314,8 +328,8 @@ class Knight(units.Unit):
         def action(self):
             random_dir = random.choice(list(bc.Direction))
             knight = self.__outer.unit()
-            if self.__outer._gc.is_move_ready(knight.id) and self.__outer._gc.can_move(knight.id, random_dir):
-                self.__outer._gc.move_robot(knight.id, random_dir)
+            if self.__outer._actions.isMoveReady(knight.id) and self.__outer._actions.canMove(knight.id, random_dir):
+                self.__outer._actions.move(knight.id, random_dir)
                 self._status = bt.Status.SUCCESS
             else:
                 self._status = bt.Status.FAIL
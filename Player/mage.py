@@ -4,11 +4,14 @@ import random
 import units
 import math
 import astar
+import map_analysis
 import strategy
 
 
 class Mage(units.Unit):
     """The container for the mage unit."""
+    unit_type = bc.UnitType.Mage
+
     def __init__(self, unit, gc, maps):
         super().__init__(unit, gc)
         self._targeted_enemy = None
@@ -40,6 +43,13 @@ class Mage(units.Unit):
         enemies_not_visible_sequence.add_child(enemy_visible_sequence)
 
         tree.add_child(enemy_visible_sequence)
+
+        # Board the rocket assigned by the planner
+        board = bt.Sequence()
+        board.add_child(self.AssignedToRocket(self))
+        board.add_child(self.MoveToRocket(self))
+        tree.add_child(board)
+
         tree.add_child(enemies_not_visible_sequence)
 
         return tree
@@ -56,7 +66,7 @@ class Mage(units.Unit):
 
         def condition(self):
             mage = self.__outer.unit()
-            range = mage.vision_range
+            range = self.__outer.properties().vision_range
             location = mage.location.map_location()
             my_team = mage.team
             enemy_team = bc.Team.Red if my_team == bc.Team.Blue else bc.Team.Blue
@@ -73,7 +83,7 @@ class Mage(units.Unit):
 
         def action(self):
             mage = self.__outer.unit()
-            range = mage.vision_range
+            range = self.__outer.properties().vision_range
             location = mage.location.map_location()
             my_team = mage.team
             enemy_team = bc.Team.Red if my_team == bc.Team.Blue else bc.Team.Blue
@@ -82,23 +92,30 @@ class Mage(units.Unit):
             best_target_id = None
             best_target_hp = math.inf
             best_target_nr_enemies = 0
+            planet = location.planet
             nearby_enemy_units = self.__outer._gc.sense_nearby_units_by_team(location, range, enemy_team)
             for enemy in nearby_enemy_units:
                 current_target_nr_enemies = 0
                 current_target_hp = 0
                 enemy_location = enemy.location.map_location()
+                enemy_x = enemy_location.x
+                enemy_y = enemy_location.y
 
                 # Get the amount of enemies adjacent to this one.
-                for dir in list(bc.Direction):
-                    adjacent_location = enemy_location.add(dir)
-                    if adjacent_location.x < 0 or adjacent_location.x >= len(my_units_map) or adjacent_location.y < 0 or adjacent_location.y >= len(my_units_map[0]):
-                        continue
-                    if self.__outer._gc.has_unit_at_location(adjacent_location) and not my_units_map[adjacent_location.x][adjacent_location.y]:
-                        current_target_nr_enemies += 1
-                        current_target_hp += self.__outer._gc.sense_unit_at_location(adjacent_location).health
-                    elif self.__outer._gc.has_unit_at_location(adjacent_location) and my_units_map[adjacent_location.x][adjacent_location.y]:
-                        current_target_nr_enemies -= 1
-                        current_target_hp += 2*self.__outer._gc.sense_unit_at_location(adjacent_location).health
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        x = enemy_x + dx
+                        y = enemy_y + dy
+                        if x < 0 or x >= len(my_units_map) or y < 0 or y >= len(my_units_map[0]):
+                            continue
+                        if not self.__outer._gc.has_unit_at_xy(planet, x, y):
+                            continue
+                        if not my_units_map[x][y]:
+                            current_target_nr_enemies += 1
+                            current_target_hp += self.__outer._gc.sense_unit_at_xy(planet, x, y).health
+                        else:
+                            current_target_nr_enemies -= 1
+                            current_target_hp += 2*self.__outer._gc.sense_unit_at_xy(planet, x, y).health
 
                 # Update best target if more enemies were found.
                 if current_target_nr_enemies > best_target_nr_enemies:
@@ -134,8 +151,8 @@ class Mage(units.Unit):
             if not enemy:
                 self._status = bt.Status.FAIL
             else:
-                if self.__outer._gc.is_attack_ready(mage.id) and self.__outer._gc.can_attack(mage.id, enemy.id):
-                    self.__outer._gc.attack(mage.id, enemy.id)
+                if self.__outer._actions.isAttackReady(mage.id) and self.__outer._gc.can_attack(mage.id, enemy.id):
+                    self.__outer._actions.attack(mage.id, enemy.id)
                     self._status = bt.Status.SUCCESS
 
                      # Remove enemy from enemy_units_map if it died
@@ -172,6 +189,7 @@ class Mage(units.Unit):
             mage = self.__outer.unit()
             mage_location = mage.location.map_location()
             enemies_map = self.__outer._maps['enemy_units_map']
+            component_map = self.__outer._maps['component_map']
 
             min_distance = math.inf
             closest_unit_location = None
@@ -179,10 +197,13 @@ class Mage(units.Unit):
                 for y in range(len(enemies_map[0])):
                     enemy = enemies_map[x][y]
                     if enemy:
+                        # No path leads to an enemy on another component
+                        if not map_analysis.is_reachable(component_map, mage_location, enemy.location.map_location()):
+                            continue
                         current_distance = mage_location.distance_squared_to(enemy.location.map_location())
 
                         # check just in case enemy desingregated its unit or we failed to attack for any reason
-                        if current_distance < mage.vision_range:
+                        if current_distance < self.__outer.properties().vision_range:
                             continue
                         if current_distance < min_distance:
                             min_distance = current_distance
@@ -206,7 +227,8 @@ class Mage(units.Unit):
             mage = self.__outer.unit()
             terrain_map = self.__outer._maps['terrain_map']
             my_units_map = self.__outer._maps['my_units_map']
-            path = astar.astar(terrain_map, my_units_map, mage.location.map_location(), location, max_path_length=5)
+            component_map = self.__outer._maps['component_map']
+            path = astar.astar(terrain_map, my_units_map, mage.location.map_location(), location, max_path_length=5, components=component_map)
 
             if len(path) > 0:
                 path.pop(0) # Remove the point the unit is already on.
@@ -227,10 +249,10 @@ class Mage(units.Unit):
             mage = self.__outer.unit()
             unit_map_location = mage.location.map_location()
             move_direction = unit_map_location.direction_to(next_point)
-            if self.__outer._gc.can_move(mage.id, move_direction):
+            if self.__outer._actions.canMove(mage.id, move_direction):
                 self._status = bt.Status.RUNNING
-                if self.__outer._gc.is_move_ready(mage.id):
-                    self.__outer._gc.move_robot(mage.id, move_direction)
+                if self.__outer._actions.isMoveReady(mage.id):
+                    self.__outer._actions.move(mage.id, move_direction)
                     self.__outer._path_to_follow.pop(0)
                     if len(self.__outer._path_to_follow) == 1:
                         self.__outer._path_to_follow = None
@@ -252,8 +274,8 @@ class Mage(units.Unit):
         def action(self):
             random_dir = random.choice(list(bc.Direction))
             mage = self.__outer.unit()
-            if self.__outer._gc.is_move_ready(mage.id) and self.__outer._gc.can_move(mage.id, random_dir):
-                self.__outer._gc.move_robot(mage.id, random_dir)
+            if self.__outer._actions.isMoveReady(mage.id) and self.__outer._actions.canMove(mage.id, random_dir):
+                self.__outer._actions.move(mage.id, random_dir)
                 self._status = bt.Status.SUCCESS
             else:
                 self._status = bt.Status.FAIL
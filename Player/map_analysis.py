@@ -0,0 +1,318 @@
+"""Static analysis of the starting Earth map. The analysis only depends on the
+map itself, so it is computed offline by build_map_cache.py and loaded from
+disk at the start of a game.
+"""
+
+import hashlib
+import json
+import os
+import astar
+import terrain
+from collections import deque
+
+CACHE_VERSION = 5
+CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'map_cache')
+
+
+def read_grids(planet_map):
+    """Returns the karbonite and terrain grids of a planet map, indexed [x][y]."""
+    return planet_map.initial_karbonite_grid(), planet_map.passable_grid()
+
+
+def initial_unit_positions(planet_map):
+    """Returns (team, x, y) for every initial unit of a planet map."""
+    positions = []
+    for unit in planet_map.initial_units:
+        location = unit.location.map_location()
+        positions.append((unit.team, location.x, location.y))
+    return positions
+
+
+def map_key(terrain_map, karbonite_map, initial_units):
+    """Returns a hash identifying a starting map by its terrain, karbonite and
+    initial unit positions.
+    """
+    digest = hashlib.sha1()
+    digest.update('{}x{}'.format(len(terrain_map), len(terrain_map[0])).encode())
+    for x in range(len(terrain_map)):
+        digest.update(bytes(1 if passable else 0 for passable in terrain_map[x]))
+        digest.update(','.join(str(karbonite) for karbonite in karbonite_map[x]).encode())
+    for team, x, y in sorted((int(team), x, y) for team, x, y in initial_units):
+        digest.update('{}:{}:{};'.format(team, x, y).encode())
+    return digest.hexdigest()
+
+
+def label_components(terrain_map):
+    """Labels the 8-connected regions of passable terrain. Returns a grid of
+    component ids, indexed [x][y], with -1 for impassable cells.
+    """
+    width = len(terrain_map)
+    height = len(terrain_map[0])
+    passable = [terrain_map[x][y] for x in range(width) for y in range(height)]
+    labels = [-1] * (width*height)
+
+    next_label = 0
+    for start in range(width*height):
+        if not passable[start] or labels[start] != -1:
+            continue
+        labels[start] = next_label
+        queue = deque([start])
+        while queue:
+            x, y = divmod(queue.popleft(), height)
+            for dx, dy in terrain.NEIGHBOUR_OFFSETS:
+                adjacent_x = x + dx
+                adjacent_y = y + dy
+                if adjacent_x < 0 or adjacent_x >= width or adjacent_y < 0 or adjacent_y >= height:
+                    continue
+                adjacent = adjacent_x*height + adjacent_y
+                if passable[adjacent] and labels[adjacent] == -1:
+                    labels[adjacent] = next_label
+                    queue.append(adjacent)
+        next_label += 1
+
+    return [labels[x*height:(x+1)*height] for x in range(width)]
+
+
+def reachable_mask(component_map, start_locations):
+    """Returns a grid marking every cell reachable from one of the start locations."""
+    start_components = set(component_map[location.x][location.y] for location in start_locations)
+    start_components.discard(-1)
+    return [[component in start_components for component in column] for column in component_map]
+
+
+def is_reachable(component_map, location, other):
+    """Whether a unit at one location could walk to the other, ignoring units."""
+    component = component_map[location.x][location.y]
+    return component != -1 and component == component_map[other.x][other.y]
+
+
+def is_narrow_point(terrain_map, x, y):
+    """Whether a cell has less than two free cells beside it along either
+    axis, counting at most three cells each way.
+    """
+    width = len(terrain_map)
+    height = len(terrain_map[0])
+    free = []
+    for dx, dy in ((0, 1), (0, -1), (-1, 0), (1, 0)):
+        count = 3
+        for i in range(1, 4):
+            adjacent_x = x + dx*i
+            adjacent_y = y + dy*i
+            if adjacent_x < 0 or adjacent_x >= width or adjacent_y < 0 or adjacent_y >= height or not terrain_map[adjacent_x][adjacent_y]:
+                count = i - 1
+                break
+        free.append(count)
+    up_free, down_free, left_free, right_free = free
+    return (up_free + down_free) < 2 or (left_free + right_free) < 2
+
+
+def find_choke_points(terrain_map, component_map, my_locations, enemy_locations):
+    """Returns the narrow points on the paths between our and the enemy's
+    starting units, and the length of each of those paths.
+    """
+    no_units_map = [[None]*len(terrain_map[0]) for i in range(len(terrain_map))]
+
+    paths = []
+    for my_location in my_locations:
+        for enemy_location in enemy_locations:
+            astar_path = astar.astar(terrain_map, no_units_map, my_location, enemy_location, components=component_map)
+            if len(astar_path) > 0:
+                paths.append(astar_path)
+
+    choke_points = []
+    seen = set()
+    for path in paths:
+        for location in path:
+            point = (location.x, location.y)
+            if point not in seen and is_narrow_point(terrain_map, location.x, location.y):
+                seen.add(point)
+                choke_points.append(point)
+
+    return choke_points, [len(path) for path in paths]
+
+
+def strategy_profile(terrain_map, choke_points, average_path_length):
+    """Chooses the battle strategy and unit limits for the map. The choke
+    points are the narrow cells on the paths between the starting units.
+    """
+    width = len(terrain_map)
+    height = len(terrain_map[0])
+    map_area = width*height
+
+    nr_impassable = 0
+    for x in range(width):
+        for y in range(height):
+            if not terrain_map[x][y]:
+                nr_impassable += 1
+
+    impassable_per = 100 *nr_impassable / map_area
+
+    profile = {
+        'battle_strategy': 'Offensive',
+        'enemy_start_close': False,
+        'min_units_offense': None,
+        'max_units': None
+    }
+
+    if average_path_length == 0:
+        # no path between inital units, spam rangers (only mirror)
+        profile['max_units'] = {
+            'worker': 2,
+            'factory': 2,
+            'knight': 1,
+            'mage': 1,
+            'ranger': 50,
+            'healer': 10
+        }
+    elif average_path_length < 5:
+        profile['enemy_start_close'] = True
+        # play aggresive from start with regular unnits
+        profile['max_units'] = {
+            'worker': 1,
+            'factory': 2,
+            'knight': 75,
+            'mage': 5,
+            'ranger': 15,
+            'healer': 5
+        }
+    elif len(choke_points) > 5:
+        # A lot of choke points, we need more rangers
+        if map_area >= 800 and impassable_per > 20:
+            # play Defensive
+            profile['battle_strategy'] = 'Deffensive'
+            profile['max_units'] = {
+                'worker': 3,
+                'factory': 5,
+                'knight': 5,
+                'mage': 10,
+                'ranger': 75,
+                'healer': 10
+            }
+        elif map_area < 800:
+            # play aggresive with less factories
+            profile['max_units'] = {
+                'worker': 3,
+                'factory': 3,
+                'knight': 10,
+                'mage': 10,
+                'ranger': 30,
+                'healer': 5
+            }
+        else:
+            # play aggresive
+            profile['max_units'] = {
+                'worker': 3,
+                'factory': 5,
+                'knight': 5,
+                'mage': 20,
+                'ranger': 30,
+                'healer': 5
+            }
+    elif len(choke_points) > 1:
+        # There are some choke points, we need some more  rangers
+        if map_area >= 800 and average_path_length > 50:
+            # Wait with aggresion unit we make some units
+            profile['battle_strategy'] = 'Deffensive'
+            profile['min_units_offense'] = 20
+    else:
+        if map_area >= 800:
+            # Wait with aggresion unit we make some units and make some more rangers
+            profile['battle_strategy'] = 'Deffensive'
+            profile['min_units_offense'] = 20
+            profile['max_units'] = {
+                'worker': 2,
+                'factory': 5,
+                'knight': 15,
+                'mage': 5,
+                'ranger': 10,
+                'healer': 5
+            }
+        else:
+            # play aggresive from start with regular unnits
+            profile['max_units'] = {
+                'worker': 1,
+                'factory': 2,
+                'knight': 10,
+                'mage': 2,
+                'ranger': 3,
+                'healer': 2
+            }
+
+    return profile
+
+
+def analyse(terrain_map, my_locations, enemy_locations):
+    """Runs the full static analysis of a starting map from one team's point
+    of view.
+    """
+    components = label_components(terrain_map)
+    reachable = reachable_mask(components, my_locations)
+    reachable_terrain = [
+        [terrain_map[x][y] and reachable[x][y] for y in range(len(terrain_map[0]))]
+        for x in range(len(terrain_map))
+    ]
+
+    choke_points, path_lengths = find_choke_points(reachable_terrain, components, my_locations, enemy_locations)
+    average_path_length = 0
+    if len(path_lengths) > 0:
+        average_path_length = sum(path_lengths) / len(path_lengths)
+
+    return {
+        'components': components,
+        'reachable': reachable,
+        'choke_points': choke_points,
+        'path_lengths': path_lengths,
+        'strategy': strategy_profile(reachable_terrain, choke_points, average_path_length)
+    }
+
+
+def encode(analysis):
+    """Converts an analysis into its compact on-disk form."""
+    return {
+        'components': analysis['components'],
+        'reachable': [''.join('1' if cell else '0' for cell in column) for column in analysis['reachable']],
+        'choke_points': [list(point) for point in analysis['choke_points']],
+        'path_lengths': analysis['path_lengths'],
+        'strategy': analysis['strategy']
+    }
+
+
+def decode(data):
+    """Converts the on-disk form of an analysis back into grids and tuples."""
+    return {
+        'components': data['components'],
+        'reachable': [[cell == '1' for cell in column] for column in data['reachable']],
+        'choke_points': [tuple(point) for point in data['choke_points']],
+        'path_lengths': data['path_lengths'],
+        'strategy': data['strategy']
+    }
+
+
+def cache_path(key):
+    return os.path.join(CACHE_DIRECTORY, key + '.json')
+
+
+def load(key, team):
+    """Returns the cached analysis of a map for a team, or None if it has not
+    been computed.
+    """
+    try:
+        with open(cache_path(key)) as f:
+            data = json.load(f)
+    except (IOError, ValueError):
+        return None
+    if data.get('version') != CACHE_VERSION or team.name not in data['teams']:
+        return None
+    return decode(data['teams'][team.name])
+
+
+def save(key, analyses):
+    """Writes the analyses of a map, given per team, to the cache."""
+    if not os.path.exists(CACHE_DIRECTORY):
+        os.makedirs(CACHE_DIRECTORY)
+    data = {
+        'version': CACHE_VERSION,
+        'teams': {team.name: encode(analysis) for team, analysis in analyses.items()}
+    }
+    with open(cache_path(key), 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
@@ -0,0 +1,161 @@
+"""Static analysis of Mars. The terrain and the asteroid pattern are known from
+the start of the game, so the passable regions, the karbonite the asteroids
+will bring and the best landing sites for rockets are computed once and
+cached on disk next to the Earth analysis.
+"""
+
+import hashlib
+import json
+import os
+import map_analysis
+import terrain
+
+CACHE_VERSION = 1
+
+ROUND_LIMIT = 1000
+
+# Karbonite within this many cells of a landing site counts towards its score.
+LANDING_SITE_RADIUS = 3
+# Score of every free cell next to a landing site, where units can be unloaded.
+FREE_NEIGHBOUR_SCORE = 10
+# Amount of karbonite near a landing site worth one point of score.
+KARBONITE_PER_POINT = 10
+MAX_LANDING_SITES = 50
+
+
+def read_pattern(asteroid_pattern):
+    """Returns the asteroid strikes of the game as the JSON data of the
+    pattern, keyed by round, read in one call.
+    """
+    return json.loads(asteroid_pattern.to_json())['pattern']
+
+
+def read_strikes(pattern):
+    """Returns (round, x, y, karbonite) for every asteroid strike of a pattern,
+    in the order they land.
+    """
+    strikes = []
+    for round, strike in pattern.items():
+        location = strike['location']
+        strikes.append((int(round), location['x'], location['y'], strike['karbonite']))
+    strikes.sort()
+    return strikes
+
+
+def mars_key(terrain_map, karbonite_map, pattern):
+    """Returns a hash identifying Mars by its terrain, karbonite and asteroid
+    pattern.
+    """
+    digest = hashlib.sha1(map_analysis.map_key(terrain_map, karbonite_map, []).encode())
+    digest.update(json.dumps(pattern, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def total_karbonite_map(terrain_map, karbonite_map, strikes):
+    """Returns the karbonite every passable cell will have received by the end
+    of the game, ignoring what is mined.
+    """
+    total = [
+        [karbonite_map[x][y] if terrain_map[x][y] else 0 for y in range(len(terrain_map[0]))]
+        for x in range(len(terrain_map))
+    ]
+    for round, x, y, karbonite in strikes:
+        if terrain_map[x][y]:
+            total[x][y] += karbonite
+    return total
+
+
+def rank_landing_sites(terrain_map, components, total_karbonite):
+    """Ranks the passable cells as landing sites. Large regions come first,
+    then cells with karbonite close by and room around them to unload.
+    """
+    width = len(terrain_map)
+    height = len(terrain_map[0])
+
+    component_area = {}
+    for column in components:
+        for component in column:
+            component_area[component] = component_area.get(component, 0) + 1
+
+    # Summed karbonite table, so the karbonite around a cell is a constant time lookup
+    summed = [[0]*(height + 1) for x in range(width + 1)]
+    for x in range(width):
+        for y in range(height):
+            summed[x + 1][y + 1] = total_karbonite[x][y] + summed[x][y + 1] + summed[x + 1][y] - summed[x][y]
+
+    sites = []
+    for x in range(width):
+        for y in range(height):
+            if not terrain_map[x][y]:
+                continue
+
+            free_neighbours = 0
+            for dx, dy in terrain.NEIGHBOUR_OFFSETS:
+                adjacent_x = x + dx
+                adjacent_y = y + dy
+                if 0 <= adjacent_x < width and 0 <= adjacent_y < height and terrain_map[adjacent_x][adjacent_y]:
+                    free_neighbours += 1
+            if free_neighbours == 0:
+                continue
+
+            low_x = max(x - LANDING_SITE_RADIUS, 0)
+            low_y = max(y - LANDING_SITE_RADIUS, 0)
+            high_x = min(x + LANDING_SITE_RADIUS + 1, width)
+            high_y = min(y + LANDING_SITE_RADIUS + 1, height)
+            karbonite = summed[high_x][high_y] - summed[low_x][high_y] - summed[high_x][low_y] + summed[low_x][low_y]
+
+            score = component_area[components[x][y]] + karbonite / KARBONITE_PER_POINT + FREE_NEIGHBOUR_SCORE * free_neighbours
+            sites.append((-score, x, y))
+
+    sites.sort()
+    return [(x, y) for score, x, y in sites[:MAX_LANDING_SITES]]
+
+
+def analyse(terrain_map, karbonite_map, strikes):
+    """Runs the full static analysis of Mars."""
+    components = map_analysis.label_components(terrain_map)
+    total_karbonite = total_karbonite_map(terrain_map, karbonite_map, strikes)
+    return {
+        'components': components,
+        'strikes': strikes,
+        'landing_sites': rank_landing_sites(terrain_map, components, total_karbonite)
+    }
+
+
+def strikes_by_round(strikes):
+    """Returns the asteroid strikes keyed by the round they land in."""
+    return {round: (x, y, karbonite) for round, x, y, karbonite in strikes}
+
+
+def cache_path(key):
+    return os.path.join(map_analysis.CACHE_DIRECTORY, 'mars-' + key + '.json')
+
+
+def load(key):
+    """Returns the cached analysis of Mars, or None if it has not been computed."""
+    try:
+        with open(cache_path(key)) as f:
+            data = json.load(f)
+    except (IOError, ValueError):
+        return None
+    if data.get('version') != CACHE_VERSION:
+        return None
+    return {
+        'components': data['components'],
+        'strikes': [tuple(strike) for strike in data['strikes']],
+        'landing_sites': [tuple(site) for site in data['landing_sites']]
+    }
+
+
+def save(key, analysis):
+    """Writes the analysis of Mars to the cache."""
+    if not os.path.exists(map_analysis.CACHE_DIRECTORY):
+        os.makedirs(map_analysis.CACHE_DIRECTORY)
+    data = {
+        'version': CACHE_VERSION,
+        'components': analysis['components'],
+        'strikes': [list(strike) for strike in analysis['strikes']],
+        'landing_sites': [list(site) for site in analysis['landing_sites']]
+    }
+    with open(cache_path(key), 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
@@ -0,0 +1,105 @@
+import battlecode as bc
+import behaviour_tree as bt
+import random
+import strategy
+import team_array
+from worker import Worker
+
+# Mars has no factories, so new workers can only come from replication.
+MAX_MARS_WORKERS = 10
+
+
+class MarsWorker(Worker):
+    """The container for a worker on Mars. Nothing can be built on Mars, so
+    the worker only harvests karbonite and replicates.
+    """
+    def generate_tree(self):
+        """Generates the tree for the worker on Mars."""
+        tree = bt.FallBack()
+
+        # Avoid enemies
+        enemies = bt.Sequence()
+        enemies.add_child(self.EnemyVisible(self))
+        enemies.add_child(self.MoveAwayFromEnemy(self))
+        tree.add_child(enemies)
+
+        # Replicate
+        replicate = bt.Sequence()
+        replicate.add_child(self.NeedAnotherWorker(self))
+        replicate.add_child(self.EnoughKarboniteToReplicate(self))
+        replicate.add_child(self.Replicate(self))
+        tree.add_child(replicate)
+
+        # Mine karbonite
+        karbonite = bt.FallBack()
+        adjacent_karbonite_sequence = bt.Sequence()
+        adjacent_karbonite_sequence.add_child(self.KarboniteInAdjacentCell(self))
+        adjacent_karbonite_sequence.add_child(self.HarvestKarbonite(self))
+        no_adj_karbonite_sequence = bt.Sequence()
+        no_adj_karbonite_sequence.add_child(self.KarboniteExists(self))
+        path_fallback = bt.FallBack()
+        path_following_sequence = bt.Sequence()
+        path_following_sequence.add_child(self.ExistsPath(self))
+        path_following_sequence.add_child(self.MoveOnPath(self))
+        create_path_fallback = bt.FallBack()
+        create_path_sequence = bt.Sequence()
+        create_path_sequence.add_child(self.NearbyKarboniteCells(self))
+        create_path_sequence.add_child(self.CreatePath(self))
+        create_path_fallback.add_child(create_path_sequence)
+        create_path_fallback.add_child(self.FindNearbyKarboniteCells(self))
+        path_fallback.add_child(path_following_sequence)
+        path_fallback.add_child(create_path_fallback)
+        no_adj_karbonite_sequence.add_child(path_fallback)
+
+        karbonite.add_child(adjacent_karbonite_sequence)
+        karbonite.add_child(no_adj_karbonite_sequence)
+        karbonite.add_child(self.MoveRandomly(self))
+        tree.add_child(karbonite)
+
+        return tree
+
+    ###############
+    # REPLICATION #
+    ###############
+
+    class NeedAnotherWorker(bt.Condition):
+        """Determines if we need another worker on Mars."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def condition(self):
+            return strategy.Strategy.getInstance().getCurrentUnit(bc.UnitType.Worker) < MAX_MARS_WORKERS
+
+    class EnoughKarboniteToReplicate(bt.Condition):
+        """Determines if we have enough karbonite to replicate, leaving the
+        karbonite Earth is saving up for.
+        """
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def condition(self):
+            reserved = team_array.TeamArray.getInstance().karboniteNeed()
+            return self.__outer._gc.karbonite() - reserved >= bc.UnitType.Worker.replicate_cost()
+
+    class Replicate(bt.Action):
+        """Replicates the worker into any of the adjacent cells if possible."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def action(self):
+            worker = self.__outer.unit()
+            directions = list(bc.Direction)
+            random.shuffle(directions)
+            for dir in directions:
+                if not self.__outer._actions.isOccupiable(worker.id, dir):
+                    continue
+                if self.__outer._gc.can_replicate(worker.id, dir):
+                    self.__outer._gc.replicate(worker.id, dir)
+                    self.__outer._actions.occupy(worker.id, dir)
+                    strategy.Strategy.getInstance().addUnit(bc.UnitType.Worker)
+                    self._status = bt.Status.SUCCESS
+                    return
+            self._status = bt.Status.FAIL
@@ -4,10 +4,13 @@ import random
 import units
 import math
 import astar
+import map_analysis
 import strategy
 
 class Ranger(units.Unit):
     """The container for the ranger unit."""
+    unit_type = bc.UnitType.Ranger
+
     def __init__(self, unit, gc, maps):
         super().__init__(unit, gc)
         self._targeted_enemy = None
@@ -51,6 +54,12 @@ class Ranger(units.Unit):
         enemy_handling.add_child(enemy_fallback)
         tree.add_child(enemy_handling)
 
+        # Board the rocket assigned by the planner
+        board = bt.Sequence()
+        board.add_child(self.AssignedToRocket(self))
+        board.add_child(self.MoveToRocket(self))
+        tree.add_child(board)
+
         move_fallback = bt.FallBack()
         move_sequence = bt.Sequence()
         move_sequence.add_child(self.OffensiveStrategy(self))
@@ -75,7 +84,7 @@ class Ranger(units.Unit):
 
         def condition(self):
             ranger = self.__outer.unit()
-            range = ranger.vision_range
+            range = self.__outer.properties().vision_range
             location = ranger.location.map_location()
             team = ranger.team
             enemy_team = bc.Team.Red if team == bc.Team.Blue else bc.Team.Blue
@@ -114,7 +123,7 @@ class Ranger(units.Unit):
 
             enemy_distance = ranger.location.map_location().distance_squared_to(enemy.location.map_location())
 
-            return enemy_distance > ranger.ranger_cannot_attack_range() and enemy_distance <= ranger.attack_range()
+            return enemy_distance > self.__outer.properties().cannot_attack_range and enemy_distance <= self.__outer.properties().attack_range
 
     class Attack(bt.Action):
         """Attacks the enemy targeted by the ranger."""
@@ -130,14 +139,14 @@ class Ranger(units.Unit):
             if not enemy:
                 self._status = bt.Status.FAIL
             else:
-                if self.__outer._gc.is_attack_ready(ranger.id) and self.__outer._gc.can_attack(ranger.id, enemy.id):
-                    self.__outer._gc.attack(ranger.id, enemy.id)
+                if self.__outer._actions.isAttackReady(ranger.id) and self.__outer._gc.can_attack(ranger.id, enemy.id):
+                    self.__outer._actions.attack(ranger.id, enemy.id)
                     self._status = bt.Status.SUCCESS
                      # Remove enemy from enemy_units_map if it died
                     location = ranger.location.map_location()
                     enemy_team = bc.Team.Red if ranger.team == bc.Team.Blue else bc.Team.Blue
                     killed_enemy = True
-                    nearby_units = self.__outer._gc.sense_nearby_units_by_team(location, ranger.attack_range(), enemy_team)
+                    nearby_units = self.__outer._gc.sense_nearby_units_by_team(location, self.__outer.properties().attack_range, enemy_team)
                     for nearby_unit in nearby_units:
                         if nearby_unit.id == enemy.id:
                             killed_enemy = False
@@ -160,7 +169,7 @@ class Ranger(units.Unit):
 
             enemy_distance = ranger.location.map_location().distance_squared_to(enemy.location.map_location())
 
-            return enemy_distance <= (ranger.attack_range() / 2)
+            return enemy_distance <= (self.__outer.properties().attack_range / 2)
 
     class MoveAway(bt.Action):
         """Moves away from the enemy."""
@@ -178,8 +187,8 @@ class Ranger(units.Unit):
                 enemy_direction = ranger.location.map_location().direction_to(enemy.location.map_location())
                 opposite_direction_position = ranger.location.map_location().subtract(enemy_direction)
                 opposite_direction = ranger.location.map_location().direction_to(opposite_direction_position)
-                if self.__outer._gc.is_move_ready(ranger.id) and self.__outer._gc.can_move(ranger.id, opposite_direction):
-                    self.__outer._gc.move_robot(ranger.id, opposite_direction)
+                if self.__outer._actions.isMoveReady(ranger.id) and self.__outer._actions.canMove(ranger.id, opposite_direction):
+                    self.__outer._actions.move(ranger.id, opposite_direction)
                     self._status = bt.Status.SUCCESS
                 else:
                     self._status = bt.Status.FAIL
@@ -196,7 +205,7 @@ class Ranger(units.Unit):
 
             enemy_distance = ranger.location.map_location().distance_squared_to(enemy.location.map_location())
 
-            return enemy_distance > ranger.attack_range()
+            return enemy_distance > self.__outer.properties().attack_range
 
     class MoveTowards(bt.Action):
         """Moves towards the enemy."""
@@ -212,8 +221,8 @@ class Ranger(units.Unit):
                 self._status = bt.Status.FAIL
             else:
                 enemy_direction = ranger.location.map_location().direction_to(enemy.location.map_location())
-                if self.__outer._gc.is_move_ready(ranger.id) and self.__outer._gc.can_move(ranger.id, enemy_direction):
-                    self.__outer._gc.move_robot(ranger.id, enemy_direction)
+                if self.__outer._actions.isMoveReady(ranger.id) and self.__outer._actions.canMove(ranger.id, enemy_direction):
+                    self.__outer._actions.move(ranger.id, enemy_direction)
                     self._status = bt.Status.SUCCESS
                 else:
                     self._status = bt.Status.FAIL
@@ -236,6 +245,7 @@ class Ranger(units.Unit):
             ranger = self.__outer.unit()
             ranger_location = ranger.location.map_location()
             enemies_map = self.__outer._maps['enemy_units_map']
+            component_map = self.__outer._maps['component_map']
 
             min_distance = math.inf
             closest_unit_location = None
@@ -243,10 +253,13 @@ class Ranger(units.Unit):
                 for y in range(len(enemies_map[0])):
                     enemy = enemies_map[x][y]
                     if enemy:
+                        # No path leads to an enemy on another component
+                        if not map_analysis.is_reachable(component_map, ranger_location, enemy.location.map_location()):
+                            continue
                         current_distance = ranger_location.distance_squared_to(enemy.location.map_location())
 
                         # check just in case enemy desingregated its unit or we failed to attack for any reason
-                        if current_distance < ranger.vision_range:
+                        if current_distance < self.__outer.properties().vision_range:
                             continue
                         if current_distance < min_distance:
                             min_distance = current_distance
@@ -270,7 +283,8 @@ class Ranger(units.Unit):
             ranger = self.__outer.unit()
             terrain_map = self.__outer._maps['terrain_map']
             my_units_map = self.__outer._maps['my_units_map']
-            path = astar.astar(terrain_map, my_units_map, ranger.location.map_location(), location, max_path_length=5)
+            component_map = self.__outer._maps['component_map']
+            path = astar.astar(terrain_map, my_units_map, ranger.location.map_location(), location, max_path_length=5, components=component_map)
 
             if len(path) > 0:
                 path.pop(0) # Remove the point the unit is already on.
@@ -291,10 +305,10 @@ class Ranger(units.Unit):
             ranger = self.__outer.unit()
             unit_map_location = ranger.location.map_location()
             move_direction = unit_map_location.direction_to(next_point)
-            if self.__outer._gc.can_move(ranger.id, move_direction):
+            if self.__outer._actions.canMove(ranger.id, move_direction):
                 self._status = bt.Status.RUNNING
-                if self.__outer._gc.is_move_ready(ranger.id):
-                    self.__outer._gc.move_robot(ranger.id, move_direction)
+                if self.__outer._actions.isMoveReady(ranger.id):
+                    self.__outer._actions.move(ranger.id, move_direction)
                     self.__outer._path_to_follow.pop(0)
                     if len(self.__outer._path_to_follow) == 1:
                         self.__outer._path_to_follow = None
@@ -316,8 +330,8 @@ class Ranger(units.Unit):
         def action(self):
             random_dir = random.choice(list(bc.Direction))
             ranger = self.__outer.unit()
-            if self.__outer._gc.is_move_ready(ranger.id) and self.__outer._gc.can_move(ranger.id, random_dir):
-                self.__outer._gc.move_robot(ranger.id, random_dir)
+            if self.__outer._actions.isMoveReady(ranger.id) and self.__outer._actions.canMove(ranger.id, random_dir):
+                self.__outer._actions.move(ranger.id, random_dir)
                 self._status = bt.Status.SUCCESS
             else:
                 self._status = bt.Status.FAIL
@@ -0,0 +1,131 @@
+import battlecode as bc
+import behaviour_tree as bt
+import rocket_planner
+import units
+
+
+class Rocket(units.Unit):
+    """The container for the rocket unit."""
+    unit_type = bc.UnitType.Rocket
+
+    def __init__(self, unit, gc, maps):
+        super().__init__(unit, gc)
+        self._maps = maps
+
+    def generate_tree(self):
+        """Generates the tree for the rocket."""
+        tree = bt.FallBack()
+
+        # Unload everyone after landing
+        landed = bt.Sequence()
+        landed.add_child(self.OnMars(self))
+        landed.add_child(self.GarrisonNotEmpty(self))
+        landed.add_child(self.Unload(self))
+        tree.add_child(landed)
+
+        # Load the passengers and launch when the planner says so
+        launch = bt.Sequence()
+        launch.add_child(self.OnEarth(self))
+        launch.add_child(self.LoadPassengers(self))
+        launch.add_child(self.ReadyToLaunch(self))
+        launch.add_child(self.Launch(self))
+        tree.add_child(launch)
+
+        return tree
+
+    ##########
+    # UNLOAD #
+    ##########
+
+    class OnMars(bt.Condition):
+        """Determines if the rocket has landed on Mars."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def condition(self):
+            location = self.__outer.unit().location
+            return location.is_on_planet(bc.Planet.Mars)
+
+    class GarrisonNotEmpty(bt.Condition):
+        """Determines if there are units inside the rocket."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def condition(self):
+            return len(self.__outer.unit().structure_garrison()) > 0
+
+    class Unload(bt.Action):
+        """Unloads as many units as there is room for around the rocket."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def action(self):
+            rocket = self.__outer.unit()
+            unloaded = False
+            for direction in list(bc.Direction):
+                if self.__outer._gc.can_unload(rocket.id, direction):
+                    self.__outer._gc.unload(rocket.id, direction)
+                    self.__outer._actions.occupy(rocket.id, direction)
+                    unloaded = True
+            if unloaded:
+                self._status = bt.Status.SUCCESS
+            else:
+                self._status = bt.Status.FAIL
+
+    ##########
+    # LAUNCH #
+    ##########
+
+    class OnEarth(bt.Condition):
+        """Determines if the rocket is still on Earth."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def condition(self):
+            location = self.__outer.unit().location
+            return location.is_on_planet(bc.Planet.Earth)
+
+    class LoadPassengers(bt.Action):
+        """Loads the adjacent units that the planner assigned to the rocket."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def action(self):
+            rocket = self.__outer.unit()
+            planner = rocket_planner.RocketPlanner.getInstance()
+            nearby_units = self.__outer._gc.sense_nearby_units_by_team(rocket.location.map_location(), 2, rocket.team)
+            for unit in nearby_units:
+                if planner.isPassenger(unit.id, rocket.id) and self.__outer._gc.can_load(rocket.id, unit.id):
+                    self.__outer._gc.load(rocket.id, unit.id)
+            self._status = bt.Status.SUCCESS
+
+    class ReadyToLaunch(bt.Condition):
+        """Determines if the planner wants the rocket to launch this round."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def condition(self):
+            return rocket_planner.RocketPlanner.getInstance().shouldLaunch(self.__outer.unit())
+
+    class Launch(bt.Action):
+        """Launches the rocket to the best free landing site on Mars."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def action(self):
+            rocket = self.__outer.unit()
+            planner = rocket_planner.RocketPlanner.getInstance()
+            for destination in planner.landingSites():
+                if self.__outer._gc.can_launch_rocket(rocket.id, destination):
+                    self.__outer._gc.launch_rocket(rocket.id, destination)
+                    planner.useLandingSite(destination)
+                    self._status = bt.Status.SUCCESS
+                    return
+            self._status = bt.Status.FAIL
@@ -0,0 +1,215 @@
+"""Plans the rockets that take our units from Earth to Mars. The planner
+decides when rockets are built, which units board which rocket, when each
+rocket launches and where it lands. Flight times only depend on the orbit
+pattern, so they are read once into a table at the start of the game.
+"""
+
+import battlecode as bc
+import mars_analysis
+
+# Everything left on Earth is destroyed in this round.
+FLOOD_ROUND = 750
+# Rockets are only worth building once the army on Earth has grown.
+FIRST_ROCKET_ROUND = 200
+# Later blueprints would not be built and loaded before the flood.
+LAST_BUILD_ROUND = FLOOD_ROUND - 75
+MAX_UNLAUNCHED_ROCKETS = 2
+MAX_WORKERS_PER_ROCKET = 1
+# Rounds a rocket waits for its passengers before leaving with whoever boarded.
+MAX_BOARDING_ROUNDS = 50
+# Landing sites this close, squared, to a site already used are skipped.
+MIN_SITE_DISTANCE = 8
+# Landing sites this close, squared, to an enemy Mars reported are used last.
+ENEMY_SITE_DISTANCE = 50
+# Rounds after which an enemy reported by Mars has probably moved on.
+MAX_SIGHTING_AGE = 100
+
+
+def read_flight_times(orbit_pattern):
+    """Returns the flight time of a rocket launched in every round, indexed
+    by round.
+    """
+    flight_times = [0]*(mars_analysis.ROUND_LIMIT + 1)
+    for round in range(1, mars_analysis.ROUND_LIMIT + 1):
+        flight_times[round] = orbit_pattern.duration(round)
+    return flight_times
+
+
+def best_launch_rounds(flight_times, last_round):
+    """Returns, for every round, the round from then on up to the last round in
+    which a launch reaches Mars first. After the last round a rocket should
+    leave right away.
+    """
+    launch_rounds = list(range(len(flight_times)))
+    best_round = last_round
+    for round in range(last_round, 0, -1):
+        if round + flight_times[round] <= best_round + flight_times[best_round]:
+            best_round = round
+        launch_rounds[round] = best_round
+    return launch_rounds
+
+
+class RocketPlanner:
+    __instance = None
+
+    def setFlightTimes(self, flight_times):
+        self.flight_times = flight_times
+        self.launch_rounds = best_launch_rounds(flight_times, FLOOD_ROUND - 1)
+
+    def setLandingSites(self, landing_sites):
+        self.landing_sites = list(landing_sites)
+
+    def setEnemySightings(self, sightings):
+        """Takes the recent enemy sightings on Mars, sent over the team array."""
+        self.enemy_locations = [(sighting.x, sighting.y) for sighting in sightings]
+
+    def update(self, gc, units, component_map):
+        """Keeps track of our rockets on Earth and assigns the closest units
+        to the rockets that still have room. Takes the unit records of this
+        turn's snapshot.
+        """
+        self.round = gc.round()
+        self.rocket_researched = gc.research_info().get_level(bc.UnitType.Rocket) > 0
+
+        rockets = []
+        robots = []
+        for unit in units:
+            if unit.location_kind != bc.LOCATION_ON_MAP or unit.planet != bc.Planet.Earth:
+                continue
+            if unit.unit_type == bc.UnitType.Rocket:
+                rockets.append(unit)
+            elif unit.unit_type != bc.UnitType.Factory:
+                robots.append(unit)
+        self.nr_unlaunched_rockets = len(rockets)
+
+        # Forget rockets that launched or were destroyed, and units that boarded or died
+        built_rockets = [gc.unit(rocket.id) for rocket in rockets]
+        built_rockets = [rocket for rocket in built_rockets if rocket.structure_is_built()]
+        rocket_ids = set(rocket.id for rocket in built_rockets)
+        for rocket_id in list(self.rocket_locations):
+            if rocket_id not in rocket_ids:
+                del self.rocket_locations[rocket_id]
+                del self.ready_rounds[rocket_id]
+        robot_ids = set(robot.id for robot in robots)
+        for unit_id, rocket_id in list(self.passengers.items()):
+            if rocket_id not in rocket_ids or unit_id not in robot_ids:
+                del self.passengers[unit_id]
+
+        nr_workers = len([robot for robot in robots if robot.unit_type == bc.UnitType.Worker])
+        for rocket in sorted(built_rockets, key=lambda rocket: rocket.id):
+            location = rocket.location.map_location()
+            if rocket.id not in self.rocket_locations:
+                self.rocket_locations[rocket.id] = location
+                self.ready_rounds[rocket.id] = self.round
+
+            garrison = rocket.structure_garrison()
+            assigned = [unit_id for unit_id, rocket_id in self.passengers.items() if rocket_id == rocket.id]
+            free = rocket.structure_max_capacity() - len(garrison) - len(assigned)
+            workers = len([unit_id for unit_id in garrison if gc.unit(unit_id).unit_type == bc.UnitType.Worker])
+            workers += len([robot for robot in robots if robot.id in assigned and robot.unit_type == bc.UnitType.Worker])
+
+            component = component_map[location.x][location.y]
+            candidates = [
+                robot for robot in robots
+                if robot.id not in self.passengers and component_map[robot.x][robot.y] == component
+            ]
+            candidates.sort(key=lambda robot: (robot.x - location.x) ** 2 + (robot.y - location.y) ** 2)
+            for robot in candidates:
+                if free <= 0:
+                    break
+                if robot.unit_type == bc.UnitType.Worker:
+                    # Keep a worker on Earth to build the next rocket
+                    if workers >= MAX_WORKERS_PER_ROCKET or nr_workers <= 1:
+                        continue
+                    workers += 1
+                    nr_workers -= 1
+                self.passengers[robot.id] = rocket.id
+                free -= 1
+
+    def needRocket(self):
+        """Determines if a new rocket should be blueprinted."""
+        return (self.rocket_researched
+                and FIRST_ROCKET_ROUND <= self.round <= LAST_BUILD_ROUND
+                and self.nr_unlaunched_rockets < MAX_UNLAUNCHED_ROCKETS)
+
+    def reservedKarbonite(self):
+        """The karbonite that factories and other blueprints should leave for
+        the next rocket.
+        """
+        if self.needRocket():
+            return bc.UnitType.Rocket.blueprint_cost()
+        return 0
+
+    def rocketLocation(self, unit_id):
+        """Gets the location of the rocket a unit should board, if any."""
+        rocket_id = self.passengers.get(unit_id)
+        if rocket_id is None:
+            return None
+        return self.rocket_locations[rocket_id]
+
+    def isPassenger(self, unit_id, rocket_id):
+        return self.passengers.get(unit_id) == rocket_id
+
+    def shouldLaunch(self, rocket):
+        """Determines if a loaded rocket should launch this round."""
+        garrison = rocket.structure_garrison()
+        if len(garrison) == 0:
+            return False
+
+        # Leave before the flood or before the rocket is destroyed
+        if self.round >= FLOOD_ROUND - 1 or rocket.health * 2 < rocket.max_health:
+            return True
+
+        waiting_for = [unit_id for unit_id, rocket_id in self.passengers.items() if rocket_id == rocket.id]
+        boarded = (len(garrison) >= rocket.structure_max_capacity()
+                   or len(waiting_for) == 0
+                   or self.round - self.ready_rounds.get(rocket.id, self.round) >= MAX_BOARDING_ROUNDS)
+        return boarded and self.launch_rounds[self.round] == self.round
+
+    def landingSites(self):
+        """Gets the landing sites in order of preference, spreading rockets
+        over Mars before landing close to a site already used, and landing
+        close to enemies last.
+        """
+        spread = []
+        close = []
+        enemies = []
+        for site in self.landing_sites:
+            if site in self.used_sites:
+                continue
+            x, y = site
+            if any((x - enemy_x) ** 2 + (y - enemy_y) ** 2 <= ENEMY_SITE_DISTANCE for enemy_x, enemy_y in self.enemy_locations):
+                enemies.append(site)
+            elif any((x - used_x) ** 2 + (y - used_y) ** 2 <= MIN_SITE_DISTANCE for used_x, used_y in self.used_sites):
+                close.append(site)
+            else:
+                spread.append(site)
+        return [bc.MapLocation(bc.Planet.Mars, x, y) for x, y in spread + close + enemies]
+
+    def useLandingSite(self, location):
+        self.used_sites.append((location.x, location.y))
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if RocketPlanner.__instance == None:
+            RocketPlanner()
+        return RocketPlanner.__instance
+
+    def __init__(self):
+        """ Virtually private constructor. """
+        if RocketPlanner.__instance != None:
+            raise Exception("This class is a Singleton!")
+        else:
+            RocketPlanner.__instance = self
+            self.flight_times = []
+            self.launch_rounds = []
+            self.landing_sites = []
+            self.used_sites = []
+            self.enemy_locations = []
+            self.rocket_locations = {}
+            self.ready_rounds = {}
+            self.passengers = {}
+            self.round = 0
+            self.rocket_researched = False
+            self.nr_unlaunched_rockets = 0
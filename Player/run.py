@@ -6,7 +6,18 @@ import time
 import astar
 from worker import Worker
 from knight import Knight
+from healer import Healer
+from ranger import Ranger
+from mage import Mage
+from mars_worker import MarsWorker
+from rocket import Rocket
 import strategy
+import map_analysis
+import mars_analysis
+import actions
+import rocket_planner
+import team_array
+import unit_properties
 import math
 import time
 
@@ -18,12 +29,23 @@ enemy_units_map = []
 my_units_map = []
 unit_map = []
 terrain_map = []
+component_map = []
 my_team = gc.team()
 enemy_team = bc.Team.Red if my_team == bc.Team.Blue else bc.Team.Blue
 #strategy = strategy.Strategy()
 map_height = gc.starting_map(gc.planet()).height
 map_width = gc.starting_map(gc.planet()).width
 my_units = []
+maps = {
+    "karbonite_map": karbonite_map,
+    "terrain_map": terrain_map,
+    "component_map": component_map,
+    "my_units_map": my_units_map,
+    "enemy_units_map": enemy_units_map
+}
+asteroid_strikes = {}
+# Seconds per turn the units on Mars may spend running their trees.
+MARS_TURN_BUDGET = 0.02
 
 
 def update_my_units_map(units):
@@ -34,10 +56,8 @@ def update_my_units_map(units):
     strategy.Strategy.getInstance().resetCurrentUnits()
     for unit in units:
         strategy.Strategy.getInstance().addUnit(unit.unit_type)
-        location = unit.location
-        if location.is_on_map():
-            map_location = location.map_location()
-            my_units_map[map_location.x][map_location.y] = unit
+        if unit.location_kind == bc.LOCATION_ON_MAP:
+            my_units_map[unit.x][unit.y] = unit
 
 
 def update_enemy_units_map(units):
@@ -46,79 +66,164 @@ def update_enemy_units_map(units):
         for y in range(map_height):
             if enemy_units_map[x][y] and enemy_units_map[x][y].unit_type != bc.UnitType.Factory:
                 enemy_units_map[x][y] = None
+    update_karbonite_map(units)
     for unit in units:
-        location = unit.location
-        if location.is_on_map():
-            update_karbonite_map(location, unit.vision_range)
-            nearby = gc.sense_nearby_units_by_team(location.map_location(), unit.vision_range, enemy_team)
+        if unit.location_kind == bc.LOCATION_ON_MAP:
+            location = bc.MapLocation(gc.planet(), unit.x, unit.y)
+            nearby = gc.sense_nearby_units_by_team(location, unit.vision_range, enemy_team)
             for enemy in nearby:
                 map_location = enemy.location.map_location()
                 enemy_units_map[map_location.x][map_location.y] = enemy
+                if gc.planet() == bc.Planet.Mars:
+                    # Earth picks the landing sites with what Mars has seen
+                    team_array.TeamArray.getInstance().addEnemySighting(
+                        gc.round(), map_location.x, map_location.y, enemy.unit_type)
 
 
-def update_karbonite_map(unit_location, range):
-    """Updates the map containing information regarding karbonite."""
-    locations = gc.all_locations_within(unit_location.map_location(), range)
-    for map_location in locations:
-        karbonite_map[map_location.x][map_location.y] = gc.karbonite_at(map_location)
+def update_karbonite_map(units):
+    """Updates the map containing information regarding karbonite with
+    every location visible to our units, each read once.
+    """
+    visible_karbonite = gc.karbonite_grid(units)
+    for x in range(map_width):
+        for y in range(map_height):
+            if visible_karbonite[x][y] >= 0 and terrain_map[x][y]:
+                karbonite_map[x][y] = visible_karbonite[x][y]
 
 
 def init_workers():
     """Initializes the worker units with behaviour trees."""
     units = gc.my_units()
     for unit in units:
-        my_units.append(Worker(
-            unit.id,
-            gc,
-            {
-                "karbonite_map": karbonite_map,
-                "terrain_map": terrain_map,
-                "my_units_map": my_units_map,
-                "enemy_units_map": enemy_units_map
-            },
-            my_units
-        ))
+        my_units.append(Worker(unit.id, gc, maps, my_units))
 
 
 def init_maps():
     """Initializes maps used by the AI."""
     map = gc.starting_map(gc.planet())
+    karbonite, terrain = map_analysis.read_grids(map)
+    karbonite_map.extend(karbonite)
+    terrain_map.extend(terrain)
     for x in range(map_width):
-        karbonite_map.append([])
-        terrain_map.append([])
-        enemy_units_map.append([])
-        my_units_map.append([])
-        for y in range(map_height):
-            loc = bc.MapLocation(gc.planet(),x,y)
-            karbonite_map[x].append(map.initial_karbonite_at(loc))
-            terrain_map[x].append(map.is_passable_terrain_at(loc))
-            enemy_units_map[x].append(None)
-            my_units_map[x].append(None)
+        enemy_units_map.append([None]*map_height)
+        my_units_map.append([None]*map_height)
 
 
-def remove_unreachable_karbonite():
-    units = gc.my_units()
+def init_actions():
+    """Gives the action queue the passable terrain of the planet."""
     map = gc.starting_map(gc.planet())
-    map_reachable = [[False]*map_height for i in range(map_width)]
-    directions = [dir for dir in bc.Direction if dir is not bc.Direction.Center]
+    actions.Actions.getInstance().setTerrain(map.passable_grid())
+
+
+def init_map_analysis():
+    """Loads the static analysis of the starting map from the cache, and
+    computes it if the map has not been analysed offline.
+    """
+    map = gc.starting_map(gc.planet())
+    initial_units = map_analysis.initial_unit_positions(map)
+    key = map_analysis.map_key(terrain_map, karbonite_map, initial_units)
+    analysis = map_analysis.load(key, my_team)
+    if analysis is None:
+        my_locations = []
+        enemy_locations = []
+        for team, x, y in initial_units:
+            location = bc.MapLocation(gc.planet(), x, y)
+            if team == my_team:
+                my_locations.append(location)
+            else:
+                enemy_locations.append(location)
+        analysis = map_analysis.analyse(terrain_map, my_locations, enemy_locations)
+    return analysis
+
+
+def init_mars_analysis():
+    """Loads the static analysis of Mars and its asteroid strikes from the
+    cache, and computes it if Mars has not been analysed offline. The strikes
+    are only converted from the asteroid pattern when the cache misses.
+    """
+    karbonite, terrain = map_analysis.read_grids(gc.starting_map(bc.Planet.Mars))
+    pattern = mars_analysis.read_pattern(gc.asteroid_pattern())
+    key = mars_analysis.mars_key(terrain, karbonite, pattern)
+    analysis = mars_analysis.load(key)
+    if analysis is None:
+        analysis = mars_analysis.analyse(terrain, karbonite, mars_analysis.read_strikes(pattern))
+    return analysis
+
+
+def init_rocket_planner(mars):
+    """Gives the rocket planner the flight time of every round and the
+    landing sites on Mars.
+    """
+    planner = rocket_planner.RocketPlanner.getInstance()
+    planner.setFlightTimes(rocket_planner.read_flight_times(gc.orbit_pattern()))
+    planner.setLandingSites(mars['landing_sites'])
+
+
+def update_asteroid_karbonite():
+    """Adds the karbonite of this round's asteroid strike to the karbonite map."""
+    strike = asteroid_strikes.get(gc.round())
+    if strike:
+        x, y, karbonite = strike
+        if terrain_map[x][y]:
+            karbonite_map[x][y] += karbonite
+
+
+def create_unit_container(unit):
+    """Creates the tree container for a unit of any type."""
+    if unit.unit_type == bc.UnitType.Worker:
+        if gc.planet() == bc.Planet.Mars:
+            return MarsWorker(unit.id, gc, maps, my_units)
+        return Worker(unit.id, gc, maps, my_units)
+    elif unit.unit_type == bc.UnitType.Knight:
+        return Knight(unit.id, gc, maps)
+    elif unit.unit_type == bc.UnitType.Healer:
+        return Healer(unit.id, gc, maps)
+    elif unit.unit_type == bc.UnitType.Ranger:
+        return Ranger(unit.id, gc, maps)
+    elif unit.unit_type == bc.UnitType.Mage:
+        return Mage(unit.id, gc, maps)
+    elif unit.unit_type == bc.UnitType.Rocket:
+        return Rocket(unit.id, gc, maps)
+    return None
+
+
+def track_new_units(units):
+    """Adds tree containers for units that were not created by our own trees,
+    like the units that land on Mars or are replicated there.
+    """
+    tracked = set(unit.unit_id() for unit in my_units)
     for unit in units:
-        unit_location = unit.location.map_location()
-        neighbours = []
-        if not map_reachable[unit_location.x][unit_location.y]:
-            neighbours.append(unit_location)
-        while neighbours:
-            location = neighbours.pop(0)
-            if map_reachable[location.x][location.y]:
-                continue
-            map_reachable[location.x][location.y] = True
-
-            for dir in directions:
-                adjacent_location = location.add(dir)
-                # check if out of bound
-                if adjacent_location.x < 0 or adjacent_location.x >= len(map_reachable) or adjacent_location.y < 0 or adjacent_location.y >= len(map_reachable[0]):
-                    continue
-                if terrain_map[adjacent_location.x][adjacent_location.y] and not map_reachable[adjacent_location.x][adjacent_location.y]:
-                    neighbours.append(adjacent_location)
+        if unit.id in tracked or unit.location_kind != bc.LOCATION_ON_MAP:
+            continue
+        container = create_unit_container(unit)
+        if container:
+            my_units.append(container)
+
+
+def run_units(time_budget):
+    """Runs the trees of the units until the time budget, in seconds, is
+    used up. The units are shuffled every turn, so the ones left out get
+    their turn later. Units loaded into a rocket or factory have no map
+    location for their trees to work with, so they wait until they are
+    unloaded. A unit whose tree fails does not cost the other units their
+    turn.
+    """
+    deadline = time.time() + time_budget
+    random.shuffle(my_units)
+    for unit in my_units:
+        if time.time() > deadline:
+            break
+        battlecode_unit = unit.unit()
+        if not battlecode_unit or not battlecode_unit.location.is_on_map():
+            continue
+        try:
+            unit.run()
+        except Exception as e:
+            print('Error in unit', unit.unit_id(), e)
+            traceback.print_exc()
+
+
+def remove_unreachable_karbonite(map_reachable):
     for x in range(len(map_reachable)):
         for y in range(len(map_reachable[0])):
             if not map_reachable[x][y]:
@@ -126,72 +231,6 @@ def remove_unreachable_karbonite():
                 terrain_map[x][y] = False
 
 
-def is_narrow_point(location):
-    upFree = 3
-    for i in range(1,4):
-        upLocation = location.translate(0,i)
-        if not location_in_bounds(upLocation, terrain_map) or not terrain_map[upLocation.x][upLocation.y]:
-            upFree = i - 1
-            break
-
-    downFree = 3
-    for i in range(1,4):
-        downLocation = location.translate(0,-i)
-        if not location_in_bounds(downLocation, terrain_map) or not terrain_map[downLocation.x][downLocation.y]:
-            downFree = i - 1
-            break
-
-    leftFree = 3
-    for i in range(1,4):
-        leftLocation = location.translate(-i,0)
-        if not location_in_bounds(leftLocation, terrain_map) or not terrain_map[leftLocation.x][leftLocation.y]:
-            leftFree = i - 1
-            break
-
-    rightFree = 3
-    for i in range(1,4):
-        rightLocation = location.translate(i,0)
-        if not location_in_bounds(rightLocation, terrain_map) or not terrain_map[rightLocation.x][rightLocation.y]:
-            rightFree = i - 1
-            break
-
-    return (upFree + downFree) < 2 or (leftFree + rightFree) < 2
-
-
-def location_in_bounds(location, map):
-    return location.x >= 0 and location.x < len(map) and location.y >= 0 and location.y < len(map[0])
-
-
-def find_choke_points():
-    width = len(terrain_map)
-    height = len(terrain_map[0])
-    map = gc.starting_map(gc.planet())
-    my_start_workers = gc.my_units()
-    enemy_start_workers = [worker for worker in map.initial_units if worker not in my_start_workers]
-
-    paths = []
-    for worker in my_start_workers:
-        for enemy_worker in enemy_start_workers:
-            my_worker_location = worker.location.map_location()
-            enemy_worker_location = enemy_worker.location.map_location()
-            astar_path = astar.astar(terrain_map, my_units_map, my_worker_location, enemy_worker_location)
-            if len(astar_path) > 0:
-                paths.append(astar_path)
-
-    choke_points = []
-    paths_length = 0
-    for path in paths:
-        paths_length += len(path)
-        for location in path:
-            if is_narrow_point(location) and location not in choke_points:
-                choke_points.append(location)
-
-    average_path_length = 0
-    if len(paths) > 0:
-        average_path_length = paths_length / len(paths)
-
-    return choke_points,  average_path_length
-
 def update_strategy():
     min_amount_for_offense = strategy.Strategy.getInstance().min_nr_units_for_offense
     current_amount = strategy.Strategy.getInstance().getNumberCurrentUnits()
@@ -199,157 +238,67 @@ def update_strategy():
     if min_amount_for_offense and current_amount >= min_amount_for_offense:
         strategy.Strategy.getInstance().setBattleStrategy(strategy.BattleStrategy.Offensive)
 
-def init_strategy():
-    width = len(terrain_map)
-    height = len(terrain_map[0])
-    choke_points, average_path_length = find_choke_points()
-    map_area =  width*height
-
-    nr_impassable = 0
-    for x in range(width):
-        for y in range(height):
-            if not terrain_map[x][y]:
-                nr_impassable += 1
-
-    impassable_per = 100 *nr_impassable / map_area
-
-    if average_path_length == 0:
-        # no path between inital units, spam rangers (only mirror)
-        strategy.Strategy.getInstance().battle_strategy = strategy.BattleStrategy.Offensive
-        strategy.Strategy.getInstance().setMaxUnit(
-            {
-                'worker': 2,
-                'factory': 2,
-                'knight': 1,
-                'mage': 1,
-                'ranger': 50,
-                'healer': 10
-            }
-        )
-    elif average_path_length < 5:
-        strategy.Strategy.getInstance().battle_strategy = strategy.BattleStrategy.Offensive
-        strategy.Strategy.getInstance().enemy_start_close = True
-        # play aggresive from start with regular unnits
-        strategy.Strategy.getInstance().setMaxUnit(
-            {
-                'worker': 1,
-                'factory': 2,
-                'knight': 75,
-                'mage': 5,
-                'ranger': 15,
-                'healer': 5
-            }
-        )
-    elif len(choke_points) > 5:
-        # A lot of choke points, we need more rangers
-        if map_area >= 800 and impassable_per > 20:
-            # play Defensive
-            strategy.Strategy.getInstance().battle_strategy = strategy.BattleStrategy.Deffensive
-            strategy.Strategy.getInstance().setMaxUnit(
-                {
-                    'worker': 3,
-                    'factory': 5,
-                    'knight': 5,
-                    'mage': 10,
-                    'ranger': 75,
-                    'healer': 10
-                }
-            )
-        elif map_area < 800:
-            # play aggresive with less factories
-            strategy.Strategy.getInstance().battle_strategy = strategy.BattleStrategy.Offensive
-            strategy.Strategy.getInstance().setMaxUnit(
-                {
-                    'worker': 3,
-                    'factory': 3,
-                    'knight': 10,
-                    'mage': 10,
-                    'ranger': 30,
-                    'healer': 5
-                }
-            )
-        else:
-            # play aggresive
-            strategy.Strategy.getInstance().battle_strategy = strategy.BattleStrategy.Offensive
-            strategy.Strategy.getInstance().setMaxUnit(
-                {
-                    'worker': 3,
-                    'factory': 5,
-                    'knight': 5,
-                    'mage': 20,
-                    'ranger': 30,
-                    'healer': 5
-                }
-            )
-    elif len(choke_points) > 1:
-        # There are some choke points, we need some more  rangers
-        if map_area >= 800 and average_path_length > 50:
-            # Wait with aggresion unit we make some units
-            strategy.Strategy.getInstance().battle_strategy = strategy.BattleStrategy.Deffensive
-            strategy.Strategy.getInstance().setMinUnitsOffense(20)
-        else:
-            # play aggresive from start
-            strategy.Strategy.getInstance().battle_strategy = strategy.BattleStrategy.Offensive
-    else:
-        if map_area >= 800:
-            # Wait with aggresion unit we make some units and make some more rangers
-            strategy.Strategy.getInstance().battle_strategy = strategy.BattleStrategy.Deffensive
-            strategy.Strategy.getInstance().setMinUnitsOffense(20)
-            strategy.Strategy.getInstance().setMaxUnit(
-                {
-                    'worker': 2,
-                    'factory': 5,
-                    'knight': 15,
-                    'mage': 5,
-                    'ranger': 10,
-                    'healer': 5
-                }
-            )
-        else:
-            # play aggresive from start with regular unnits
-            strategy.Strategy.getInstance().battle_strategy = strategy.BattleStrategy.Offensive
-            strategy.Strategy.getInstance().setMaxUnit(
-                {
-                    'worker': 1,
-                    'factory': 2,
-                    'knight': 10,
-                    'mage': 2,
-                    'ranger': 3,
-                    'healer': 2
-                }
-            )
+def update_team_array():
+    """Tells Mars what Earth is saving up for."""
+    team_array.TeamArray.getInstance().setKarboniteNeed(rocket_planner.RocketPlanner.getInstance().reservedKarbonite())
 
 
+def init_strategy(analysis):
+    strategy.Strategy.getInstance().applyProfile(analysis['strategy'])
+
 
 def remove_dead_units():
     my_units[:] = [unit for unit in my_units if unit.unit()]
 
 
+init_actions()
 if gc.planet() == bc.Planet.Earth:
     init_maps()
     init_workers()
-    remove_unreachable_karbonite()
-    init_strategy()
+    analysis = init_map_analysis()
+    component_map.extend(analysis['components'])
+    remove_unreachable_karbonite(analysis['reachable'])
+    init_strategy(analysis)
+    init_rocket_planner(init_mars_analysis())
     for research in strategy.Strategy.research_strategy:
         gc.queue_research(research)
+else:
+    init_maps()
+    mars = init_mars_analysis()
+    component_map.extend(mars['components'])
+    asteroid_strikes.update(mars_analysis.strikes_by_round(mars['strikes']))
+    # Whoever makes it to Mars hunts down the enemies there
+    strategy.Strategy.getInstance().setBattleStrategy(strategy.BattleStrategy.Offensive)
 while True:
-    if gc.planet() == bc.Planet.Mars:
-        gc.next_turn()
-    else:
-        try:
-            units = gc.my_units()
-            remove_dead_units()
-            update_enemy_units_map(units)
-            update_my_units_map(units)
+    try:
+        # One snapshot of our units and one of the visible units per turn,
+        # instead of a call per property
+        units = list(bc.unit_records(gc.my_units_snapshot()))
+        visible_units = list(bc.unit_records(gc.units_snapshot()))
+        team_array.TeamArray.getInstance().read(gc)
+        actions.Actions.getInstance().update(gc, units, visible_units)
+        unit_properties.UnitProperties.getInstance().update(gc)
+        remove_dead_units()
+        if gc.planet() == bc.Planet.Mars:
+            track_new_units(units)
+            update_asteroid_karbonite()
+        update_enemy_units_map(units)
+        update_my_units_map(units)
+        if gc.planet() == bc.Planet.Mars:
+            run_units(MARS_TURN_BUDGET)
+        else:
             update_strategy()
-            random.shuffle(my_units)
-            for unit in my_units:
-                if unit.unit():
-                    unit.run()
-        except Exception as e:
-            print('Error:', e)
-            # use this to show where the error was
-            traceback.print_exc()
-        gc.next_turn()
-        sys.stdout.flush()
-        sys.stderr.flush()
+            planner = rocket_planner.RocketPlanner.getInstance()
+            planner.update(gc, units, component_map)
+            planner.setEnemySightings(team_array.TeamArray.getInstance().enemySightings(
+                gc.round() - rocket_planner.MAX_SIGHTING_AGE))
+            run_units(math.inf)
+            update_team_array()
+        team_array.TeamArray.getInstance().write(gc)
+    except Exception as e:
+        print('Error:', e)
+        # use this to show where the error was
+        traceback.print_exc()
+    gc.next_turn()
+    sys.stdout.flush()
+    sys.stderr.flush()
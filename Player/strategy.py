@@ -18,6 +18,7 @@ class Strategy:
     research_strategy = [
         bc.UnitType.Worker,
         bc.UnitType.Ranger,
+        bc.UnitType.Rocket,
         bc.UnitType.Mage,
         bc.UnitType.Knight,
         bc.UnitType.Healer,
@@ -76,6 +77,15 @@ class Strategy:
     def setMaxUnit(self,max_amount):
         self.unit_information['max_amount'] = max_amount
 
+    def applyProfile(self, profile):
+        """Applies a strategy profile chosen by the map analysis."""
+        self.battle_strategy = BattleStrategy[profile['battle_strategy']]
+        self.enemy_start_close = profile['enemy_start_close']
+        if profile['min_units_offense'] is not None:
+            self.setMinUnitsOffense(profile['min_units_offense'])
+        if profile['max_units'] is not None:
+            self.setMaxUnit(dict(profile['max_units']))
+
 
     def addUnit(self, unitType):
         """Adds information regarding one type of unit existing."""
@@ -0,0 +1,136 @@
+"""The messages Earth and Mars send each other over the team array, the only
+channel between the two planets. Every planet writes its own array and reads
+the array of the other planet as it was COMMUNICATION_DELAY rounds before.
+
+The array is read once at the start of a turn and the changed entries are
+written once at the end of it. Every entry is a fixed-layout record packed
+into one int:
+
+    0        round the array was last written
+    1        karbonite the planet is saving up for
+    2        number of enemy sightings ever written
+    3-66     enemy sightings, a ring buffer of (round, x, y, unit type)
+
+The count is a sequence number, so a reader knows which records of the ring
+buffer it has not seen yet, and which ones were overwritten before it could.
+"""
+
+import battlecode as bc
+from collections import namedtuple
+
+ARRAY_LENGTH = 100
+
+ROUND = 0
+KARBONITE_NEED = 1
+SIGHTINGS_SEQUENCE = 2
+SIGHTINGS = SIGHTINGS_SEQUENCE + 1
+SIGHTING_SLOTS = 64
+
+# Most sightings a planet writes per turn, so a single fight does not flush
+# the whole ring buffer.
+MAX_SIGHTINGS_PER_TURN = 4
+# Rounds before an enemy seen at the same location is reported again.
+SIGHTING_REPEAT_ROUNDS = 25
+
+EnemySighting = namedtuple('EnemySighting', ['round', 'x', 'y', 'unit_type'])
+
+
+def pack_record(round, x, y, value):
+    """Packs a record into one int: the round in the low 10 bits, then 6 bits
+    for each coordinate and 4 bits for the value.
+    """
+    return round | x << 10 | y << 16 | value << 22
+
+
+def unpack_record(packed):
+    """Returns the (round, x, y, value) of a packed record."""
+    return packed & 0x3ff, packed >> 10 & 0x3f, packed >> 16 & 0x3f, packed >> 22 & 0xf
+
+
+def new_records(array, sequence_index, first_slot, nr_slots, last_sequence):
+    """Returns the records of a ring buffer written after the given sequence
+    number, oldest first, and the sequence number of the newest one. Records
+    that were overwritten before they could be read are lost.
+    """
+    sequence = array[sequence_index]
+    first = max(last_sequence, sequence - nr_slots)
+    records = [unpack_record(array[first_slot + i % nr_slots]) for i in range(first, sequence)]
+    return records, sequence
+
+
+class TeamArray:
+    __instance = None
+
+    def read(self, gc):
+        """Reads the array of the other planet in one go and collects the
+        records that are new since the last read.
+        """
+        array = list(gc.get_team_array(gc.planet().other()))
+        if array[ROUND] == self.received_round:
+            return
+        self.received_round = array[ROUND]
+        self.received_karbonite_need = array[KARBONITE_NEED]
+
+        records, self.sightings_read = new_records(
+            array, SIGHTINGS_SEQUENCE, SIGHTINGS, SIGHTING_SLOTS, self.sightings_read)
+        for round, x, y, unit_type in records:
+            self.sightings[(x, y)] = EnemySighting(round, x, y, bc.UnitType(unit_type))
+
+    def write(self, gc):
+        """Writes the entries that changed during the turn."""
+        self.array[ROUND] = gc.round()
+        for index, value in enumerate(self.array):
+            if value != self.written[index]:
+                gc.write_team_array(index, value)
+                self.written[index] = value
+        self.nr_sightings_this_turn = 0
+
+    def setKarboniteNeed(self, karbonite):
+        self.array[KARBONITE_NEED] = karbonite
+
+    def addEnemySighting(self, round, x, y, unit_type):
+        """Adds a sighting unless the enemy was reported at the same location
+        recently, or enough sightings were added this turn already.
+        """
+        if self.nr_sightings_this_turn >= MAX_SIGHTINGS_PER_TURN:
+            return
+        last_round = self.sent_sightings.get((x, y))
+        if last_round is not None and round - last_round < SIGHTING_REPEAT_ROUNDS:
+            return
+        self.sent_sightings[(x, y)] = round
+        self.nr_sightings_this_turn += 1
+        sequence = self.array[SIGHTINGS_SEQUENCE]
+        self.array[SIGHTINGS + sequence % SIGHTING_SLOTS] = pack_record(round, x, y, int(unit_type))
+        self.array[SIGHTINGS_SEQUENCE] = sequence + 1
+
+    def karboniteNeed(self):
+        """The karbonite the other planet is saving up for."""
+        return self.received_karbonite_need
+
+    def enemySightings(self, since_round=0):
+        """The latest enemy the other planet saw at every location, limited to
+        the sightings from the given round on.
+        """
+        return [sighting for sighting in self.sightings.values() if sighting.round >= since_round]
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if TeamArray.__instance == None:
+            TeamArray()
+        return TeamArray.__instance
+
+    def __init__(self):
+        """ Virtually private constructor. """
+        if TeamArray.__instance != None:
+            raise Exception("This class is a Singleton!")
+        else:
+            TeamArray.__instance = self
+            self.array = [0]*ARRAY_LENGTH
+            self.written = [0]*ARRAY_LENGTH
+            self.nr_sightings_this_turn = 0
+            self.sent_sightings = {}
+            self.received_round = 0
+            self.received_karbonite_need = 0
+            self.sightings_read = 0
+            self.sightings = {}
@@ -0,0 +1,191 @@
+"""Terrain analysis of a planet map. The passable area is split into regions
+grown from its wide open areas, and the borders between neighbouring regions
+are reported as chokes. Everything works on plain [x][y] grids, so no calls
+into the battlecode library are made.
+"""
+
+from collections import deque
+
+NEIGHBOUR_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+# Cells at least this far from impassable terrain or the map edge seed regions.
+REGION_CLEARANCE = 3
+# Open areas smaller than this are not worth a region of their own.
+MIN_REGION_AREA = 9
+# Chokes at most this many cells wide can be held by a few units.
+NARROW_CHOKE_WIDTH = 3
+
+
+def clearance_map(terrain_map):
+    """Returns the distance from every passable cell to the closest impassable
+    cell or map edge, counting diagonal steps as one. Impassable cells get 0.
+    """
+    width = len(terrain_map)
+    height = len(terrain_map[0])
+    clearance = [[0]*height for x in range(width)]
+
+    queue = deque()
+    for x in range(width):
+        for y in range(height):
+            if not terrain_map[x][y]:
+                continue
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                adjacent_x = x + dx
+                adjacent_y = y + dy
+                if adjacent_x < 0 or adjacent_x >= width or adjacent_y < 0 or adjacent_y >= height or not terrain_map[adjacent_x][adjacent_y]:
+                    clearance[x][y] = 1
+                    queue.append((x, y))
+                    break
+
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            adjacent_x = x + dx
+            adjacent_y = y + dy
+            if adjacent_x < 0 or adjacent_x >= width or adjacent_y < 0 or adjacent_y >= height:
+                continue
+            if terrain_map[adjacent_x][adjacent_y] and clearance[adjacent_x][adjacent_y] == 0:
+                clearance[adjacent_x][adjacent_y] = clearance[x][y] + 1
+                queue.append((adjacent_x, adjacent_y))
+
+    return clearance
+
+
+def _flood(cells, region_map, label, allowed):
+    """Labels every cell connected to the given ones that passes the allowed
+    check, and returns the labelled cells.
+    """
+    width = len(region_map)
+    height = len(region_map[0])
+    labelled = list(cells)
+    for x, y in cells:
+        region_map[x][y] = label
+    queue = deque(cells)
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            adjacent_x = x + dx
+            adjacent_y = y + dy
+            if adjacent_x < 0 or adjacent_x >= width or adjacent_y < 0 or adjacent_y >= height:
+                continue
+            if region_map[adjacent_x][adjacent_y] == -1 and allowed(adjacent_x, adjacent_y):
+                region_map[adjacent_x][adjacent_y] = label
+                labelled.append((adjacent_x, adjacent_y))
+                queue.append((adjacent_x, adjacent_y))
+    return labelled
+
+
+def find_regions(terrain_map, clearance):
+    """Splits the passable cells into regions. Every open area seeds a region,
+    and the regions are then grown together until they meet, like a watershed
+    over the clearance map. Returns the region grid, -1 for impassable cells,
+    and the number of regions.
+    """
+    width = len(terrain_map)
+    height = len(terrain_map[0])
+    region_map = [[-1]*height for x in range(width)]
+
+    # Seed a region from every large enough open area
+    seeds = []
+    for x in range(width):
+        for y in range(height):
+            if clearance[x][y] >= REGION_CLEARANCE and region_map[x][y] == -1:
+                area = _flood([(x, y)], region_map, len(seeds), lambda ax, ay: clearance[ax][ay] >= REGION_CLEARANCE)
+                if len(area) >= MIN_REGION_AREA:
+                    seeds.append(area)
+                else:
+                    for ax, ay in area:
+                        region_map[ax][ay] = -2
+
+    for x in range(width):
+        for y in range(height):
+            if region_map[x][y] == -2:
+                region_map[x][y] = -1
+
+    # Grow all regions at the same pace so they meet half way through chokes
+    queue = deque(cell for area in seeds for cell in area)
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            adjacent_x = x + dx
+            adjacent_y = y + dy
+            if adjacent_x < 0 or adjacent_x >= width or adjacent_y < 0 or adjacent_y >= height:
+                continue
+            if terrain_map[adjacent_x][adjacent_y] and region_map[adjacent_x][adjacent_y] == -1:
+                region_map[adjacent_x][adjacent_y] = region_map[x][y]
+                queue.append((adjacent_x, adjacent_y))
+
+    # Passable areas without any open space become a region of their own
+    nr_regions = len(seeds)
+    for x in range(width):
+        for y in range(height):
+            if terrain_map[x][y] and region_map[x][y] == -1:
+                _flood([(x, y)], region_map, nr_regions, lambda ax, ay: terrain_map[ax][ay])
+                nr_regions += 1
+
+    return region_map, nr_regions
+
+
+def find_chokes(region_map):
+    """Finds the chokes between neighbouring regions. A choke is a connected
+    group of cells on the border of one region next to another region. Returns
+    dicts with the location in the middle of the choke, its width in cells and
+    the pair of regions it separates.
+    """
+    width = len(region_map)
+    height = len(region_map[0])
+
+    # Border cells of the lower numbered region, grouped by region pair
+    borders = {}
+    for x in range(width):
+        for y in range(height):
+            region = region_map[x][y]
+            if region == -1:
+                continue
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                adjacent_x = x + dx
+                adjacent_y = y + dy
+                if adjacent_x < 0 or adjacent_x >= width or adjacent_y < 0 or adjacent_y >= height:
+                    continue
+                other = region_map[adjacent_x][adjacent_y]
+                if other > region:
+                    borders.setdefault((region, other), set()).add((x, y))
+
+    chokes = []
+    for regions, cells in sorted(borders.items()):
+        cells = set(cells)
+        while cells:
+            # Split the border into connected groups, one choke each
+            start = cells.pop()
+            group = [start]
+            queue = deque([start])
+            while queue:
+                x, y = queue.popleft()
+                for dx, dy in NEIGHBOUR_OFFSETS:
+                    adjacent = (x + dx, y + dy)
+                    if adjacent in cells:
+                        cells.remove(adjacent)
+                        group.append(adjacent)
+                        queue.append(adjacent)
+
+            center_x = sum(x for x, y in group) / len(group)
+            center_y = sum(y for x, y in group) / len(group)
+            location = min(group, key=lambda cell: ((cell[0] - center_x) ** 2 + (cell[1] - center_y) ** 2, cell))
+            chokes.append({
+                'location': location,
+                'width': len(group),
+                'regions': regions
+            })
+
+    return chokes
+
+
+def analyse(terrain_map):
+    """Returns the region grid, the number of regions and the chokes of a map."""
+    clearance = clearance_map(terrain_map)
+    region_map, nr_regions = find_regions(terrain_map, clearance)
+    return {
+        'regions': region_map,
+        'nr_regions': nr_regions,
+        'chokes': find_chokes(region_map)
+    }
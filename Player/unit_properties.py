@@ -0,0 +1,70 @@
+"""Caches the properties every unit of a type shares, like its ranges and
+maximum health. They only change when the type is upgraded, so they are
+read from a unit once per research level instead of once per tick.
+"""
+
+import battlecode as bc
+from collections import namedtuple
+
+Properties = namedtuple('Properties', [
+    'vision_range', 'max_health', 'attack_range', 'ability_range', 'cannot_attack_range'
+])
+
+ROBOTS = [bc.UnitType.Worker, bc.UnitType.Knight, bc.UnitType.Ranger, bc.UnitType.Mage, bc.UnitType.Healer]
+
+
+def read_properties(unit_type, unit):
+    """Reads the properties of a unit type from a unit of that type. Ranges
+    that do not apply to the type are 0.
+    """
+    attack_range = 0
+    ability_range = 0
+    cannot_attack_range = 0
+    if unit_type in ROBOTS:
+        attack_range = unit.attack_range()
+        ability_range = unit.ability_range()
+    if unit_type == bc.UnitType.Ranger:
+        cannot_attack_range = unit.ranger_cannot_attack_range()
+    return Properties(unit.vision_range, unit.max_health, attack_range, ability_range, cannot_attack_range)
+
+
+class UnitProperties:
+    __instance = None
+
+    def update(self, gc):
+        """Forgets the properties of the unit types whose research level
+        changed since the last turn.
+        """
+        research_info = gc.research_info()
+        for unit_type in bc.UnitType:
+            level = research_info.get_level(unit_type)
+            if level != self.levels[unit_type]:
+                self.levels[unit_type] = level
+                self.properties.pop(unit_type, None)
+
+    def get(self, unit_type, unit):
+        """Gets the properties of a unit type. The unit is a function that
+        returns a unit of the type, only called when the properties have not
+        been read at the current research level yet.
+        """
+        properties = self.properties.get(unit_type)
+        if properties is None:
+            properties = read_properties(unit_type, unit())
+            self.properties[unit_type] = properties
+        return properties
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if UnitProperties.__instance == None:
+            UnitProperties()
+        return UnitProperties.__instance
+
+    def __init__(self):
+        """ Virtually private constructor. """
+        if UnitProperties.__instance != None:
+            raise Exception("This class is a Singleton!")
+        else:
+            UnitProperties.__instance = self
+            self.levels = {unit_type: 0 for unit_type in bc.UnitType}
+            self.properties = {}
@@ -4,15 +4,21 @@ import behaviour_tree as bt
 import random
 import strategy
 import astar
+import actions
+import rocket_planner
+import unit_properties
 
 class Unit(ABC):
     """An abstract class container for units. Contains the tree for the unit
     and the battlecode unit reference. Subclasses must implement a tree
-    generation function.
+    generation function. Subclasses set the unit type they contain.
     """
+    unit_type = None
+
     def __init__(self, unit, gc):
         self._unit = unit
         self._gc = gc
+        self._actions = actions.Actions.getInstance()
         self._tree = self.generate_tree()
 
     @abstractmethod
@@ -36,6 +42,52 @@ class Unit(ABC):
     def unit(self):
         return self.get_friendly_unit(self._unit)
 
+    def unit_id(self):
+        return self._unit
+
+    def properties(self):
+        """Gets the ranges and maximum health shared by all units of this
+        unit's type, without asking the game for them.
+        """
+        return unit_properties.UnitProperties.getInstance().get(self.unit_type, self.unit)
+
     def run(self):
         """Runs the unit's behaviour tree and returns the result."""
         return self._tree.run()
+
+    ############
+    # BOARDING #
+    ############
+
+    class AssignedToRocket(bt.Condition):
+        """Determines if the rocket planner wants the unit to board a rocket."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def condition(self):
+            return rocket_planner.RocketPlanner.getInstance().rocketLocation(self.__outer._unit) is not None
+
+    class MoveToRocket(bt.Action):
+        """Moves next to the assigned rocket, where the rocket loads the unit."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def action(self):
+            unit = self.__outer.unit()
+            rocket_location = rocket_planner.RocketPlanner.getInstance().rocketLocation(unit.id)
+            location = unit.location.map_location()
+            if location.is_adjacent_to(rocket_location):
+                self._status = bt.Status.SUCCESS
+                return
+
+            self._status = bt.Status.RUNNING
+            if not self.__outer._actions.isMoveReady(unit.id):
+                return
+            direction = location.direction_to(rocket_location)
+            for move_direction in [direction, direction.rotate_left(), direction.rotate_right()]:
+                if self.__outer._actions.canMove(unit.id, move_direction):
+                    self.__outer._actions.move(unit.id, move_direction)
+                    return
+            self._status = bt.Status.FAIL
@@ -3,10 +3,15 @@ import behaviour_tree as bt
 import random
 import strategy
 import astar
+import map_analysis
 import units
+import rocket_planner
+from rocket import Rocket
 
 class Worker(units.Unit):
     """The container for the worker unit."""
+    unit_type = bc.UnitType.Worker
+
     def __init__(self, unit, gc, maps, my_units):
         super().__init__(unit, gc)
         self._maps = maps
@@ -33,11 +38,24 @@ class Worker(units.Unit):
         enemies.add_child(self.MoveAwayFromEnemy(self))
         tree.add_child(enemies)
 
+        # Board the rocket assigned by the planner
+        board = bt.Sequence()
+        board.add_child(self.AssignedToRocket(self))
+        board.add_child(self.MoveToRocket(self))
+        tree.add_child(board)
+
         # Move towards blueprints with no workers
         #find_blueprint = bt.Sequence()
 
         #tree.add_child(find_blueprint)
 
+        # Add rocket blueprints
+        add_rocket_blueprint = bt.Sequence()
+        add_rocket_blueprint.add_child(self.NeedRocket(self))
+        add_rocket_blueprint.add_child(self.EnoughKarboniteToBuildRocket(self))
+        add_rocket_blueprint.add_child(self.AddBlueprint(self, bc.UnitType.Rocket))
+        tree.add_child(add_rocket_blueprint)
+
         # Add blueprints
         add_blueprint = bt.Sequence()
         add_blueprint.add_child(self.NeedAnotherFactory(self))
@@ -78,7 +96,9 @@ class Worker(units.Unit):
     # BUILDING #
     ############
     class BlueprintAdjacent(bt.Condition):
-        """Determines if there is a blueprint in an adjacent square."""
+        """Determines if there is a factory or rocket blueprint in an
+        adjacent square.
+        """
         def __init__(self, outer):
             super().__init__()
             self.__outer = outer
@@ -93,15 +113,16 @@ class Worker(units.Unit):
                 self.__outer._blueprint_to_build_on = None
 
 
-            # Look for factories that are not built yet
+            # Look for factories and rockets that are not built yet
             location = worker.location
             if location.is_on_map():
-                nearby_factories = self.__outer._gc.sense_nearby_units_by_type(location.map_location(), 2, bc.UnitType.Factory)
-                for factory in nearby_factories:
-                    if self.__outer._gc.can_build(worker.id, factory.id):
-                        # Found factory
-                        self.__outer._blueprint_to_build_on = factory.id
-                        return True
+                for unit_type in [bc.UnitType.Rocket, bc.UnitType.Factory]:
+                    nearby_blueprints = self.__outer._gc.sense_nearby_units_by_type(location.map_location(), 2, unit_type)
+                    for blueprint in nearby_blueprints:
+                        if self.__outer._gc.can_build(worker.id, blueprint.id):
+                            # Found blueprint
+                            self.__outer._blueprint_to_build_on = blueprint.id
+                            return True
             return False
 
     class BuildBlueprint(bt.Action):
@@ -123,13 +144,20 @@ class Worker(units.Unit):
                 if self.__outer.get_friendly_unit(factory.id).structure_is_built():
                     self.__outer._blueprint_to_build_on = None
 
-                    from factory import Factory
-                    self.__outer._my_units.append(Factory(
-                        factory.id,
-                        self.__outer._gc,
-                        self.__outer._maps,
-                        self.__outer._my_units
-                    ))
+                    if factory.unit_type == bc.UnitType.Rocket:
+                        self.__outer._my_units.append(Rocket(
+                            factory.id,
+                            self.__outer._gc,
+                            self.__outer._maps
+                        ))
+                    else:
+                        from factory import Factory
+                        self.__outer._my_units.append(Factory(
+                            factory.id,
+                            self.__outer._gc,
+                            self.__outer._maps,
+                            self.__outer._my_units
+                        ))
 
                     self._status = bt.Status.SUCCESS
                 else:
@@ -151,7 +179,7 @@ class Worker(units.Unit):
             if location.is_on_map():
                 # Determines if we can see some enemy units beside workers and factories.
                 enemy_team = bc.Team.Red if self.__outer._gc.team() == bc.Team.Blue else bc.Team.Blue
-                nearby_enemy_units = self.__outer._gc.sense_nearby_units_by_team(location.map_location(), worker.vision_range, enemy_team)
+                nearby_enemy_units = self.__outer._gc.sense_nearby_units_by_team(location.map_location(), self.__outer.properties().vision_range, enemy_team)
                 for enemy in nearby_enemy_units:
                     if enemy.unit_type != bc.UnitType.Factory and enemy.unit_type != bc.UnitType.Worker:
                         return True
@@ -170,7 +198,7 @@ class Worker(units.Unit):
             if location.is_on_map():
                 # Determines if we can see some enemy units beside workers and factories.
                 enemy_team = bc.Team.Red if self.__outer._gc.team() == bc.Team.Blue else bc.Team.Blue
-                nearby_enemy_units = self.__outer._gc.sense_nearby_units_by_team(location.map_location(), worker.vision_range, enemy_team)
+                nearby_enemy_units = self.__outer._gc.sense_nearby_units_by_team(location.map_location(), self.__outer.properties().vision_range, enemy_team)
                 for nearby_enemy in nearby_enemy_units:
                     if nearby_enemy.unit_type != bc.UnitType.Factory and nearby_enemy.unit_type != bc.UnitType.Worker:
                         enemy = nearby_enemy
@@ -180,8 +208,8 @@ class Worker(units.Unit):
                 enemy_direction = worker.location.map_location().direction_to(enemy.location.map_location())
                 opposite_direction_position = worker.location.map_location().subtract(enemy_direction)
                 opposite_direction = worker.location.map_location().direction_to(opposite_direction_position)
-                if self.__outer._gc.is_move_ready(worker.id) and self.__outer._gc.can_move(worker.id, opposite_direction):
-                    self.__outer._gc.move_robot(worker.id, opposite_direction)
+                if self.__outer._actions.isMoveReady(worker.id) and self.__outer._actions.canMove(worker.id, opposite_direction):
+                    self.__outer._actions.move(worker.id, opposite_direction)
                     self._status = bt.Status.SUCCESS
                 else:
                     self._status = bt.Status.FAIL
@@ -206,25 +234,47 @@ class Worker(units.Unit):
             self.__outer = outer
 
         def condition(self):
-            return self.__outer._gc.karbonite() >= bc.UnitType.Factory.blueprint_cost()
+            reserved = rocket_planner.RocketPlanner.getInstance().reservedKarbonite()
+            return self.__outer._gc.karbonite() - reserved >= bc.UnitType.Factory.blueprint_cost()
+
+    class NeedRocket(bt.Condition):
+        """Determines if the rocket planner wants another rocket."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def condition(self):
+            return rocket_planner.RocketPlanner.getInstance().needRocket()
+
+    class EnoughKarboniteToBuildRocket(bt.Condition):
+        """Determines if we have enough karbonite to build a Rocket."""
+        def __init__(self, outer):
+            super().__init__()
+            self.__outer = outer
+
+        def condition(self):
+            return self.__outer._gc.karbonite() >= bc.UnitType.Rocket.blueprint_cost()
 
     class AddBlueprint(bt.Action):
         """Adds one blueprint to any of the adjacent cells if possible."""
-        def __init__(self, outer):
+        def __init__(self, outer, unit_type=bc.UnitType.Factory):
             super().__init__()
             self.__outer = outer
+            self.__unit_type = unit_type
 
         def action(self):
             blueprint_added = False
             worker = self.__outer.unit()
             for dir in list(bc.Direction):
-                if self.__outer._gc.can_blueprint(worker.id, bc.UnitType.Factory, dir):
+                if not self.__outer._actions.isOccupiable(worker.id, dir):
+                    continue
+                if self.__outer._gc.can_blueprint(worker.id, self.__unit_type, dir):
                     proposed_placement = worker.location.map_location().add(dir)
 
-                    # Check that we have no adjacent factories.
+                    # Check that we have no adjacent factories or rockets.
                     factory_too_close = False
                     for unit in self.__outer._gc.sense_nearby_units_by_team(proposed_placement, 2, self.__outer._gc.team()):
-                        if unit.unit_type == bc.UnitType.Factory:
+                        if unit.unit_type == bc.UnitType.Factory or unit.unit_type == bc.UnitType.Rocket:
                             factory_too_close = True
                     if factory_too_close:
                         continue
@@ -245,7 +295,8 @@ class Worker(units.Unit):
                     if (x-1 < 0 or not map[x-1][y]) and (x+1 >= width or not map[x+1][y]):
                         continue
 
-                    self.__outer._gc.blueprint(worker.id, bc.UnitType.Factory, dir)
+                    self.__outer._gc.blueprint(worker.id, self.__unit_type, dir)
+                    self.__outer._actions.occupy(worker.id, dir)
                     blueprint_added = True
                     break
             if blueprint_added:
@@ -273,7 +324,14 @@ class Worker(units.Unit):
             else:
                 self.__outer.karbonite_to_mine = None
 
+            karbonite_map = self.__outer._maps['karbonite_map']
+            known = self.__outer._actions.position(worker.id) is not None
             for dir in list(bc.Direction):
+                # Only ask the game about the cells we know have karbonite
+                if known:
+                    location = self.__outer._actions.adjacent(worker.id, dir)
+                    if location is None or karbonite_map[location[0]][location[1]] <= 0:
+                        continue
                 if self.__outer._gc.can_harvest(worker.id, dir):
                     self.__outer._karbonite_to_mine = dir
                     return True
@@ -352,10 +410,10 @@ class Worker(units.Unit):
             worker = self.__outer.unit()
             unit_map_location = worker.location.map_location()
             move_direction = unit_map_location.direction_to(next_point)
-            if self.__outer._gc.can_move(worker.id, move_direction):
+            if self.__outer._actions.canMove(worker.id, move_direction):
                 self._status = bt.Status.RUNNING
-                if self.__outer._gc.is_move_ready(worker.id):
-                    self.__outer._gc.move_robot(worker.id, move_direction)
+                if self.__outer._actions.isMoveReady(worker.id):
+                    self.__outer._actions.move(worker.id, move_direction)
                     self.__outer._path_to_follow.pop(0)
                     if len(self.__outer._path_to_follow) == 1:
                         self.__outer._path_to_follow = None
@@ -396,7 +454,8 @@ class Worker(units.Unit):
             my_units_map = self.__outer._maps['my_units_map']
             worker = self.__outer.unit()
             unit_map_location = worker.location.map_location()
-            path = astar.astar(terrain_map, my_units_map, unit_map_location, karbonite_location)
+            component_map = self.__outer._maps['component_map']
+            path = astar.astar(terrain_map, my_units_map, unit_map_location, karbonite_location, components=component_map)
             if len(path) > 0:
                 path.pop(0) # Remove the point the unit is already on
                 self.__outer._path_to_follow = path
@@ -413,11 +472,15 @@ class Worker(units.Unit):
 
         def action(self):
             karbonite_map = self.__outer._maps['karbonite_map']
+            component_map = self.__outer._maps['component_map']
             width = len(karbonite_map)
             height = len(karbonite_map[0])
             length = 2
             worker = self.__outer.unit()
             location = worker.location.map_location()
+            planet = location.planet
+            location_x = location.x
+            location_y = location.y
             cells_left = True
 
             while cells_left and len(self.__outer._nearby_karbonite_locations) <= 3:
@@ -428,17 +491,21 @@ class Worker(units.Unit):
                         if abs(x) <= length-1 and abs(y) <= length-1:
                             continue
 
-                        possible_location = location.translate(x, y)
+                        possible_x = location_x + x
+                        possible_y = location_y + y
 
                         # Check if location is outside of the map
-                        if possible_location.x < 0 or possible_location.y < 0 or possible_location.x >= width or possible_location.y >= height:
+                        if possible_x < 0 or possible_y < 0 or possible_x >= width or possible_y >= height:
                             continue
 
                         cells_left = True
 
-                        # Determine if there is karbonite at the location
-                        if karbonite_map[possible_location.x][possible_location.y] > 0:
-                            self.__outer._nearby_karbonite_locations.append(possible_location)
+                        # Determine if there is karbonite at the location,
+                        # on the component of the worker
+                        if karbonite_map[possible_x][possible_y] > 0:
+                            karbonite_location = bc.MapLocation(planet, possible_x, possible_y)
+                            if map_analysis.is_reachable(component_map, location, karbonite_location):
+                                self.__outer._nearby_karbonite_locations.append(karbonite_location)
                 length += 1
 
             if (len(self.__outer._nearby_karbonite_locations) > 0):
@@ -455,8 +522,8 @@ class Worker(units.Unit):
         def action(self):
             worker = self.__outer.unit()
             random_dir = random.choice(list(bc.Direction))
-            if self.__outer._gc.is_move_ready(worker.id) and self.__outer._gc.can_move(worker.id, random_dir):
-                self.__outer._gc.move_robot(worker.id, random_dir)
+            if self.__outer._actions.isMoveReady(worker.id) and self.__outer._actions.canMove(worker.id, random_dir):
+                self.__outer._actions.move(worker.id, random_dir)
                 self._status = bt.Status.SUCCESS
             else:
                 self._status = bt.Status.FAIL
@@ -0,0 +1,478 @@
+'''
+An asyncio implementation of the server the players and the viewer connect
+to. It speaks the same newline delimited JSON protocol as server.py, but runs
+every connection of a game as a coroutine on one event loop instead of a
+thread per connection, and hands the turn from one player to the next with
+explicit awaits.
+
+start_server and start_viewer_server take the same arguments as the ones in
+server.py, and return objects with the same shutdown and server_close methods.
+'''
+
+import asyncio
+import json
+import logging
+import threading
+import time
+import weakref
+import battlecode as bc
+import server
+
+# Longest line a connection may send. The start messages hold the whole map.
+LINE_LIMIT = 2**26
+
+
+class GameLoop(object):
+    '''
+    The event loop of one game, running on a thread of its own. Holds the
+    turn of every player as an asyncio event, and wakes everyone up when the
+    game is over.
+    '''
+
+    def __init__(self, game, dockers):
+        self.game = game
+        self.dockers = dockers
+        self.loop = asyncio.new_event_loop()
+        self.servers = []
+        self.tasks = set()
+        self.viewer_events = set()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.run(self._init_events())
+
+        # The game is also ended from other threads, like the one running the game
+        watcher = threading.Thread(target=self._watch_game_over, daemon=True)
+        watcher.start()
+
+    async def _init_events(self):
+        # Events bind to the loop they are created in on older pythons
+        self.started = asyncio.Event()
+        self.turns = [asyncio.Event() for _ in self.game.players]
+
+    def _watch_game_over(self):
+        self.game.wait_for_game_over()
+        try:
+            self.loop.call_soon_threadsafe(self.wake)
+        except RuntimeError:
+            # The loop was closed before the game ended
+            pass
+
+    def run(self, coroutine):
+        '''
+        Runs a coroutine on the loop from another thread and returns its result.
+        '''
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def spawn(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def wake(self):
+        '''
+        Wakes up every player and viewer, to see that the game is over.
+        '''
+        self.started.set()
+        for turn in self.turns:
+            turn.set()
+        self.notify_viewers()
+
+    def notify_viewers(self):
+        for event in self.viewer_events:
+            event.set()
+
+    def begin(self):
+        '''
+        Hands the first turn out once every player logged in.
+        '''
+        if self.game.started and not self.started.is_set():
+            self.started.set()
+            self.turns[self.game.current_player_index].set()
+
+    async def wait_for_turn(self, player_index):
+        '''
+        Waits until it is the player's turn. Returns False if the game ended
+        instead.
+        '''
+        await self.turns[player_index].wait()
+        self.turns[player_index].clear()
+        return not self.game.game_over
+
+    async def blocking(self, function, *args):
+        '''
+        Runs blocking work, like a docker call or applying a turn in the
+        engine, on a thread, so the other connections and the viewer keep
+        being served meanwhile.
+        '''
+        return await self.loop.run_in_executor(None, function, *args)
+
+    async def end_turn(self):
+        '''
+        Ends the turn of the current player and wakes up the next one.
+        '''
+        if self.game.extra_delay:
+            await asyncio.sleep(self.game.extra_delay / 1000.)
+        await self.blocking(self.game.end_turn, False)
+        self.turns[self.game.current_player_index].set()
+        self.notify_viewers()
+
+    async def _serve(self, address, handler):
+        if isinstance(address, tuple):
+            return await asyncio.start_server(handler, *address, limit=LINE_LIMIT)
+        return await asyncio.start_unix_server(handler, address, limit=LINE_LIMIT)
+
+    def start(self, address, handler):
+        '''
+        Starts listening on a tcp (host, port) tuple or a unix socket file.
+        '''
+        listener = self.run(self._serve(address, self._handle(handler)))
+        self.servers.append(listener)
+        return ServerHandle(self, listener)
+
+    def _handle(self, handler):
+        async def handle(reader, writer):
+            task = self.spawn(handler(reader, writer))
+            try:
+                await task
+            except (server.TimeoutError, ConnectionError, asyncio.CancelledError):
+                pass
+            finally:
+                writer.close()
+        return handle
+
+    async def _close(self, listener):
+        listener.close()
+        self.servers.remove(listener)
+        if not self.servers:
+            for task in list(self.tasks):
+                task.cancel()
+            if self.tasks:
+                await asyncio.wait(list(self.tasks))
+
+    def close(self, listener):
+        self.run(self._close(listener))
+        if not self.servers:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+            _loops.pop(self.game, None)
+
+
+class ServerHandle(object):
+    '''
+    Stands in for a socketserver, so run_game can shut both kinds down the
+    same way.
+    '''
+
+    def __init__(self, game_loop, listener):
+        self.game_loop = game_loop
+        self.listener = listener
+        self.closed = False
+
+    def shutdown(self):
+        if not self.closed:
+            self.closed = True
+            self.game_loop.close(self.listener)
+
+    def server_close(self):
+        pass
+
+
+class PlayerConnection(object):
+    '''
+    The protocol of one player connection, from logging in to the end of the
+    game.
+    '''
+
+    def __init__(self, game_loop, reader, writer):
+        self.game_loop = game_loop
+        self.game = game_loop.game
+        self.reader = reader
+        self.writer = writer
+        self.client_id = 0
+        self.error = ""
+        self.logged_in = False
+        self.timed_out_logged = False
+        self.wire = server.WIRE_JSON
+
+    async def _read(self):
+        if self.wire == server.WIRE_FRAMED:
+            header = await self.reader.readexactly(server.FRAME_HEADER.size)
+            (length,) = server.FRAME_HEADER.unpack(header)
+            if length > server.MAX_FRAME:
+                raise IOError("frame of {} bytes is too long".format(length))
+            return await self.reader.readexactly(length)
+        data = await self.reader.readline()
+        if not data.endswith(b'\n'):
+            raise IOError("reached socket EOF before finding newline")
+        return data.strip()
+
+    async def read_line(self):
+        '''
+        Returns the next message the player sent, as bytes without the
+        newline or the length.
+        '''
+        try:
+            return await asyncio.wait_for(self._read(), server.TIMEOUT)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, IOError, ValueError):
+            if self.logged_in:
+                print("{} has not sent message for {} seconds, assuming they're dead".format(
+                    self.game.get_player(self.client_id).player,
+                    server.TIMEOUT
+                ))
+                self.game.forfeit(self.client_id)
+            raise server.TimeoutError()
+
+    async def send_message(self, message):
+        '''
+        Sends a newline delimited message, a str or bytes, to the player, or
+        a length prefixed one on the framed wire format.
+        '''
+        if self.wire == server.WIRE_FRAMED:
+            message = server.frame(message)
+        elif isinstance(message, str):
+            message = message.encode()
+        logging.debug("Client %s: Sending message %s", self.client_id, message)
+        try:
+            self.writer.write(message)
+            if self.wire != server.WIRE_FRAMED:
+                self.writer.write(b"\n")
+            await asyncio.wait_for(self.writer.drain(), server.TIMEOUT)
+        except (asyncio.TimeoutError, IOError):
+            if self.logged_in:
+                print("{} has not accepted message for {} seconds, assuming they're dead".format(
+                    self.game.get_player(self.client_id).player,
+                    server.TIMEOUT
+                ))
+                self.game.forfeit(self.client_id)
+            raise server.TimeoutError()
+
+    def message(self, state_diff, wire=None):
+        '''
+        Wraps the state sent to the player in the message envelope. A
+        StartTurnMessage is serialized straight into the message buffer. The
+        reply to a login tells the player which wire format it gets from then
+        on.
+        '''
+        error = json.dumps(self.error) if self.error else "null"
+        logged_in = "true" if self.logged_in else "false"
+        # Leave room for the length of a framed message
+        message = bytearray(server.FRAME_HEADER.size if self.wire == server.WIRE_FRAMED else 0)
+        if wire is not None:
+            message += '{{"wire":"{}",'.format(wire).encode()
+        else:
+            message += b'{'
+        message += '"logged_in":{},"client_id":"{}","error":{},"message":'.format(logged_in, self.client_id, error).encode()
+        if isinstance(state_diff, str):
+            message += state_diff.encode() if state_diff else b'""'
+        else:
+            state_diff.write_json(message, len(message))
+        message += b'}'
+        return message
+
+    async def login(self):
+        while not self.logged_in and not self.game.game_over:
+            unpacked_data = json.loads(await self.read_line())
+            verify_out = self.game.verify_login(unpacked_data)
+
+            self.error = ""
+            if not isinstance(verify_out, int):
+                self.error = verify_out
+                logging.warning("Client failed to log in error: %s", self.client_id)
+            else:
+                logging.info("Client %s: logged in succesfully", self.client_id)
+                self.logged_in = True
+                self.client_id = verify_out
+                self.game.player_connected(self.client_id)
+                self.game.get_player(self.client_id).built_successfully = True
+                self.game_loop.begin()
+
+            # Only players that asked for another wire format are told
+            wire = server.wire_format(unpacked_data) if self.logged_in else server.WIRE_JSON
+            await self.send_message(self.message("", wire if wire != server.WIRE_JSON else None))
+
+        # Switch to the wire format the player asked for, after the reply to
+        # its login went out as a line
+        if self.logged_in:
+            self.wire = wire
+
+    async def play(self):
+        game = self.game
+        await self.login()
+        if game.game_over:
+            return
+
+        await self.game_loop.started.wait()
+        logging.info("Client %s: Game started", self.client_id)
+
+        # Every turn only touches the state of this player
+        me = game.get_player(self.client_id)
+        my_sandbox = self.game_loop.dockers[self.client_id]
+        running_stats = me.running_stats
+
+        # average time used, in seconds
+        atu = 0
+
+        while not game.game_over:
+            if not await self.game_loop.wait_for_turn(me.index):
+                return
+            game.begin_turn(self.client_id)
+
+            if game.manager.is_over():
+                game.game_over = True
+                await self.game_loop.end_turn()
+                return
+
+            logging.debug("Client %s: Started turn", self.client_id)
+
+            if game.initialized > 3:
+                start_turn_msg = self.message(game.last_message)
+            else:
+                start_turn_msg = self.message(me.start_message)
+                running_stats["lng"] = await self.game_loop.blocking(my_sandbox.guess_language)
+                running_stats["bld"] = False
+
+            if game.initialized <= 3:
+                await self.game_loop.blocking(my_sandbox.unpause)
+                await self.send_message(start_turn_msg)
+                game.initialized += 1
+                await self.game_loop.end_turn()
+                continue
+
+            if me.time_left > 0:
+                await self.game_loop.blocking(my_sandbox.unpause)
+
+                start_time = time.perf_counter()
+                start_time_python = time.process_time()
+                await self.send_message(start_turn_msg)
+                data = await self.read_line()
+                end_time_python = time.process_time()
+                end_time = time.perf_counter()
+
+                diff_time = (end_time - start_time) - (end_time_python - start_time_python)
+
+                await self.game_loop.blocking(my_sandbox.pause)
+
+                try:
+                    sent_message = await self.game_loop.blocking(bc.SentMessage.from_json_bytes, data)
+                except Exception as e:
+                    print("Error deserializing JSON")
+                    print(e)
+                    print("Killing player...")
+                    game.forfeit(self.client_id)
+                    return
+
+                assert int(sent_message.client_id) == self.client_id, \
+                        "Wrong client id: {}, should be: {}".format(sent_message.client_id, self.client_id)
+
+                turn_message = sent_message.turn_message
+            else:
+                if not self.timed_out_logged:
+                    self.timed_out_logged = True
+                    me.logger(b'PLAYER HAS TIMED OUT!!!')
+                # 1 second; never let them play again
+                diff_time = 1
+                turn_message = bc.TurnMessage.from_json('{"changes":[]}')
+
+            atu = atu * .9 + diff_time * .1
+
+            # convert to ms
+            running_stats["tl"] = int(me.time_left * 1000)
+            running_stats["atu"] = int(atu * 1000)
+
+            await self.game_loop.blocking(game.make_action, turn_message, self.client_id, diff_time)
+            await self.game_loop.end_turn()
+
+
+async def _wait_for_connections(game):
+    await asyncio.sleep(server.BUILD_TIMEOUT)
+    for player in game.players:
+        if not player.built_successfully:
+            print('Player failed to connect to manager after', server.BUILD_TIMEOUT, 'seconds:', player.player)
+            if bc.Team.Red == player.player.team:
+                game.winner = 'player2'
+            else:
+                game.winner = 'player1'
+            game.disconnected = True
+            game.game_over = True
+
+
+# The loop of every game that has a server running, so the player and the
+# viewer server of a game share one
+_loops = weakref.WeakKeyDictionary()
+
+
+def _game_loop(game, dockers):
+    game_loop = _loops.get(game)
+    if game_loop is None:
+        game_loop = GameLoop(game, dockers)
+        _loops[game] = game_loop
+    elif dockers:
+        game_loop.dockers = dockers
+    return game_loop
+
+
+def start_server(sock_file, game, dockers, use_docker=True):
+    '''
+    Start the server for the players to connect to, on the event loop of the
+    game
+    Args:
+        sock_file: The unix socket file, or a (host, port) tuple for tcp
+
+        game: The game information that is being run
+
+        dockers: The player sandboxes, by client id
+
+    Return:
+        The server, with shutdown and server_close methods
+    '''
+    game_loop = _game_loop(game, dockers)
+
+    async def handle(reader, writer):
+        await PlayerConnection(game_loop, reader, writer).play()
+
+    handle_server = game_loop.start(sock_file, handle)
+    game_loop.loop.call_soon_threadsafe(game_loop.spawn, _wait_for_connections(game))
+    logging.info("Server Started at %s", sock_file)
+    return handle_server
+
+
+def start_viewer_server(port, game):
+    '''
+    Start the server for the viewer to connect to, on the event loop of the
+    game
+    Args:
+        port: port to connect to viewer on
+
+        game: The game information that is being run
+
+    Return:
+        The server, with shutdown and server_close methods
+    '''
+    game_loop = _game_loop(game, {})
+    # A viewer connecting later needs every message from the first one
+    game.viewer_messages.spill_to_disk()
+
+    async def handle(reader, writer):
+        new_messages = asyncio.Event()
+        game_loop.viewer_events.add(new_messages)
+        reader = game.viewer_messages.reader()
+        try:
+            while True:
+                # Messages a viewer fell behind on are read back from disk
+                for message in await game_loop.blocking(reader.read):
+                    writer.write(message.encode())
+                    writer.write(b"\n")
+                await writer.drain()
+                if reader.pending():
+                    continue
+                if game.game_over:
+                    return
+                await new_messages.wait()
+                new_messages.clear()
+        finally:
+            reader.close()
+            game_loop.viewer_events.discard(new_messages)
+
+    return game_loop.start(('localhost', port), handle)
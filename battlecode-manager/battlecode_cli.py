@@ -6,11 +6,15 @@ This file contains contains the CLI that starts games up
 import time
 import os
 import logging
+import threading
+import compileall
+import importlib.util
 from os.path import abspath
 from shutil import copytree, rmtree
 from player_plain import PlainPlayer
 from player_sandboxed import SandboxedPlayer
 import server
+import async_server
 import battlecode as bc
 try:
     import ujson as json
@@ -19,8 +23,14 @@ except:
 import io
 import sys
 
-# TODO port number
+# Default ports of the viewer server, and of the game server when it runs on tcp
 PORT = 16147
+SERVER_PORT = 16148
+
+# Socket files handed out to games that have not created them yet, so games
+# created at the same time never pick the same one
+_socket_lock = threading.Lock()
+_reserved_sockets = set()
 
 class Logger(object):
     def __init__(self, prefix, print=True, limit=2**63):
@@ -50,6 +60,53 @@ def working_dir_message(working_dir):
     print('You may want to empty it periodically.')
 
 
+def reserve_socket_file():
+    '''
+    Find a /tmp/battlecode-N socket file no other game uses, and reserve it
+    until the game is cleaned up
+    '''
+    with _socket_lock:
+        for index in range(10000):
+            sock_file = "/tmp/battlecode-" + str(index)
+            if not os.path.exists(sock_file) and sock_file not in _reserved_sockets:
+                _reserved_sockets.add(sock_file)
+                return sock_file
+    raise Exception("Do you really have 10000 /tmp/battlecode sockets???")
+
+
+def server_address(args):
+    '''
+    Pick where the game server listens, a unix socket file or a tcp
+    (host, port) tuple
+    '''
+    if 'USE_TCP' in os.environ or sys.platform == 'win32':
+        port = args.get('server_port', SERVER_PORT)
+        print('Running game server on port tcp://localhost:{}'.format(port))
+        # int indicates tcp
+        return ('localhost', port)
+    sock_file = reserve_socket_file()
+    print('Running game server on socket unix://{}'.format(sock_file))
+    return sock_file
+
+
+def compile_binding(prepath):
+    '''
+    Compiles the python binding in the battlecode tree, and builds its release
+    variant, so every copy of the tree starts up from bytecode. Both are
+    skipped when they are up to date.
+    '''
+    pydir = os.path.join(prepath, 'python', 'battlecode')
+    try:
+        compileall.compile_dir(pydir, maxlevels=0, quiet=1)
+        spec = importlib.util.spec_from_file_location('battlecode_release', os.path.join(pydir, '_release.py'))
+        release = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(release)
+        release.write_cache()
+    except Exception as e:
+        # The players compile the binding themselves when this fails
+        print("Could not precompile the binding:", e)
+
+
 def prepare_working_directory(working_dir):
     bcdir = os.path.join(working_dir, 'battlecode')
     # todo: copy battlecode to working_dir
@@ -61,6 +118,7 @@ def prepare_working_directory(working_dir):
         rmtree(bcdir)
 
     prepath = abspath(os.path.join(os.path.dirname(abspath(__file__)), "../battlecode"))
+    compile_binding(prepath)
     # print("Copying battlecode resources from {} to {}".format(prepath, working_dir))
     copytree(prepath, bcdir)
     # print("Working dir ready!")
@@ -74,19 +132,22 @@ def run_game(game, dockers, args, sock_file, scrimmage=False):
     '''
 
     # Start the unix stream server
-    main_server = server.start_server(sock_file, game, dockers)
+    server_module = async_server if args.get('async_server') else server
+    main_server = server_module.start_server(sock_file, game, dockers)
 
-    viewer_server = server.start_viewer_server(PORT, game)
+    # A game without a viewer port runs without a viewer server
+    viewer_port = args.get('viewer_port', PORT)
+    viewer_server = None
+    if viewer_port is not None:
+        viewer_server = server_module.start_viewer_server(viewer_port, game)
 
     try:
         # Start the docker instances
         for player_key in dockers:
             docker_inst = dockers[player_key]
             docker_inst.start()
-            for player_ in game.players:
-                if player_['id'] == player_key:
-                    player = player_['player']
-                    break
+            player_ = game.get_player(player_key)
+            player = player_.player
             if player.planet == bc.Planet.Earth:
                 planet = 'earth'
             else:
@@ -98,14 +159,19 @@ def run_game(game, dockers, args, sock_file, scrimmage=False):
 
             name = '[{}:{}]'.format(planet, team)
             # 10 MB of logs in scrimmage, unlimited logging otherwise
-            logger = Logger(name, print=not args['terminal_viewer'], limit=10**7 if scrimmage else 2**63)
+            print_logs = args.get('print_logs', not args['terminal_viewer'])
+            logger = Logger(name, print=print_logs, limit=10**7 if scrimmage else 2**63)
             docker_inst.stream_logs(line_action=logger)
-            player_['logger'] = logger
+            player_.logger = logger
 
         # Wait until all the code is done then clean up
-        while not game.game_over:
-            time.sleep(0.1)
+        # Wake up now and then, as a plain wait cannot be interrupted on Windows
+        while not game.wait_for_game_over(1):
+            pass
 
+    except:
+        game.viewer_messages.abort()
+        raise
     finally:
         main_server.shutdown()
         try:
@@ -116,8 +182,6 @@ def run_game(game, dockers, args, sock_file, scrimmage=False):
         if viewer_server is not None:
             viewer_server.shutdown()
 
-    match_file = {}
-    match_file['message'] = game.viewer_messages
     if not game.disconnected:
         if bc.Team.Red == game.manager.winning_team():
             winner = 'player1'
@@ -126,30 +190,35 @@ def run_game(game, dockers, args, sock_file, scrimmage=False):
     else:
         winner = game.winner
 
-    match_file['metadata'] = {
+    metadata = {
         'player1': 'player1' if scrimmage else args['dir_p1'][8:],
         'player2': 'player2' if scrimmage else args['dir_p2'][8:],
         'winner': winner
     }
 
-    if args['docker']:
-        match_output = abspath(os.path.join('/player', str(args['replay_filename'])))
-    else:
-        match_output = args['replay_filename']
-        if not os.path.isabs(match_output):
-            match_output = abspath(os.path.join('..', str(match_output)))
-
+    # The messages were written to the replay as the game went
+    game.viewer_messages.finish(metadata)
 
     if not scrimmage:
-        print("Saving replay to", match_output)
-
-        match_ptr = open(match_output, 'w')
-        json.dump(match_file, match_ptr)
-        match_ptr.close()
-
+        if args['replay_filename'] is not None:
+            print("Saved replay to", replay_path(args))
         return winner
     else:
-        return winner, match_file
+        return winner, game.viewer_messages.replay.path
+
+
+def replay_path(args):
+    '''
+    Where to save the replay of a game, or None to not save it
+    '''
+    if args['replay_filename'] is None:
+        return None
+    if args['docker']:
+        return abspath(os.path.join('/player', str(args['replay_filename'])))
+    match_output = args['replay_filename']
+    if not os.path.isabs(match_output):
+        match_output = abspath(os.path.join('..', str(match_output)))
+    return match_output
 
 
 def cleanup(dockers, args, sock_file):
@@ -162,7 +231,11 @@ def cleanup(dockers, args, sock_file):
 
     if isinstance(sock_file, str) or isinstance(sock_file, bytes):
         # only unlink unix sockets
-        os.unlink(sock_file)
+        try:
+            os.unlink(sock_file)
+        finally:
+            with _socket_lock:
+                _reserved_sockets.discard(sock_file)
 
 
 def get_map(map_name):
@@ -217,30 +290,24 @@ def create_game(args):
                        time_additional=args['time_additional'],
                        terminal_viewer=args['terminal_viewer'],
                        extra_delay=args['extra_delay'],
-                       map_name=args['map_name'])
+                       map_name=args['map_name'],
+                       replay_file=replay_path(args))
 
-    working_dir = abspath("working_dir")
+    # Games running side by side each need a working directory of their own
+    working_dir = abspath(args.get('working_dir') or "working_dir")
     prepare_working_directory(working_dir)
 
+    # pick the server implementation, threads or an asyncio event loop
+    if 'async_server' not in args:
+        args['async_server'] = 'USE_ASYNC_SERVER' in os.environ
+
     # pick server location
-    if 'USE_TCP' in os.environ or sys.platform == 'win32':
-        print('Running game server on port tcp://localhost:16148')
-        # int indicates tcp
-        sock_file = ('localhost', 16148)
-    else:
-        # Find a good filename to use as socket file
-        for index in range(10000):
-            sock_file = "/tmp/battlecode-" + str(index)
-            if not os.path.exists(sock_file):
-                break
-        else:
-            raise Exception("Do you really have 10000 /tmp/battlecode sockets???")
-        print('Running game server on socket unix://{}'.format(sock_file))
+    sock_file = server_address(args)
 
     # Assign the docker instances client ids
     dockers = {}
     for index in range(len(game.players)):
-        key = [player['id'] for player in game.players][index]
+        key = game.players[index].id
         local_dir = args['dir_p1' if index % 2 == 0 else 'dir_p2']
         if args['docker']:
             # Note, importing a module multiple times is ok in python.
@@ -258,29 +325,29 @@ def create_scrimmage_game(args):
     Create all the semi-permanent game structures (i.e. sockets and dockers and
     stuff
     '''
-    args['replay_filename'] = 'k'
+    # Games running side by side each need a working directory of their own
+    working_dir = abspath(args.get('working_dir') or "working_dir")
+    prepare_working_directory(working_dir)
+
+    # The replay is gzipped in the working directory, ready to upload
+    args['replay_filename'] = os.path.join(working_dir, 'replay.bc18z')
     # Load the Game state info
     game = server.Game(logging_level=logging.ERROR,
                        game_map=args['map'], time_pool=int(os.environ['TIME_POOL']),
                        time_additional=int(os.environ['TIME_ADDITIONAL']),
                        terminal_viewer=False,
-                       extra_delay=0)
-
-    working_dir = abspath("working_dir")
-    prepare_working_directory(working_dir)
+                       extra_delay=0,
+                       replay_file=args['replay_filename'],
+                       compress_replay=True)
 
-    # Find a good filename to use as socket file
-    for index in range(10000):
-        sock_file = "/tmp/battlecode-"+str(index)
-        if not os.path.exists(sock_file):
-            break
+    sock_file = reserve_socket_file()
 
     # Assign the docker instances client ids
     import docker
     docker_instance = docker.from_env()
     dockers = {}
     for index in range(len(game.players)):
-        key = [player['id'] for player in game.players][index]
+        key = game.players[index].id
         dockers[key] = SandboxedPlayer(sock_file, player_key=key,
                                    s3_bucket=args['s3_bucket'],
                                    s3_key=args['red_key' if index % 2 == 0 else 'blue_key'],
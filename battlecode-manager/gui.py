@@ -89,7 +89,7 @@ def save_logs(file_name):
 
     output_string = ""
     if game != None:
-        if all('logger' in player for player in game.players):
+        if all(player.logger is not None for player in game.players):
             for i in range(len(game.players)):
                 player = game.players[i]
                 log_header = "\n\n\n\n\n\n======================================\n"
@@ -102,7 +102,7 @@ def save_logs(file_name):
                 else:
                     log_header += "Mars"
                 log_header += "\n\n"
-                logs = log_header + player['logger'].logs.getvalue()
+                logs = log_header + player.logger.logs.getvalue()
                 output_string += logs
     else:
         # This should never run. Game needs to be started to call this modal
@@ -180,7 +180,8 @@ def get_viewer_data(turn):
         if turn >= len(game.manager_viewer_messages) or turn == -1:
             turn = len(game.manager_viewer_messages) - 1
 
-        message = json.loads(game.manager_viewer_messages[turn])
+        # Copy the decoded turn, as the history shares it with its cache
+        message = dict(game.manager_viewer_messages[turn])
         message['turn'] = turn
         return message
     else:
@@ -237,8 +238,8 @@ def get_player_dirs():
 @eel.expose
 def get_player_logs():
     if game != None:
-        if all('logger' in player for player in game.players):
-            logs = [player['logger'].logs.getvalue() for player in game.players]
+        if all(player.logger is not None for player in game.players):
+            logs = [player.logger.logs.getvalue() for player in game.players]
             return logs
         else:
             return ["", "", "", ""]
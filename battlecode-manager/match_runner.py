@@ -0,0 +1,122 @@
+'''
+Runs several games at the same time in one manager process. Every game runs
+in a slot of its own, with its own working directory, socket, ports and
+player loggers, so games running side by side never share any state.
+'''
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import battlecode_cli as cli
+import server
+
+
+def default_slots():
+    '''
+    One game per NUM_PLAYERS cores, as every player of a game gets a core's
+    worth of time at most.
+    '''
+    return max(1, (os.cpu_count() or 1) // server.NUM_PLAYERS)
+
+
+class Slot(object):
+    '''
+    The resources one game uses while it runs.
+    '''
+
+    def __init__(self, index, working_dir, viewer_port):
+        self.index = index
+        self.working_dir = os.path.join(working_dir, 'game-{}'.format(index))
+        # Two ports per slot, one for the viewer and one for the game server
+        # when it runs on tcp
+        self.viewer_port = None if viewer_port is None else viewer_port + 2*index
+        self.server_port = cli.SERVER_PORT + 2*index
+
+    def apply(self, args):
+        '''
+        Points the arguments of a game at the resources of this slot.
+        '''
+        args['working_dir'] = self.working_dir
+        args['viewer_port'] = self.viewer_port
+        args['server_port'] = self.server_port
+        return args
+
+
+class MatchRunner(object):
+    '''
+    Runs up to `slots` games at a time, and queues the rest.
+    Args:
+        slots: Number of games to run at once, one per NUM_PLAYERS cores by
+            default
+
+        working_dir: Directory holding the working directories of the slots
+
+        viewer_port: Viewer port of the first slot, or None to run the games
+            without a viewer server
+    '''
+
+    def __init__(self, slots=None, working_dir='working_dir', viewer_port=None):
+        self.slots = slots or default_slots()
+        self.working_dir = os.path.abspath(working_dir)
+        self.viewer_port = viewer_port
+        self.lock = threading.Lock()
+        self.free_slots = [Slot(index, self.working_dir, viewer_port) for index in range(self.slots)]
+        self.pending = 0
+        self.executor = ThreadPoolExecutor(max_workers=self.slots)
+
+        # Build the binding bytecode once up front, so the slots preparing
+        # their working directories at the same time only copy it
+        cli.compile_binding(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'battlecode'))
+
+    def busy(self):
+        '''
+        Whether every slot has a game running or queued for it.
+        '''
+        with self.lock:
+            return self.pending >= self.slots
+
+    def submit(self, function, *args):
+        '''
+        Calls function(slot, *args) once a slot is free, and returns a future
+        of its result.
+        '''
+        with self.lock:
+            self.pending += 1
+        return self.executor.submit(self._run, function, *args)
+
+    def _run(self, function, *args):
+        with self.lock:
+            slot = self.free_slots.pop(0)
+        try:
+            return function(slot, *args)
+        finally:
+            with self.lock:
+                self.free_slots.append(slot)
+                self.pending -= 1
+
+    def play(self, args, scrimmage=False):
+        '''
+        Creates, runs and cleans up a game once a slot is free. The future
+        holds the game and the result of run_game.
+        '''
+        return self.submit(play_game, dict(args), scrimmage)
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+
+def play_game(slot, args, scrimmage=False):
+    '''
+    Creates, runs and cleans up a game in a slot. Returns the game and the
+    result of run_game.
+    '''
+    slot.apply(args)
+    if scrimmage:
+        (game, dockers, sock_file) = cli.create_scrimmage_game(args)
+    else:
+        (game, dockers, sock_file) = cli.create_game(args)
+    try:
+        result = cli.run_game(game, dockers, args, sock_file, scrimmage=scrimmage)
+    finally:
+        cli.cleanup(dockers, args, sock_file)
+    return game, result
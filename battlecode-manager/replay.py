@@ -0,0 +1,328 @@
+'''
+Keeps the viewer messages of a game. Every message is appended to the replay
+file as soon as the engine produces it. The first message is a keyframe with
+the whole map, and every later one holds the changes of one turn, so a viewer
+has to read all of them in order. Only the last MEMORY_LIMIT messages are kept
+in memory. A viewer that connects late or falls further behind reads the
+older messages back from the replay file, or from a temporary spill file when
+the replay is compressed or there is none.
+
+Viewers subscribe with a ViewerReader, which holds their place in the
+messages and is woken up as soon as a new message comes in.
+
+The replay file is written as it always was, a JSON object with the list of
+messages and the metadata of the game:
+
+    {"message": [...], "metadata": {...}}
+
+so finishing it only takes writing the metadata, instead of serializing the
+whole game at the end.
+'''
+
+import array
+import collections
+import gzip
+import os
+import tempfile
+import threading
+try:
+    import ujson as json
+except:
+    import json
+
+# Viewer messages to keep in memory, for the viewers that are reading them
+MEMORY_LIMIT = 256
+
+class ReplayWriter(object):
+    '''
+    Writes a replay file one message at a time. The file is written under a
+    temporary name, and only moved to its path when it is finished. It is
+    only opened with the first message, so a game that fails to start leaves
+    no file behind. An uncompressed replay can read its messages back while
+    it is written.
+    Args:
+        path: Where to write the replay
+
+        compress: Whether to gzip the replay, like the scrimmage server stores
+            them
+    '''
+
+    def __init__(self, path, compress=False):
+        self.path = path
+        self.temporary = path + '.part'
+        self.compress = compress
+        self.file = None
+        self.count = 0
+        # The start and length of every message in the file, and the handle
+        # that reads them back, when the replay is not compressed
+        self.spans = array.array('q')
+        self.reader = None
+
+    def _open(self):
+        if self.compress:
+            self.file = gzip.open(self.temporary, 'wb', compresslevel=6)
+        else:
+            self.file = open(self.temporary, 'wb')
+        self.file.write(b'{"message":[')
+
+    def write(self, message):
+        if self.file is None:
+            self._open()
+        if self.count:
+            self.file.write(b',')
+        data = message.encode()
+        if not self.compress:
+            self.spans.append(self.file.tell())
+            self.spans.append(len(data))
+        self.file.write(data)
+        self.count += 1
+
+    def read(self, index):
+        '''
+        Returns a message written to an uncompressed replay.
+        '''
+        self.file.flush()
+        if self.reader is None:
+            self.reader = open(self.temporary, 'rb')
+        self.reader.seek(self.spans[2*index])
+        return self.reader.read(self.spans[2*index + 1]).decode()
+
+    def _close_reader(self):
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+
+    def finish(self, metadata):
+        '''
+        Writes the metadata and moves the replay to its path.
+        '''
+        if self.file is None:
+            self._open()
+        self.file.write(b'],"metadata":')
+        self.file.write(json.dumps(metadata).encode())
+        self.file.write(b'}')
+        self.file.close()
+        self._close_reader()
+        os.replace(self.temporary, self.path)
+
+    def abort(self):
+        '''
+        Throws away the replay of a game that did not finish.
+        '''
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        self._close_reader()
+        try:
+            os.unlink(self.temporary)
+        except OSError:
+            pass
+
+
+class SpillFile(object):
+    '''
+    The viewer messages of a game without an uncompressed replay, in a
+    temporary file that is deleted when it is closed.
+    '''
+
+    def __init__(self):
+        self.file = tempfile.TemporaryFile()
+        self.spans = array.array('q')
+
+    def write(self, message):
+        data = message.encode()
+        self.file.seek(0, os.SEEK_END)
+        self.spans.append(self.file.tell())
+        self.spans.append(len(data))
+        self.file.write(data)
+
+    def read(self, index):
+        self.file.seek(self.spans[2*index])
+        return self.file.read(self.spans[2*index + 1]).decode()
+
+    def close(self):
+        self.file.close()
+
+
+class ViewerReader(object):
+    '''
+    The position of one viewer in the viewer messages.
+    '''
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.position = 0
+
+    def pending(self):
+        '''
+        Whether there are messages the viewer has not read yet.
+        '''
+        return self.position < len(self.messages)
+
+    def wait(self, timeout=None):
+        '''
+        Blocks until there are messages the viewer has not read yet, or no
+        more messages will come. Returns whether there are messages to read.
+        '''
+        new_messages = self.messages.new_messages
+        with new_messages:
+            new_messages.wait_for(lambda: self.pending() or self.messages.ended, timeout)
+        return self.pending()
+
+    def read(self):
+        '''
+        Returns the messages the viewer has not read yet, oldest first. A
+        viewer that fell behind gets at most MEMORY_LIMIT of them at a time.
+        '''
+        return self.messages._read(self)
+
+    def close(self):
+        self.messages._remove_reader(self)
+
+
+class ViewerMessages(object):
+    '''
+    The viewer messages of a game, in memory with the replay file behind it.
+    The first message, the keyframe, is always kept. It only goes to the
+    replay with the second message, the first turn, so a game that is created
+    but never played does not open the replay file. The later messages are
+    dropped once every reader read them, or once there are more than
+    MEMORY_LIMIT of them when they can be read back from disk.
+    Args:
+        replay: The ReplayWriter every message is appended to, or None to keep
+            no replay
+    '''
+
+    def __init__(self, replay=None):
+        self.replay = replay
+        # Where the messages dropped from memory are read back from
+        self.spill = replay if replay is not None and not replay.compress else None
+        self.spill_file = None
+        self.lock = threading.Lock()
+        # Notified on every new message, and when the messages end
+        self.new_messages = threading.Condition(self.lock)
+        self.ended = False
+        self.first = None
+        # The messages kept in memory, and the index of the oldest one
+        self.recent = collections.deque()
+        self.offset = 1
+        self.count = 0
+        self.readers = set()
+
+    def __len__(self):
+        return self.count
+
+    def append(self, message):
+        with self.lock:
+            if self.count == 0:
+                self.first = message
+            else:
+                if self.replay is not None:
+                    if self.count == 1:
+                        self.replay.write(self.first)
+                    self.replay.write(message)
+                if self.spill_file is not None:
+                    self.spill_file.write(message)
+                self.recent.append(message)
+            self.count += 1
+            self._trim()
+            self.new_messages.notify_all()
+
+    def end(self):
+        '''
+        Wakes up every reader, to see that no more messages will come.
+        '''
+        with self.lock:
+            self.ended = True
+            self.new_messages.notify_all()
+
+    def spill_to_disk(self):
+        '''
+        Makes sure the messages dropped from memory can be read back, for the
+        viewers that may connect at any time. Without an uncompressed replay
+        they go to a temporary file. Called by the viewer servers before the
+        first turn.
+        '''
+        with self.lock:
+            if self.spill is not None:
+                return
+            if self.offset > 1:
+                raise ValueError("the viewer messages before {} were already dropped".format(self.offset))
+            self.spill_file = SpillFile()
+            if self.count > 0:
+                self.spill_file.write(self.first)
+            for message in self.recent:
+                self.spill_file.write(message)
+            self.spill = self.spill_file
+
+    def reader(self):
+        '''
+        Returns a ViewerReader that starts at the first message, the keyframe
+        every later message builds on.
+        '''
+        reader = ViewerReader(self)
+        with self.lock:
+            if self.offset > 1 and self.spill is None:
+                raise ValueError("the viewer messages before {} were dropped, and there is no file to read them from".format(self.offset))
+            self.readers.add(reader)
+        return reader
+
+    def _remove_reader(self, reader):
+        with self.lock:
+            self.readers.discard(reader)
+            self._trim()
+
+    def _read(self, reader):
+        with self.lock:
+            messages = []
+            if reader.position == 0 and self.count > 0:
+                messages.append(self.first)
+                reader.position = 1
+            # A turn cannot be shown without the turns before it, so a reader
+            # that fell behind reads the dropped messages back from disk
+            if reader.position < self.offset:
+                end = min(self.offset, reader.position + MEMORY_LIMIT)
+                messages.extend(self.spill.read(index) for index in range(reader.position, end))
+                reader.position = end
+            else:
+                messages.extend(self.recent[index - self.offset] for index in range(reader.position, self.count))
+                reader.position = self.count
+            self._trim()
+            return messages
+
+    def _trim(self):
+        # Drop the messages every reader read, and the oldest ones past the
+        # limit when they can be read back
+        keep_from = self.count
+        if self.readers:
+            keep_from = min(reader.position for reader in self.readers)
+        if self.spill is not None:
+            keep_from = max(keep_from, self.count - MEMORY_LIMIT)
+        while self.recent and self.offset < keep_from:
+            self.recent.popleft()
+            self.offset += 1
+
+    def finish(self, metadata):
+        '''
+        Finishes the replay file, if there is one.
+        '''
+        if self.replay is not None:
+            with self.lock:
+                if self.count == 1:
+                    self.replay.write(self.first)
+                self.replay.finish(metadata)
+        self._close_spill_file()
+
+    def abort(self):
+        if self.replay is not None:
+            with self.lock:
+                self.replay.abort()
+        self._close_spill_file()
+
+    def _close_spill_file(self):
+        with self.lock:
+            if self.spill_file is not None:
+                self.spill_file.close()
+                self.spill_file = None
+                self.spill = None
@@ -2,6 +2,7 @@ import psycopg2
 import json
 import os
 import battlecode_cli as cli
+import match_runner
 import threading
 import boto3
 from time import sleep
@@ -10,15 +11,19 @@ import time
 import nonsense
 import random
 import proxyuploader
-import gzip
 import string
+import traceback
 
 pg = None
 cur = None
-BUSY = False
-DB_LOCK = False
+# Reentrant, as a match that fails right away reports it from the polling
+# thread, which holds the lock while it starts the match
+DB_LOCK = threading.RLock()
 GAMES_RUN = []
 
+# Games to run at once, one per four cores by default
+RUNNER = match_runner.MatchRunner(slots=int(os.environ['MATCH_SLOTS']) if 'MATCH_SLOTS' in os.environ else None)
+
 s3 = boto3.resource('s3')
 bucket = s3.Bucket(os.environ['BUCKET_NAME'])
 key_prefix = 'tournament/' + os.environ['TOURNAMENT'] + '/' if 'TOURNAMENT' in os.environ else ''
@@ -26,14 +31,10 @@ key_prefix = 'tournament/' + os.environ['TOURNAMENT'] + '/' if 'TOURNAMENT' in o
 def random_key(length):
     return ''.join([random.choice(string.ascii_letters + string.digits + string.digits) for _ in range(length)])
 
-PROXY_UPLOADER = proxyuploader.ProxyUploader()
-
-def end_game(data,winner,match_file,logs):
-    global BUSY
-    global DB_LOCK
-
-    BUSY = False
+# One uploader per slot, each reporting the game running in it to the proxy
+PROXY_UPLOADERS = [proxyuploader.ProxyUploader() for _ in range(RUNNER.slots)]
 
+def end_game(data,winner,replay_file,logs):
     status = -1
     if winner == 'player1':
         status = 'redwon'
@@ -45,25 +46,19 @@ def end_game(data,winner,match_file,logs):
     red_log_key = key_prefix + 'logs/' + hidden_key + '_0.bc18log'
     blue_log_key = key_prefix + 'logs/' + hidden_key + '_1.bc18log'
 
-    gzipped_replay = gzip.compress(json.dumps(match_file).encode())
-
-    bucket.put_object(Key=replay_key,Body=gzipped_replay,ACL='public-read')
+    # The replay was gzipped while the game ran
+    bucket.upload_file(replay_file,replay_key,ExtraArgs={'ACL':'public-read'})
+    os.unlink(replay_file)
     bucket.put_object(Key=red_log_key,Body=json.dumps({'earth':logs[0],'mars':logs[2]}).encode(),ACL='public-read')
     bucket.put_object(Key=blue_log_key,Body=json.dumps({'earth':logs[1],'mars':logs[3]}).encode(),ACL='public-read')
 
-    while DB_LOCK == True:
-        sleep(0.1)
-    DB_LOCK = True
-    cur.execute("UPDATE " + os.environ["TABLE_NAME"] + " SET (status, replay, red_logs, blue_logs)=(%s,%s,%s,%s)  WHERE id=%s", (status,replay_key,red_log_key,blue_log_key,data['id']))
-    pg.commit()
-    DB_LOCK = False
+    with DB_LOCK:
+        cur.execute("UPDATE " + os.environ["TABLE_NAME"] + " SET (status, replay, red_logs, blue_logs)=(%s,%s,%s,%s)  WHERE id=%s", (status,replay_key,red_log_key,blue_log_key,data['id']))
+        pg.commit()
 
     print("Finished game " + str(data['id']))
 
-def match_thread(data):
-    global BUSY
-    global DB_LOCK
-    BUSY = True
+def match_thread(slot, data):
     GAMES_RUN.append(data['id'])
 
     data['s3_bucket'] = bucket
@@ -78,84 +73,88 @@ def match_thread(data):
     data['use_viewer'] = False
 
     data['extra_delay'] = 0
+    slot.apply(data)
 
     try:
         (game, dockers, sock_file) = cli.create_scrimmage_game(data)
     except ValueError as e:
         print("Destroying the game, as it is invalid.  This should not happen.")
-        while DB_LOCK == True:
-            sleep(0.1)
-        DB_LOCK = True
-        cur.execute("UPDATE " + os.environ["TABLE_NAME"] + " SET status='rejected' WHERE id=%s", (data['id'],))
-        pg.commit()
-        DB_LOCK = False
+        with DB_LOCK:
+            cur.execute("UPDATE " + os.environ["TABLE_NAME"] + " SET status='rejected' WHERE id=%s", (data['id'],))
+            pg.commit()
 
         return
 
 
-    PROXY_UPLOADER.game = game
+    uploader = PROXY_UPLOADERS[slot.index]
+    try:
+        uploader.game_id = data['id']
+        uploader.red_id = data['red_team']
+        uploader.blue_id = data['blue_team']
+    except Exception as e:
+        print("error setting team data:", e)
+    uploader.game = game
     winner = None
-    match_file = None
+    replay_file = None
     try:
         print("Running match " + str(data['id']))
-        winner, match_file = cli.run_game(game, dockers, data, sock_file,scrimmage=True)
+        winner, replay_file = cli.run_game(game, dockers, data, sock_file,scrimmage=True)
     finally:
         cli.cleanup(dockers, data, sock_file)
-    PROXY_UPLOADER.game = None
-    PROXY_UPLOADER.games_run += 1
+        uploader.game = None
+    uploader.games_run += 1
 
     logs = None
-    if all('logger' in player for player in game.players):
-        logs = [player['logger'].logs.getvalue() for player in game.players]
+    if all(player.logger is not None for player in game.players):
+        logs = [player.logger.logs.getvalue() for player in game.players]
 
-    end_game(data,winner,match_file,logs)
+    end_game(data,winner,replay_file,logs)
 
-def run_match(data):
-    t1 = threading.Thread(target=match_thread,args=(data,))
-    t1.start()
+def match_done(data, future):
+    '''
+    Reports a match that raised, instead of leaving it running in the database.
+    '''
+    error = future.exception()
+    if error is None:
+        return
+    print("Match " + str(data['id']) + " failed:")
+    traceback.print_exception(type(error), error, error.__traceback__)
+    with DB_LOCK:
+        cur.execute("UPDATE " + os.environ["TABLE_NAME"] + " SET status='failed' WHERE id=%s", (data['id'],))
+        pg.commit()
 
-    return t1
+def run_match(data):
+    future = RUNNER.submit(match_thread, data)
+    future.add_done_callback(lambda future: match_done(data, future))
+    return future
 
 def poll_thread():
-    global DB_LOCK
-    global BUSY
-
     while True:
         sleep(1)
-        if BUSY:
+        if RUNNER.busy():
             continue
 
-        while DB_LOCK == True:
-            sleep(0.1)
-        DB_LOCK = True
+        with DB_LOCK:
+            poll_match()
 
-        cur.execute("SELECT (id, red_key, blue_key, map, red_team, blue_team) FROM " + os.environ["TABLE_NAME"] + " WHERE status='queued' or (status='running' and start < (NOW() - INTERVAL '8 min')) ORDER BY start ASC")
+def poll_match():
+    cur.execute("SELECT (id, red_key, blue_key, map, red_team, blue_team) FROM " + os.environ["TABLE_NAME"] + " WHERE status='queued' or (status='running' and start < (NOW() - INTERVAL '8 min')) ORDER BY start ASC")
 
-        row = cur.fetchone()
+    row = cur.fetchone()
 
-        if row is not None:
-            if len(row) == 1:
-                row = row[0][1:-1].split(",")
-                row[0] = int(row[0])
+    if row is not None:
+        if len(row) == 1:
+            row = row[0][1:-1].split(",")
+            row[0] = int(row[0])
 
-            data = {'id':row[0],'red_key':row[1],'blue_key':row[2],'map':row[3]}
+        data = {'id':row[0],'red_key':row[1],'blue_key':row[2],'map':row[3],
+                'red_team':row[4] if len(row) > 4 else 0,'blue_team':row[5] if len(row) > 5 else 0}
 
-            if not BUSY:
-                BUSY = True
-                print('Running game ' + str(data))
-                cur.execute("UPDATE " + os.environ['TABLE_NAME'] + " SET status='running', start=NOW() WHERE id=%s",(data['id'],))
-                pg.commit()
-
-                try:
-                    PROXY_UPLOADER.game_id = row[0]
-                    PROXY_UPLOADER.red_id = row[4]
-                    PROXY_UPLOADER.blue_id = row[5]
-                except Exception as e:
-                    print("error setting team data:", e)
-
-                run_match(data)
+        print('Running game ' + str(data))
+        cur.execute("UPDATE " + os.environ['TABLE_NAME'] + " SET status='running', start=NOW() WHERE id=%s",(data['id'],))
+        pg.commit()
 
-        DB_LOCK = False
+        run_match(data)
 
 if __name__ == "__main__":
     try:
@@ -8,6 +8,7 @@ import socket # pylint: disable=unused-import
 import threading
 import time
 import random
+import struct
 import sys
 import logging
 import os.path
@@ -16,6 +17,8 @@ try:
 except:
     import json
 import battlecode as bc
+from replay import ReplayWriter, ViewerMessages
+from viewer_history import ViewerHistory
 
 NUM_PLAYERS = 4
 
@@ -30,15 +33,188 @@ PKEYS = {
     }
 }
 def _key(p):
-    p = p['player']
+    p = p.player
     return PKEYS[int(p.planet)][int(p.team)]
 
 BUILD_TIMEOUT = 60
 TIMEOUT = 50 # seconds
 
+# Starting size of the buffer a connection is read into. It grows to fit the
+# longest line, and goes back to this size once a line of more than
+# MAX_IDLE_BUFFER bytes has been read.
+READ_BUFFER_SIZE = 2**16
+MAX_IDLE_BUFFER = 2**22
+
+# Wire formats a player can ask for with a "wire" field in its login. Players
+# log in with a JSON line either way, and get the reply as a JSON line. After
+# that, a "framed" player gets and sends every message as a 4 byte big endian
+# length followed by the message, instead of a line. Players that do not ask
+# stay on JSON lines.
+WIRE_JSON = 'json'
+WIRE_FRAMED = 'framed'
+WIRE_FORMATS = (WIRE_JSON, WIRE_FRAMED)
+FRAME_HEADER = struct.Struct('>I')
+# Longest frame a player may send
+MAX_FRAME = 2**26
+
+
+def wire_format(login):
+    '''
+    The wire format a player asked for in its login, or JSON lines when it
+    asked for none or for one the manager does not know.
+    '''
+    wire = login.get('wire', WIRE_JSON) if isinstance(login, dict) else WIRE_JSON
+    return wire if wire in WIRE_FORMATS else WIRE_JSON
+
+
+def frame(message):
+    '''
+    Prefixes a message with its length. A bytearray from message() already
+    has room for the length at the front.
+    '''
+    if isinstance(message, str):
+        message = message.encode()
+    if isinstance(message, bytearray):
+        FRAME_HEADER.pack_into(message, 0, len(message) - FRAME_HEADER.size)
+        return message
+    return FRAME_HEADER.pack(len(message)) + message
+
 class TimeoutError(Exception):
     pass
 
+
+class LineReader(object):
+    '''
+    Reads newline delimited lines from a socket into one reusable buffer.
+    Every byte is received once, with recv_into, and searched for the newline
+    once, however many reads a line takes to arrive.
+    '''
+
+    def __init__(self, sock, size=READ_BUFFER_SIZE):
+        self.sock = sock
+        self.size = size
+        self.buffer = bytearray(size)
+        # The received bytes that were not read yet are buffer[start:end], and
+        # the first `scanned` of them hold no newline
+        self.start = 0
+        self.end = 0
+        self.scanned = 0
+
+    def _receive(self, need=0):
+        # Makes room for at least `need` bytes from the start of the unread
+        # ones, and for more bytes to come in
+        if self.end == len(self.buffer) or self.start + need > len(self.buffer):
+            length = self.end - self.start
+            size = len(self.buffer)
+            if length * 2 > size:
+                size *= 2
+            while size < need:
+                size *= 2
+            if size != len(self.buffer):
+                # A new buffer instead of a resize, as the last line read may
+                # still be in use
+                buffer = bytearray(size)
+                buffer[:length] = self.buffer[self.start:self.end]
+                self.buffer = buffer
+            else:
+                self.buffer[:length] = self.buffer[self.start:self.end]
+            self.start = 0
+            self.end = length
+        with memoryview(self.buffer) as view:
+            received = self.sock.recv_into(view[self.end:])
+        if not received:
+            raise IOError("reached socket EOF before finding newline")
+        self.end += received
+
+    def _line_end(self):
+        while True:
+            pos = self.buffer.find(b'\n', self.start + self.scanned, self.end)
+            if pos != -1:
+                return pos
+            self.scanned = self.end - self.start
+            self._receive()
+
+    def _fill(self, need):
+        while self.end - self.start < need:
+            self._receive(need)
+
+    def _consume(self, pos):
+        # Everything up to and including pos was read
+        self.start = pos + 1
+        self.scanned = 0
+        if self.start == self.end:
+            self.start = self.end = 0
+            if len(self.buffer) > MAX_IDLE_BUFFER:
+                self.buffer = bytearray(self.size)
+
+    def read_line(self):
+        '''
+        Returns the next line as bytes, without the newline.
+        '''
+        pos = self._line_end()
+        with memoryview(self.buffer) as view:
+            line = view[self.start:pos].tobytes()
+        self._consume(pos)
+        return line
+
+    def read_frame(self):
+        '''
+        Returns the next line as a memoryview of the buffer, with the newline
+        replaced by a NUL byte, so the binding parses it in place. The view
+        is only valid until the next read.
+        '''
+        pos = self._line_end()
+        self.buffer[pos] = 0
+        with memoryview(self.buffer) as view:
+            frame = view[self.start:pos + 1]
+        self._consume(pos)
+        return frame
+
+    def read_framed(self):
+        '''
+        Returns the next length prefixed message as a memoryview of the
+        buffer, only valid until the next read.
+        '''
+        self._fill(FRAME_HEADER.size)
+        (length,) = FRAME_HEADER.unpack_from(self.buffer, self.start)
+        if length > MAX_FRAME:
+            raise IOError("frame of {} bytes is too long".format(length))
+        self._fill(FRAME_HEADER.size + length)
+        start = self.start + FRAME_HEADER.size
+        with memoryview(self.buffer) as view:
+            message = view[start:start + length]
+        self._consume(start + length - 1)
+        return message
+
+class PlayerState(object):
+    '''
+    Everything the manager keeps about one player. Only the connection of
+    the player changes it during the game, so it needs no lock.
+    '''
+    __slots__ = ['id', 'index', 'player', 'running_stats', 'built_successfully',
+                 'logged_in', 'time_left', 'time_used', 'start_message', 'logger']
+
+    def __init__(self, client_id, index, player, time_pool):
+        self.id = client_id
+        # The seat of the player, which is also its place in the turn order
+        self.index = index
+        self.player = player
+        # Reported to the scrimmage proxy, with the time left in ms
+        self.running_stats = {
+            "tl": int(time_pool * 1000),
+            "atu": 0,
+            "lng": "?",
+            "bld": True
+        }
+        self.built_successfully = False
+        self.logged_in = False
+        # Seconds left, and the seconds used in total
+        self.time_left = time_pool
+        self.time_used = 0.
+        self.start_message = None
+        self.logger = None
+
+
 class Game(object): # pylint: disable=too-many-instance-attributes
     '''
     This function contains the game information, and is started at the begining
@@ -51,7 +227,7 @@ class Game(object): # pylint: disable=too-many-instance-attributes
     def __init__(self, game_map: bc.GameMap, logging_level=logging.DEBUG,
                  logging_file="server.log", time_pool=10000, time_additional=50,
                  terminal_viewer=False, map_name="unknown",
-                 extra_delay=0):
+                 extra_delay=0, replay_file=None, compress_replay=False):
         self.terminal_viewer = terminal_viewer
         self.extra_delay = extra_delay
 
@@ -64,11 +240,10 @@ class Game(object): # pylint: disable=too-many-instance-attributes
             num_players: Number of players
             state:       Start state of game (Note can be snapshot
         '''
-        self.players = [] # Array containing the player ids
-        # Dict taking player id and giving bool of log in
-        self.player_logged = {}
-        # Dict taking player id and giving amount of time left as float
-        self.times = {}
+        # The PlayerState of every player, by seat and by client id
+        self.players = []
+        self.players_by_id = {}
+        self.num_log_in = 0
         # List of how many players per team are connected (red,blue).
         self.connected_players = [0,0]
 
@@ -77,42 +252,87 @@ class Game(object): # pylint: disable=too-many-instance-attributes
         # Initialize the players
         for index in range(NUM_PLAYERS):
             new_id = random.randrange(10**30)
-            self.players.append({'id':new_id})
-            self.players[-1]['player'] = bc.Player(bc.Team.Red if index % 2 == 0 else bc.Team.Blue, bc.Planet.Earth if index < 2 else bc.Planet.Mars)
-            self.players[-1]['running_stats'] = {
-                "tl": time_pool,
-                "atu": 0,
-                "lng": "?",
-                "bld": True
-            }
-            self.players[-1]['built_successfully'] = False
-
-            self.player_logged[new_id] = False
-            self.times[new_id] = self.time_pool
+            player = bc.Player(bc.Team.Red if index % 2 == 0 else bc.Team.Blue, bc.Planet.Earth if index < 2 else bc.Planet.Mars)
+            state = PlayerState(new_id, index, player, self.time_pool)
+            self.players.append(state)
+            self.players_by_id[new_id] = state
+
+        # Every change to the turn, the start or the end of the game is
+        # signalled through this condition, so waiting threads wake up right
+        # away instead of polling
+        self.condition = threading.Condition()
+        self.started_event = threading.Event()
+        self.game_over_event = threading.Event()
 
         self.started = False
         self.game_over = False
 
-        # Lock thread running player should hold
+        # The player whose turn it is, and which players were handed their turn
         self.current_player_index = 0
-        self.turn_events = [threading.Event() for _  in range(len(self.players))]
+        self.turn_ready = [False for _  in range(len(self.players))]
 
         self.map = game_map
 
         self.manager = bc.GameController.new_manager(self.map)
         for player in self.players:
-            player['start_message'] = self.manager.start_game(player['player']).to_json()
-        self.viewer_messages = []
+            player.start_message = self.manager.start_game(player.player)
+        # Written to the replay file as the game goes, if there is one
+        replay = ReplayWriter(replay_file, compress_replay) if replay_file is not None else None
+        self.viewer_messages = ViewerMessages(replay)
         manager_start_message = self.manager.initial_start_turn_message(int(1000 * self.time_pool))
-        self.manager_viewer_messages = []
+        # Stored as keyframes and deltas, for the GUI to look turns up in
+        self.manager_viewer_messages = ViewerHistory()
         self.manager_viewer_messages.append(self.manager.manager_viewer_message())
-        self.last_message = manager_start_message.start_turn.to_json()
+        self.last_message = manager_start_message.start_turn
         self.viewer_messages.append(manager_start_message.viewer.to_json())
         self.initialized = 0
 
         self.map_name = map_name
         self.start_time = time.time()
 
+    @property
+    def started(self):
+        return self.started_event.is_set()
+
+    @started.setter
+    def started(self, started):
+        with self.condition:
+            if started:
+                self.started_event.set()
+            else:
+                self.started_event.clear()
+            self.condition.notify_all()
+
+    @property
+    def game_over(self):
+        return self.game_over_event.is_set()
+
+    @game_over.setter
+    def game_over(self, game_over):
+        with self.condition:
+            if game_over:
+                self.game_over_event.set()
+                self.viewer_messages.end()
+            else:
+                self.game_over_event.clear()
+            self.condition.notify_all()
+
+    def wait_for_start(self):
+        '''
+        Blocks until the game has started or is over. Returns whether it
+        started.
+        '''
+        with self.condition:
+            self.condition.wait_for(lambda: self.started or self.game_over)
+        return not self.game_over
+
+    def wait_for_game_over(self, timeout=None):
+        '''
+        Blocks until the game is over, or the timeout in seconds has passed.
+        Returns whether the game is over.
+        '''
+        return self.game_over_event.wait(timeout)
+
     def state_report(self):
         name = self.map_name
         if '/' in name:
@@ -132,35 +352,25 @@ class Game(object): # pylint: disable=too-many-instance-attributes
             }
         }
         for player in self.players:
-            p = player["player"]
+            p = player.player
             t = "red" if p.team == bc.Team.Red else "blue"
             p = "earth" if p.planet == bc.Planet.Earth else "mars"
-            game[t][p] = player["running_stats"]
+            game[t][p] = player.running_stats
         return game
 
     def player_id2index(self, client_id):
-        for i in range(len(self.players)):
-            if self.players[i]['id'] ==client_id:
-                return i
-        raise Exception("Invalid id")
+        return self.get_player(client_id).index
 
     def get_player(self, client_id):
-        return self.players[self.player_id2index(client_id)]
+        try:
+            return self.players_by_id[client_id]
+        except KeyError:
+            raise Exception("Invalid id")
 
     def player_connected(self, client_id):
         index = self.player_id2index(client_id)
-        self.connected_players[index%2] = self.connected_players[index%2] + 1
-
-    @property
-    def num_log_in(self):
-        '''
-        Returns the number of people who have been logged in
-        '''
-        total = 0
-        for key in self.player_logged:
-            if self.player_logged[key]:
-                total += 1
-        return total
+        with self.condition:
+            self.connected_players[index%2] = self.connected_players[index%2] + 1
 
     def verify_login(self, unpacked_data: str):
         '''
@@ -176,24 +386,54 @@ class Game(object): # pylint: disable=too-many-instance-attributes
         client_id = int(unpacked_data['client_id'])
 
         # Check if they are in our list of clients
-        if client_id not in [player['id'] for player in self.players]:
+        player = self.players_by_id.get(client_id)
+        if player is None:
             return "Client id Mismatch"
 
-        # Check if they logged in already
-        if self.player_logged[client_id]:
-            return "Already Logged In"
+        # Players log in from their own connections at the same time
+        with self.condition:
+            # Check if they logged in already
+            if player.logged_in:
+                return "Already Logged In"
 
-        self.player_logged[client_id] = True
+            player.logged_in = True
+            self.num_log_in += 1
 
-        # Check if all the players are logged in and then start the game
-        logging.info("Player logged in: %s", self.player_logged)
-        if len(self.players) == self.num_log_in:
-            self.start_game()
+            # Check if all the players are logged in and then start the game
+            logging.info("Player logged in: %s (%s of %s)", client_id, self.num_log_in, len(self.players))
+            if len(self.players) == self.num_log_in:
+                self.start_game()
         return client_id
 
+    def forfeit(self, client_id):
+        '''
+        Ends the game because a player disconnected or misbehaved, and gives
+        the win to the other team.
+        '''
+        if bc.Team.Red == self.get_player(client_id).player.team:
+            self.winner = 'player2'
+        elif bc.Team.Blue == self.get_player(client_id).player.team:
+            self.winner = 'player1'
+        else:
+            if self.connected_players[0] == self.connected_players[1]:
+                print("Determining match by coin toss.")
+                self.winner = 'player1' if random.random() > 0.5 else 'player2'
+            else:
+                self.winner = 'player1' if self.connected_players[0] > self.connected_players[1] else 'player2'
+        self.disconnected = True
+        self.game_over = True
+
+    def begin_turn(self, client_id: int):
+        '''
+        Gives a player the extra time it gets at the start of every turn.
+        '''
+        self.players_by_id[client_id].time_left += self.time_additional
+
     def set_player_turn(self, player_index):
-        self.current_player_index = player_index
-        self.turn_events[player_index].set()
+        with self.condition:
+            self.current_player_index = player_index
+            self.turn_ready[player_index] = True
+            self.condition.notify_all()
 
     def start_game(self):
         '''
@@ -213,12 +453,13 @@ class Game(object): # pylint: disable=too-many-instance-attributes
 
 
 
-    def end_turn(self):
+    def end_turn(self, delay=True):
         '''
         This function handles the release of all locks and moving the player to
         the next turn. It also handles sleeping the docker instances.
         Args:
-            client_id: The int of the client that this thread is related to
+            delay: Whether to sleep for the extra delay between turns here.
+                The asyncio server waits for it on its event loop instead.
         '''
 
         if self.terminal_viewer:
@@ -245,13 +486,13 @@ class Game(object): # pylint: disable=too-many-instance-attributes
                 # Just in case some text has been left over there from earlier frames.
                 sys.stdout.write("\033[J")
             for player in sorted(self.players, key=_key):
-                p = player['player']
+                p = player.player
                 print('-- [{}{}] --'.format('e' if p.planet == bc.Planet.Earth else 'm', 'r' if p.team == bc.Team.Red else 'b'))
-                logs = player['logger'].logs.getvalue()[-1000:].splitlines()[-5:]
+                logs = player.logger.logs.getvalue()[-1000:].splitlines()[-5:]
                 for line in logs:
                     print(line)
 
-        if self.extra_delay:
+        if delay and self.extra_delay:
             import time
             time.sleep(self.extra_delay / 1000.)
 
@@ -261,17 +502,17 @@ class Game(object): # pylint: disable=too-many-instance-attributes
 
     def get_viewer_messages(self):
         '''
-        A generator for the viewer messages
+        A generator for the viewer messages. It sleeps until the next message
+        comes in, and reads the messages the viewer fell behind on from disk.
         '''
         # TODO check this works with the way the engine works
-        max_yield_item = 0
-        while not self.game_over or max_yield_item != len(self.viewer_messages):
-            if len(self.viewer_messages) > max_yield_item:
-                new_max = len(self.viewer_messages)
-                for i in range(max_yield_item, new_max):
-                    yield self.viewer_messages[i]
-                max_yield_item = new_max
-            time.sleep(0.1)
+        reader = self.viewer_messages.reader()
+        try:
+            while reader.wait():
+                for message in reader.read():
+                    yield message
+        finally:
+            reader.close()
 
     def start_turn(self, client_id: int):
         '''
@@ -284,16 +525,15 @@ class Game(object): # pylint: disable=too-many-instance-attributes
         '''
 
         logging.debug("Client %s: entered start turn", client_id)
-        exit_well = False
         player_index = self.player_id2index(client_id)
-        while not self.game_over:
-            if self.turn_events[player_index].wait(timeout=0.1):
-                self.turn_events[player_index].clear()
-                assert(self.current_player_index == player_index)
-                self.times[client_id] += self.time_additional
-                return True
-
-        return False
+        with self.condition:
+            self.condition.wait_for(lambda: self.turn_ready[player_index] or self.game_over)
+            if self.game_over:
+                return False
+            self.turn_ready[player_index] = False
+            assert(self.current_player_index == player_index)
+            self.begin_turn(client_id)
+            return True
 
     def make_action(self, turn_message: bc.TurnMessage, client_id: int, diff_time: float):
         '''
@@ -303,16 +543,18 @@ class Game(object): # pylint: disable=too-many-instance-attributes
 
         '''
         # get the time left of the next player to go
-        next_index = (self.player_id2index(client_id) + 1) % len(self.players)
-        next_client_id = self.players[next_index]['id']
-        projected_time_ms = int(1000 * (self.times[next_client_id] + self.time_additional))
+        player = self.players_by_id[client_id]
+        next_player = self.players[(player.index + 1) % len(self.players)]
+        projected_time_ms = int(1000 * (next_player.time_left + self.time_additional))
 
         # interact with the engine
         application = self.manager.apply_turn(turn_message, projected_time_ms)
-        self.last_message = application.start_turn.to_json()
+        self.last_message = application.start_turn
+        # Wakes up the viewers
         self.viewer_messages.append(application.viewer.to_json())
         self.manager_viewer_messages.append(self.manager.manager_viewer_message())
-        self.times[client_id] -= diff_time
+        player.time_left -= diff_time
+        player.time_used += diff_time
         return
 
 
@@ -346,34 +588,27 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
             self.error = ""
             self.logged_in = False
             self.is_unix_stream = is_unix_stream
-            self.buffer_small = b''
-            self.buffer_large = []
+            self.wire = WIRE_JSON
 
             super(ReceiveHandler, self).__init__(*args, **kwargs)
 
+        def setup(self):
+            self.reader = LineReader(self.request)
+
         def read_line(self):
-            while True:
-                if self.buffer_small:
-                    pos = self.buffer_small.find(b'\n')
-                    if pos != -1:
-                        ret = b''.join(self.buffer_large) + self.buffer_small[:pos]
-                        self.buffer_small = self.buffer_small[pos+1:]
-                        self.buffer_large = []
-                        return ret
-                    else:
-                        self.buffer_large.append(self.buffer_small)
-                self.buffer_small = self.request.recv(4096)
-                if not self.buffer_small:
-                    raise IOError("reached socket EOF before finding newline")
-
-        def get_next_message(self) -> object:
+            return self.reader.read_line()
+
+        def get_next_message(self, frame=False) -> object:
             '''
-            Returns the json loaded object of the next string that is sent over the
-            socket
+            Returns the next line that is sent over the socket, as bytes
+
+            Args:
+                frame: Return the line as a NUL terminated memoryview, valid
+                       until the next message, for the binding to parse in
+                       place
 
             Returns:
-                An object, for our purposes this will be a dictionary, of the json
-                loaded string
+                The bytes of the line, without the newline
             '''
 
             recv_socket = self.request
@@ -381,55 +616,38 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
 
             logging.debug("Client %s: Waiting for next message", self.client_id)
             try:
-                data = self.read_line()
+                if self.wire == WIRE_FRAMED:
+                    data = self.reader.read_framed()
+                elif frame:
+                    data = self.reader.read_frame()
+                else:
+                    data = self.read_line().strip()
             except (StopIteration, IOError):
                 print("{} has not sent message for {} seconds, assuming they're dead".format(
-                    self.game.get_player(self.client_id)['player'],
+                    self.game.get_player(self.client_id).player,
                     TIMEOUT
                 ))
                 recv_socket.close()
-                if bc.Team.Red == self.game.get_player(self.client_id)['player'].team:
-                    self.game.winner = 'player2'
-                elif bc.Team.Blue == self.game.get_player(self.client_id)['player'].team:
-                    self.game.winner = 'player1'
-                else:
-                    if self.game.connected_players[0] == self.game.connected_players[1]:
-                        print("Determining match by coin toss.")
-                        self.game.winner = 'player1' if random.random() > 0.5 else 'player2'
-                    else:
-                        self.game.winner = 'player1' if self.game.connected_players[0] > self.game.connected_players[1] else 'player2'
-                self.game.disconnected = True
-                self.game.game_over = True
+                self.game.forfeit(self.client_id)
                 raise TimeoutError()
             except KeyboardInterrupt:
                 recv_socket.close()
-                if bc.Team.Red == self.game.get_player(self.client_id)['player'].team:
-                    self.game.winner = 'player2'
-                elif bc.Team.Blue == self.game.get_player(self.client_id)['player'].team:
-                    self.game.winner = 'player1'
-                else:
-                    if self.game.connected_players[0] == self.game.connected_players[1]:
-                        print("Determining match by coin toss.")
-                        self.game.winner = 'player1' if random.random() > 0.5 else 'player2'
-                    else:
-                        self.game.winner = 'player1' if self.game.connected_players[0] > self.game.connected_players[1] else 'player2'
-                self.game.disconnected = True
-                self.game.game_over = True
+                self.game.forfeit(self.client_id)
                 raise KeyboardInterrupt()
 
-            data = data.decode("utf-8").strip()
             return data
             #unpacked_data = json.loads(data)
             #return unpacked_data
 
         def send_message(self, obj: object) -> None:
             '''
-            Sends newline delimited message to socket
-            The object desired to be sent will be converted to a json and then encoded
-            and sent.
+            Sends newline delimited message to socket, or a length prefixed
+            one to a player on the framed wire format
+            A str is encoded before it is sent, bytes are sent as they are and a
+            bytearray gets the newline appended in place.
 
             Args:
-                Obj: The object that wants to be serialized and sent over
+                Obj: The str or bytes that want to be sent over
 
             Returns:
                 None
@@ -437,11 +655,17 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
 
 
             send_socket = self.request
-            if isinstance(obj, bytes):
-                obj = obj.decode()
+            if self.wire == WIRE_FRAMED:
+                encoded_message = frame(obj)
+            else:
+                if isinstance(obj, str):
+                    obj = obj.encode()
 
-            message = obj + "\n"
-            encoded_message = message.encode()
+                if isinstance(obj, bytearray):
+                    obj += b"\n"
+                    encoded_message = obj
+                else:
+                    encoded_message = obj + b"\n"
             logging.debug("Client %s: Sending message %s", self.client_id,
                           encoded_message)
 
@@ -450,60 +674,46 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
             except IOError:
                 send_socket.close()
                 print("{} has not accepted message for {} seconds, assuming they're dead".format(
-                    [p for p in self.game.players if p['id'] == self.client_id][0]['player'],
+                    self.game.get_player(self.client_id).player,
                     TIMEOUT
                 ))
-                if bc.Team.Red == self.game.get_player(self.client_id)['player'].team:
-                    self.game.winner = 'player2'
-                elif bc.Team.Blue ==self.game.get_player(self.client_id)['player'].team:
-                    self.game.winner = 'player1'
-                else:
-                    if self.game.connected_players[0] == self.game.connected_players[1]:
-                        print("Determining match by coin toss.")
-                        self.game.winner = 'player1' if random.random() > 0.5 else 'player2'
-                    else:
-                        self.game.winner = 'player1' if self.game.connected_players[0] > self.game.connected_players[1] else 'player2'
-                self.game.disconnected = True
-                self.game.game_over = True
+                self.game.forfeit(self.client_id)
                 raise TimeoutError()
             except KeyboardInterrupt:
                 send_socket.close()
-                if bc.Team.Red == self.game.get_player(self.client_id)['player'].team:
-                    self.game.winner = 'player2'
-                elif bc.Team.Blue ==self.game.get_player(self.client_id)['player'].team:
-                    self.game.winner = 'player1'
-                else:
-                    if self.game.connected_players[0] == self.game.connected_players[1]:
-                        print("Determining match by coin toss.")
-                        self.game.winner = 'player1' if random.random() > 0.5 else 'player2'
-                    else:
-                        self.game.winner = 'player1' if self.game.connected_players[0] > self.game.connected_players[1] else 'player2'
-                self.game.disconnected = True
-                self.game.game_over = True
+                self.game.forfeit(self.client_id)
                 raise KeyboardInterrupt()
             return
 
-        def message(self, state_diff):
+        def message(self, state_diff, wire=None):
             '''
             Compress the current state into a message that will be sent to the
-            client
+            client. A StartTurnMessage is serialized straight into the message
+            buffer, without a str in between. The reply to a login tells the
+            player which wire format it gets from then on.
             '''
             if self.error == "":
                 error = "null"
             else:
                 self.docker.destroy()
 
-            if state_diff == "":
-                state_diff = '""'
-            if isinstance(state_diff, bytes):
-                state_diff = state_diff.decode()
-
             if self.logged_in:
                 logged_in = "true"
             else:
                 logged_in = "false"
 
-            message = '{{"logged_in":{},"client_id":"{}","error":{},"message":{}}}'.format(logged_in, self.client_id, error, state_diff)
+            # Leave room for the length of a framed message
+            message = bytearray(FRAME_HEADER.size if self.wire == WIRE_FRAMED else 0)
+            if wire is not None:
+                message += '{{"wire":"{}",'.format(wire).encode()
+            else:
+                message += b'{'
+            message += '"logged_in":{},"client_id":"{}","error":{},"message":'.format(logged_in, self.client_id, error).encode()
+            if isinstance(state_diff, str):
+                message += state_diff.encode() if state_diff else b'""'
+            else:
+                state_diff.write_json(message, len(message))
+            message += b'}'
             return message
 
         def player_handler(self):
@@ -533,26 +743,34 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
                     self.logged_in = True
                     self.client_id = verify_out
                     self.game.player_connected(self.client_id)
-                    self.game.get_player(self.client_id)['built_successfully'] = True
+                    self.game.get_player(self.client_id).built_successfully = True
 
-                log_success = self.message("")
+                # Only players that asked for another wire format are told,
+                # the reply to the others stays as it was
+                wire = wire_format(unpacked_data) if self.logged_in else WIRE_JSON
+                log_success = self.message("", wire if wire != WIRE_JSON else None)
 
                 self.send_message(log_success)
 
+            # Switch to the wire format the player asked for, after the reply
+            # to its login went out as a line
+            if self.logged_in:
+                self.wire = wire
+
             if self.game.game_over:
                 return
 
             logging.debug("Client %s: Spinning waiting for game to start",
                           self.client_id)
 
-            while not self.game.started and not self.game.game_over:
-                # Spin while waiting for game to start
-                time.sleep(0.05)
+            self.game.wait_for_start()
 
             logging.info("Client %s: Game started", self.client_id)
 
             my_sandbox = dockers[self.client_id]
-            running_stats = self.game.get_player(self.client_id)['running_stats']
+            # Every turn only touches the state of this player
+            me = self.game.get_player(self.client_id)
+            running_stats = me.running_stats
 
             # average time used, in seconds
             atu = 0
@@ -575,7 +793,7 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
                 if self.game.initialized > 3:
                     start_turn_msg = self.message(self.game.last_message)
                 else:
-                    state_diff = self.game.players[self.game.current_player_index]['start_message']
+                    state_diff = me.start_message
                     start_turn_msg = self.message(state_diff)
                     running_stats["lng"] = my_sandbox.guess_language()
                     running_stats["bld"] = False
@@ -587,13 +805,13 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
                     self.game.end_turn()
                     continue
 
-                if self.game.times[self.client_id] > 0:
+                if me.time_left > 0:
                     my_sandbox.unpause()
 
                     start_time = time.perf_counter()
                     start_time_python = time.process_time()
                     self.send_message(start_turn_msg)
-                    data = self.get_next_message()
+                    data = self.get_next_message(frame=True)
                     end_time_python = time.process_time()
                     end_time = time.perf_counter()
 
@@ -602,24 +820,13 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
                     my_sandbox.pause()
 
                     try:
-                        sent_message = bc.SentMessage.from_json(data)
+                        sent_message = bc.SentMessage.from_json_bytes(data)
                     except Exception as e:
                         print("Error deserializing JSON")
                         print(e)
                         print("Killing player...")
 
-                        if bc.Team.Red == self.game.get_player(self.client_id)['player'].team:
-                            self.game.winner = 'player2'
-                        elif bc.Team.Blue ==self.game.get_player(self.client_id)['player'].team:
-                            self.game.winner = 'player1'
-                        else:
-                            if self.game.connected_players[0] == self.game.connected_players[1]:
-                                print("Determining match by coin toss.")
-                                self.game.winner = 'player1' if random.random() > 0.5 else 'player2'
-                            else:
-                                self.game.winner = 'player1' if self.game.connected_players[0] > self.game.connected_players[1] else 'player2'
-                        self.game.disconnected = True
-                        self.game.game_over = True
+                        self.game.forfeit(self.client_id)
 
 
                     assert int(sent_message.client_id) == self.client_id, \
@@ -629,7 +836,7 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
                 else:
                     if not TIMEDOUTLOG:
                         TIMEDOUTLOG = True
-                        self.game.players[self.game.current_player_index]['logger'](b'PLAYER HAS TIMED OUT!!!')
+                        me.logger(b'PLAYER HAS TIMED OUT!!!')
                     # 1 second; never let them play again
                     diff_time = 1
                     turn_message = bc.TurnMessage.from_json('{"changes":[]}')
@@ -637,7 +844,7 @@ def create_receive_handler(game: Game, dockers, use_docker: bool,
                 atu = atu * .9 + diff_time * .1
 
                 # convert to ms
-                running_stats["tl"] = int(self.game.times[self.client_id] * 1000)
+                running_stats["tl"] = int(me.time_left * 1000)
                 running_stats["atu"] = int(atu * 1000)
 
                 self.game.make_action(turn_message, self.client_id, diff_time)
@@ -693,11 +900,12 @@ def start_server(sock_file: str, game: Game, dockers, use_docker=True) -> socket
         server = socketserver.ThreadingUnixStreamServer(sock_file, receive_handler)
 
     def wait_for_connections():
-        time.sleep(BUILD_TIMEOUT)
+        if game.wait_for_game_over(BUILD_TIMEOUT):
+            return
         for player in game.players:
-            if not player['built_successfully']:
-                print('Player failed to connect to manager after',BUILD_TIMEOUT,'seconds:', player['player'])
-                if bc.Team.Red == player['player'].team:
+            if not player.built_successfully:
+                print('Player failed to connect to manager after',BUILD_TIMEOUT,'seconds:', player.player)
+                if bc.Team.Red == player.player.team:
                     game.winner = 'player2'
                 else:
                     game.winner = 'player1'
@@ -727,6 +935,9 @@ def start_viewer_server(port: int, game: Game) -> socketserver.BaseServer:
                         the appropriate time
     '''
 
+    # A viewer connecting later needs every message from the first one
+    game.viewer_messages.spill_to_disk()
+
     # Create handler for mangaing each connections to server
     receive_handler = create_receive_handler(game, {}, False, False)
 
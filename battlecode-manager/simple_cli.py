@@ -19,7 +19,7 @@ replay_extension = ".bc18"
 color_red = "\033[31m"
 color_reset = "\033[0m"
 
-def run_game(map_path, player1dir, player2dir, replay_dir, docker, terminal_viewer, extra_delay, max_memory, initial_time, per_frame_time, proxy_test):
+def run_game(map_path, player1dir, player2dir, replay_dir, docker, terminal_viewer, extra_delay, max_memory, initial_time, per_frame_time, proxy_test, async_server=False):
     args = {}
     args['dir_p1'] = player1dir
     args['dir_p2'] = player2dir
@@ -33,6 +33,7 @@ def run_game(map_path, player1dir, player2dir, replay_dir, docker, terminal_view
     args['use_viewer'] = False
     args['terminal_viewer'] = terminal_viewer
     args['extra_delay'] = extra_delay
+    args['async_server'] = async_server
     args['map_name'] = map_path
     args['map'] = cli.get_map(map_path)
 
@@ -82,6 +83,7 @@ parser.add_argument('--docker', action='store_const', const=True, default=False,
 parser.add_argument('--unlimited-time', action='store_const', const=True, default=False, help='Allow players to use an unlimited amount of time')
 parser.add_argument('-tv', '--terminal-viewer', action='store_const', const=True, default=False, help="Print game images in the terminal.")
 parser.add_argument('-ed', '--extra-delay', type=int, default=0, help="add extra delay after each turn (make -tv slower)")
+parser.add_argument('--async-server', action='store_true', help="Serve the players from one asyncio event loop instead of a thread per connection")
 parser.add_argument('--proxy-test', action='store_true', help="do some useless nonsense")
 
 args = parser.parse_args()
@@ -155,7 +157,8 @@ try:
         max_memory=args.mem,
         initial_time=initial_time,
         per_frame_time=per_frame_time,
-        proxy_test=args.proxy_test
+        proxy_test=args.proxy_test,
+        async_server=args.async_server
     )
 except KeyboardInterrupt:
     print("Game Stopped")
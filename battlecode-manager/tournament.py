@@ -0,0 +1,286 @@
+'''
+Plays every pair of players against each other on a pool of maps, on both
+sides of the map, with several games running at once in a pool of processes.
+Prints and writes a summary of the win rates, the average number of rounds
+and the time every player used.
+'''
+
+import os
+import argparse
+import itertools
+import multiprocessing
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import battlecode_cli as cli
+import match_runner
+import server
+
+map_extension = ".bc18map"
+map_extension_text = ".bc18t"
+replay_extension = ".bc18"
+
+file_dir = os.path.dirname(os.path.realpath(__file__))
+map_directory = os.path.abspath(file_dir + '/../battlecode-maps')
+
+# The slot of the worker process, so games running at the same time never
+# share a working directory or a port
+_slot = None
+
+
+def _init_worker(counter, working_dir):
+    global _slot
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    _slot = match_runner.Slot(index, working_dir, None)
+
+
+def get_maps(map_directory):
+    return sorted(o for o in os.listdir(map_directory) if o.endswith(map_extension) or o.endswith(map_extension_text))
+
+
+def map_name(map_file):
+    return os.path.basename(map_file).replace(map_extension, "").replace(map_extension_text, "")
+
+
+def player_name(player_dir):
+    return os.path.basename(os.path.normpath(player_dir))
+
+
+def make_jobs(players, maps, swap=True):
+    '''
+    Every (player 1, player 2, map) game to play, with player 1 on the red
+    side. With swap, every pairing also plays with the sides swapped.
+    '''
+    jobs = []
+    for player_a, player_b in itertools.combinations(players, 2):
+        for map_file in maps:
+            jobs.append((player_a, player_b, map_file))
+            if swap:
+                jobs.append((player_b, player_a, map_file))
+    return jobs
+
+
+def play(job_index, player1dir, player2dir, map_file, settings):
+    '''
+    Plays one game in the slot of the worker process. Returns the result, as a
+    dict that pickles back to the main process.
+    '''
+    result = {
+        'player1': player1dir,
+        'player2': player2dir,
+        'map': map_name(map_file),
+        'winner': None,
+        'rounds': 0,
+        'time_used': {player1dir: 0., player2dir: 0.},
+        'error': None
+    }
+
+    args = {}
+    args['dir_p1'] = player1dir
+    args['dir_p2'] = player2dir
+    args['docker'] = settings['docker']
+    if settings['replay_dir'] is None:
+        args['replay_filename'] = None
+    else:
+        args['replay_filename'] = os.path.join(settings['replay_dir'], "replay_{}{}".format(job_index, replay_extension))
+    args['player_memory'] = settings['mem']
+    args['player_cpu'] = 20
+    args['time_pool'] = settings['initial_time']
+    args['time_additional'] = settings['per_frame_time']
+    args['use_viewer'] = False
+    args['terminal_viewer'] = False
+    args['print_logs'] = settings['print_logs']
+    args['extra_delay'] = 0
+    args['async_server'] = settings['async_server']
+    args['map_name'] = map_file
+    args['map'] = cli.get_map(map_file)
+    _slot.apply(args)
+
+    try:
+        (game, sandboxes, sock_file) = cli.create_game(args)
+        try:
+            winner = cli.run_game(game, sandboxes, args, sock_file)
+        finally:
+            cli.cleanup(sandboxes, args, sock_file)
+    except Exception:
+        result['error'] = traceback.format_exc()
+        return result
+
+    result['winner'] = player1dir if winner == 'player1' else player2dir
+    result['rounds'] = game.manager.round()
+    # Players 0 and 2 are the red team, on earth and mars
+    for index, player in enumerate(game.players):
+        player_dir = player1dir if index % 2 == 0 else player2dir
+        result['time_used'][player_dir] += player.time_used
+    return result
+
+
+class Summary(object):
+    '''
+    The totals of every player, and of every pairing of players.
+    '''
+
+    def __init__(self, players):
+        self.players = players
+        self.games = {player: 0 for player in players}
+        self.wins = {player: 0 for player in players}
+        self.rounds = {player: 0 for player in players}
+        self.time_used = {player: 0. for player in players}
+        self.pair_games = {}
+        self.pair_wins = {}
+        self.errors = []
+
+    def add(self, result):
+        if result['error'] is not None:
+            self.errors.append(result)
+            return
+        for player in (result['player1'], result['player2']):
+            self.games[player] += 1
+            self.rounds[player] += result['rounds']
+            self.time_used[player] += result['time_used'][player]
+            if result['winner'] == player:
+                self.wins[player] += 1
+            opponent = result['player2'] if player == result['player1'] else result['player1']
+            self.pair_games[player, opponent] = self.pair_games.get((player, opponent), 0) + 1
+            if result['winner'] == player:
+                self.pair_wins[player, opponent] = self.pair_wins.get((player, opponent), 0) + 1
+
+    def table(self):
+        '''
+        The summary as a text table.
+        '''
+        width = max(len(player_name(player)) for player in self.players) + 2
+        lines = []
+        lines.append('{:<{w}}{:>7}{:>7}{:>9}{:>12}{:>14}'.format(
+            'player', 'games', 'wins', 'win %', 'avg rounds', 'avg time (s)', w=width))
+        for player in sorted(self.players, key=lambda p: -self.wins[p]):
+            games = self.games[player]
+            lines.append('{:<{w}}{:>7}{:>7}{:>9.1f}{:>12.1f}{:>14.2f}'.format(
+                player_name(player), games, self.wins[player],
+                100. * self.wins[player] / games if games else 0.,
+                self.rounds[player] / games if games else 0.,
+                self.time_used[player] / games if games else 0., w=width))
+
+        lines.append('')
+        lines.append('win % of the row against the column')
+        lines.append(' ' * width + ''.join('{:>{w}}'.format(player_name(player), w=width) for player in self.players))
+        for player in self.players:
+            row = '{:<{w}}'.format(player_name(player), w=width)
+            for opponent in self.players:
+                games = self.pair_games.get((player, opponent), 0)
+                if games == 0:
+                    row += '{:>{w}}'.format('-', w=width)
+                else:
+                    row += '{:>{w}.1f}'.format(100. * self.pair_wins.get((player, opponent), 0) / games, w=width)
+            lines.append(row)
+
+        if self.errors:
+            lines.append('')
+            lines.append('{} games failed to run'.format(len(self.errors)))
+        return '\n'.join(lines) + '\n'
+
+
+def run_tournament(players, maps, settings, workers=None, swap=True, working_dir='working_dir'):
+    '''
+    Plays all the games of the tournament and returns its Summary.
+    '''
+    workers = workers or match_runner.default_slots()
+    # Build the binding bytecode once, instead of in every worker at once
+    cli.compile_binding(os.path.join(file_dir, '..', 'battlecode'))
+
+    jobs = make_jobs(players, maps, swap)
+    summary = Summary(players)
+    counter = multiprocessing.Value('i', 0)
+    print('Playing {} games, {} at a time'.format(len(jobs), workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(counter, os.path.abspath(working_dir))) as executor:
+        futures = [executor.submit(play, index, player1dir, player2dir, map_file, settings)
+                   for index, (player1dir, player2dir, map_file) in enumerate(jobs)]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            summary.add(result)
+            if result['error'] is not None:
+                outcome = 'failed:\n' + result['error']
+            else:
+                outcome = '{} won in {} rounds'.format(player_name(result['winner']), result['rounds'])
+            print('[{}/{}] {} vs {} on {}: {}'.format(
+                done, len(jobs), player_name(result['player1']), player_name(result['player2']),
+                result['map'], outcome))
+    return summary
+
+
+def find_map(name):
+    if os.path.isfile(name):
+        return os.path.abspath(name)
+    for ext in (map_extension, map_extension_text):
+        t = os.path.join(map_directory, name + ext)
+        if os.path.isfile(t):
+            return t
+    return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        "tournament.py",
+        description='Play BattleCode 2018 players against each other on many maps'
+    )
+    parser.add_argument('-p', '--player', action='append', required=True, help="Path to the directory of a player. Pass at least two")
+    parser.add_argument('-m', '--map', action='append', help="A map to play on. Plays on every map in battlecode-maps by default")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="Number of games to run at once. (default: one per {} cores)".format(server.NUM_PLAYERS))
+    parser.add_argument('--no-swap', action='store_true', help="Play every pairing on one side of the map only")
+    parser.add_argument('--summary', default='tournament.txt', help="File to write the summary table to. (default: %(default)s)")
+    parser.add_argument('--replay-dir', default=None, help="Directory to save replays to. Replays are not saved by default")
+    parser.add_argument('--mem', type=int, help='Memory in megabytes that a player is allowed to use. (default: %(default)s)', default=256)
+    parser.add_argument('--docker', action='store_true', help="Use Docker to run the games")
+    parser.add_argument('--unlimited-time', action='store_true', help='Allow players to use an unlimited amount of time')
+    parser.add_argument('--print-logs', action='store_true', help="Print the output of the players")
+    parser.add_argument('--async-server', action='store_true', help="Serve the players from one asyncio event loop instead of a thread per connection")
+    args = parser.parse_args()
+
+    players = [os.path.abspath(player) for player in args.player]
+    if len(set(players)) < 2:
+        print("Pass at least two different players")
+        exit(1)
+    for player in players:
+        if not os.path.exists(os.path.join(player, "run.sh")):
+            print("The player directory '" + player + "' does not contain a run.sh file")
+            exit(1)
+
+    if args.map:
+        maps = []
+        for name in args.map:
+            map_file = find_map(name)
+            if map_file is None:
+                print("Could not find any map named " + name)
+                exit(1)
+            maps.append(map_file)
+    else:
+        maps = [os.path.join(map_directory, map_file) for map_file in get_maps(map_directory)]
+
+    replay_dir = None
+    if args.replay_dir is not None:
+        replay_dir = os.path.abspath(args.replay_dir)
+        os.makedirs(replay_dir, exist_ok=True)
+
+    settings = {
+        'docker': args.docker,
+        'replay_dir': replay_dir,
+        'mem': args.mem,
+        'initial_time': 1000000000 if args.unlimited_time else 10 * 1000,
+        'per_frame_time': 50,
+        'print_logs': args.print_logs,
+        'async_server': args.async_server
+    }
+
+    try:
+        summary = run_tournament(players, maps, settings, workers=args.jobs, swap=not args.no_swap)
+    except KeyboardInterrupt:
+        print("Tournament Stopped")
+        exit(0)
+
+    table = summary.table()
+    print(table)
+    with open(args.summary, 'w') as f:
+        f.write(table)
+    print("Saved summary to", args.summary)
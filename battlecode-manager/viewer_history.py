@@ -0,0 +1,139 @@
+'''
+The history of the manager viewer messages of a game, the state of both maps
+that the GUI draws. Instead of a JSON snapshot for every turn it keeps a
+keyframe every KEYFRAME_INTERVAL turns and only the changes of the turns in
+between, with a cache of the last turns it decoded. Scrubbing through the
+game then applies one delta to a cached turn, instead of parsing both maps.
+'''
+
+import collections
+import threading
+try:
+    import ujson as json
+except:
+    import json
+
+# Turns between two keyframes, so decoding a turn never applies more deltas
+KEYFRAME_INTERVAL = 50
+# Decoded turns to keep
+CACHE_SIZE = 64
+# Lists are compared in chunks of this many values, so the unchanged parts of
+# a map are skipped by one slice comparison
+CHUNK = 64
+
+
+def diff(old, new):
+    '''
+    Returns the changes from one state to the next, as the values that
+    changed and the (index, value) pairs that changed in every list. Returns
+    None when the states do not have the same keys.
+    '''
+    if old.keys() != new.keys():
+        return None
+    values = {}
+    lists = {}
+    for key, value in new.items():
+        old_value = old[key]
+        if isinstance(value, list) and isinstance(old_value, list) and len(value) == len(old_value):
+            if value == old_value:
+                continue
+            changes = []
+            for start in range(0, len(value), CHUNK):
+                end = start + CHUNK
+                if value[start:end] == old_value[start:end]:
+                    continue
+                for index in range(start, min(end, len(value))):
+                    if value[index] != old_value[index]:
+                        changes.append(index)
+                        changes.append(value[index])
+            lists[key] = changes
+        elif value != old_value:
+            values[key] = value
+    return values, lists
+
+
+def apply(state, deltas):
+    '''
+    Returns the state after the changes of every delta. The lists that change
+    are copied once, so the old state stays as it was.
+    '''
+    state = dict(state)
+    copied = set()
+    for values, lists in deltas:
+        state.update(values)
+        # A replaced value is the one stored in the delta, so it is copied
+        # again before it changes
+        copied.difference_update(values)
+        for key, changes in lists.items():
+            if key not in copied:
+                state[key] = list(state[key])
+                copied.add(key)
+            value = state[key]
+            for i in range(0, len(changes), 2):
+                value[changes[i]] = changes[i + 1]
+    return state
+
+
+class ViewerHistory(object):
+    '''
+    The manager viewer message of every turn, indexed like the list it
+    replaces. Turns come back as decoded dicts, shared with the cache, so
+    they must not be changed.
+    '''
+
+    def __init__(self, keyframe_interval=KEYFRAME_INTERVAL, cache_size=CACHE_SIZE):
+        self.keyframe_interval = keyframe_interval
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+        # The JSON of a keyframe, or the delta from the turn before
+        self.entries = []
+        self.latest = None
+        self.cache = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def append(self, message):
+        '''
+        Adds the JSON manager viewer message of the next turn.
+        '''
+        state = json.loads(message)
+        with self.lock:
+            delta = None
+            if len(self.entries) % self.keyframe_interval != 0:
+                delta = diff(self.latest, state)
+            self.entries.append(message if delta is None else delta)
+            self.latest = state
+
+    def __getitem__(self, turn):
+        with self.lock:
+            if turn < 0:
+                turn += len(self.entries)
+            if not 0 <= turn < len(self.entries):
+                raise IndexError("turn out of range")
+            if turn == len(self.entries) - 1:
+                return self.latest
+            state = self.cache.get(turn)
+            if state is not None:
+                self.cache.move_to_end(turn)
+                return state
+
+            # Start from the closest decoded turn or keyframe before it
+            start = turn
+            while start not in self.cache and not isinstance(self.entries[start], str):
+                start -= 1
+            if start in self.cache:
+                state = self.cache[start]
+            else:
+                # Keep the keyframe too, for the turns around it
+                state = json.loads(self.entries[start])
+                self._remember(start, state)
+            state = apply(state, self.entries[start + 1:turn + 1])
+            self._remember(turn, state)
+            return state
+
+    def _remember(self, turn, state):
+        self.cache[turn] = state
+        self.cache.move_to_end(turn)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
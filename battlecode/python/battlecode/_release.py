@@ -0,0 +1,159 @@
+"""Builds the release variant of the binding from _binding.py.
+
+The release variant drops the argument type asserts and the _check_errors()
+calls of the queries that return plain values: the is_*/can_* checks,
+karbonite and karbonite_at, round, get_time_left_ms, research_info counts
+and the like. Such a query returns 0 or False when it fails, and its error
+stays pending in the native library.
+
+Checks are kept where a failed call would hand back a NULL pointer or
+string, in next_turn, and in every action that changes the game
+(ACTION_CALLS). A pending error is raised by the next of these checks, so
+it surfaces lazily, at the latest when the turn ends, instead of being lost.
+The checks are the same single bc_has_err call as in the debug binding.
+
+The compiled release variant is cached in __pycache__ next to the binding,
+so players only pay for the transform when the binding or this file change.
+"""
+
+import ast
+import marshal
+import os
+import sys
+import tempfile
+import types
+
+# Actions that change the game. They raise their own errors, like in the
+# debug binding, as a failed action is a bug in the player.
+ACTION_CALLS = {
+    'move_robot', 'attack', 'harvest', 'blueprint', 'build', 'repair',
+    'replicate', 'javelin', 'begin_snipe', 'blink', 'heal', 'overcharge',
+    'load', 'unload', 'produce_robot', 'launch_rocket', 'disintegrate_unit',
+    'queue_research', 'reset_research', 'write_team_array'
+}
+
+# Functions that always check for errors, whatever they return. write_json
+# hands the native string to _write_json, which cannot take a NULL.
+# _check_errors is the check itself.
+ALWAYS_CHECKED = {'next_turn', '_check_errors', 'write_json'} | ACTION_CALLS
+
+
+def _is_check_errors(statement):
+    return (isinstance(statement, ast.Expr)
+            and isinstance(statement.value, ast.Call)
+            and isinstance(statement.value.func, ast.Name)
+            and statement.value.func.id == '_check_errors')
+
+
+def _uses_pointer_result(function):
+    """Whether a function wraps a pointer or string returned by the native
+    library, which is NULL when the call failed.
+    """
+    for node in ast.walk(function):
+        if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+                and node.value.id == '_ffi' and node.attr in ('NULL', 'string')):
+            return True
+    return False
+
+
+class _ReleaseTransformer(ast.NodeTransformer):
+    def visit_Assert(self, node):
+        return None
+
+    def visit_FunctionDef(self, node):
+        self.generic_visit(node)
+        if node.name in ALWAYS_CHECKED or _uses_pointer_result(node):
+            return node
+        for statement in ast.walk(node):
+            for field in ('body', 'orelse'):
+                body = getattr(statement, field, None)
+                if isinstance(body, list) and any(_is_check_errors(child) for child in body):
+                    body[:] = [child for child in body if not _is_check_errors(child)] or [ast.Pass()]
+        return node
+
+
+def source_path():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), '_binding.py')
+
+
+def cache_path():
+    return os.path.join(os.path.dirname(source_path()), '__pycache__',
+                        '_binding_release.{}.bin'.format(sys.implementation.cache_tag))
+
+
+def _cache_key():
+    # The cache is stale when the binding or the transform change. copytree
+    # keeps modification times, so a copied cache stays valid.
+    key = [sys.implementation.cache_tag]
+    for path in (source_path(), os.path.abspath(__file__)):
+        stat = os.stat(path)
+        key.append('{}:{}'.format(stat.st_size, stat.st_mtime_ns))
+    return ' '.join(key).encode() + b'\n'
+
+
+def _read_cache():
+    try:
+        with open(cache_path(), 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    key = _cache_key()
+    if not data.startswith(key):
+        return None
+    try:
+        return marshal.loads(data[len(key):])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def write_cache():
+    """Builds the release variant and writes it to the cache, unless the cache
+    is up to date. Returns the compiled code.
+    """
+    code = _read_cache()
+    if code is not None:
+        return code
+    code = build()
+    path = cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first, so players starting at the same
+        # time never read half a cache, and games preparing their working
+        # directories at the same time never write to the same file
+        fd, temporary = tempfile.mkstemp(prefix=os.path.basename(path) + '.', dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_cache_key())
+            f.write(marshal.dumps(code))
+        # mkstemp makes the file private, but sandboxed players run as other users
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except OSError:
+        # A read-only tree just rebuilds the variant every time
+        pass
+    return code
+
+
+def build():
+    """Returns the compiled code of the release variant of the binding."""
+    path = source_path()
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    tree = ast.fix_missing_locations(_ReleaseTransformer().visit(tree))
+    return compile(tree, path, 'exec')
+
+
+def load():
+    """Builds and imports the release variant of the binding as
+    battlecode._binding_release.
+    """
+    name = __package__ + '._binding_release'
+    module = types.ModuleType(name)
+    module.__file__ = source_path()
+    module.__package__ = __package__
+    sys.modules[name] = module
+    exec(write_cache(), module.__dict__)
+    return module
+
+
+if __name__ == '__main__':
+    write_cache()